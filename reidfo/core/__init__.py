@@ -1,4 +1,5 @@
 from .data_splitting import DataSplitting
+from .dtypes import LABEL_DTYPE, get_float_dtype, set_float_dtype, float_dtype
 from .plot.util import *
 from .plot import plot_prodret, plot_time_series, plot_regimes
 
@@ -1,5 +1,6 @@
 import datetime as dt
-from typing import Dict, Hashable, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
 from .validation_utils import check_df_for_nans
@@ -71,3 +72,51 @@ class DataSplitting:
         idx_train: int = columns.index(train)
         idx_val: int = columns.index(val)
         return [series.iloc[:idx_train], series.iloc[idx_train:idx_val], series.iloc[idx_val:]]
+
+    def walk_forward(self,
+                     freq: str = "ME",
+                     min_train: int = 1,
+                     window: Optional[int] = None) -> List[Tuple[slice, slice]]:
+        """
+        Walk-forward fold schedule of the data, see ``walk_forward_schedule``.
+
+        :param freq: Pandas offset alias of the refit frequency, e.g. ``"ME"`` for monthly.
+        :param min_train: Minimum number of training rows of the first fold.
+        :param window: Optional length of a rolling training window.
+        :return: List of ``(train, test)`` positional slices into the data, in time order.
+        """
+        return self.walk_forward_schedule(self.data.index, freq, min_train, window)
+
+    @staticmethod
+    def walk_forward_schedule(index: pd.Index,
+                              freq: str = "ME",
+                              min_train: int = 1,
+                              window: Optional[int] = None) -> List[Tuple[slice, slice]]:
+        """
+        Walk-forward fold schedule with one refit per period of ``freq``, computed from the index alone.
+
+        A model is refitted at the first observation of every period once ``min_train`` rows
+        precede it, and is used until the next refit. Training windows expand from the first
+        row, or roll over the last ``window`` rows.
+
+        :param index: Time index of the data.
+        :param freq: Pandas offset alias of the refit frequency, e.g. ``"ME"`` for monthly.
+        :param min_train: Minimum number of training rows of the first fold.
+        :param window: Optional length of a rolling training window.
+        :return: List of ``(train, test)`` positional slices into the data, in time order.
+        :raises ValueError: If the index is not a DatetimeIndex or a length is not positive.
+        """
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError("walk_forward requires a DatetimeIndex.")
+        if min_train < 1 or (window is not None and window < min_train):
+            raise ValueError("min_train must be positive and window at least min_train.")
+
+        # Position of the first observation of every period.
+        starts = pd.Series(np.arange(len(index)), index=index).resample(freq).min().dropna()
+        starts = starts.to_numpy(dtype=np.int64)
+        starts = starts[starts >= min_train]
+        stops = np.r_[starts[1:], len(index)]
+        return [
+            (slice(0 if window is None else max(0, start - window), start), slice(start, stop))
+            for start, stop in zip(starts.tolist(), stops.tolist())
+        ]
@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+LABEL_DTYPE = np.dtype(np.int8)
+
+_FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+_float_dtype = np.dtype(np.float64)
+
+
+def get_float_dtype() -> np.dtype:
+    """
+    :return: Floating dtype of feature matrices, series and model inputs.
+    """
+    return _float_dtype
+
+
+def set_float_dtype(dtype) -> None:
+    """
+    Set the package-wide floating dtype.
+
+    Collectors, preprocessing transforms, ``TimeSeriesData`` and the regime and forecasting
+    models store their floating data in this dtype. Intermediate statistics (prefix sums,
+    running moments) are still accumulated in float64 and only their results are cast.
+
+    :param dtype: ``np.float32`` or ``np.float64`` (the default).
+    :raises ValueError: If ``dtype`` is not float32 or float64.
+    """
+    global _float_dtype
+    dtype = np.dtype(dtype)
+    if dtype not in _FLOAT_DTYPES:
+        raise ValueError("dtype must be float32 or float64.")
+    _float_dtype = dtype
+
+
+@contextmanager
+def float_dtype(dtype) -> Iterator[np.dtype]:
+    """
+    Temporarily set the package-wide floating dtype.
+
+    :param dtype: ``np.float32`` or ``np.float64``.
+    """
+    previous = get_float_dtype()
+    set_float_dtype(dtype)
+    try:
+        yield get_float_dtype()
+    finally:
+        set_float_dtype(previous)
+
+
+def as_float(obj: pd.Series | pd.DataFrame | np.ndarray,
+             copy: bool = False) -> pd.Series | pd.DataFrame | np.ndarray:
+    """
+    Cast the floating columns of ``obj`` to the package-wide dtype. Integer, boolean and other
+    columns are left unchanged.
+
+    :param obj: Series, DataFrame or array.
+    :param copy: If True, always return a new object; otherwise ``obj`` itself is returned when
+        no cast is needed.
+    :return: Object of the same type.
+    """
+    dtype = get_float_dtype()
+    if isinstance(obj, pd.DataFrame):
+        columns = [column for column, col_dtype in obj.dtypes.items()
+                   if pd.api.types.is_float_dtype(col_dtype) and col_dtype != dtype]
+        if not columns:
+            return obj.copy() if copy else obj
+        if len(columns) == obj.shape[1]:
+            return obj.astype(dtype)
+        return obj.astype({column: dtype for column in columns})
+    if isinstance(obj, pd.Series):
+        if pd.api.types.is_float_dtype(obj.dtype) and obj.dtype != dtype:
+            return obj.astype(dtype)
+        return obj.copy() if copy else obj
+    obj = np.asarray(obj)
+    if obj.dtype.kind == "f":
+        return obj.astype(dtype, copy=copy)
+    return obj.copy() if copy else obj
+
+
+def as_labels(labels: pd.Series | np.ndarray) -> pd.Series | np.ndarray:
+    """
+    Store integer regime labels compactly as ``int8``. Labels of other dtypes, or outside the
+    ``int8`` range, are returned unchanged.
+
+    :param labels: Series or array of labels.
+    :return: Object of the same type.
+    """
+    values = np.asarray(labels)
+    if values.dtype.kind not in "iu" or values.dtype == LABEL_DTYPE:
+        return labels
+    info = np.iinfo(LABEL_DTYPE)
+    if values.size and (values.min() < info.min or values.max() > info.max):
+        return labels
+    return labels.astype(LABEL_DTYPE)
@@ -1,7 +1,12 @@
+import copy
 import datetime as dt
+from abc import ABC, abstractmethod
+from typing import Optional
 
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
+
+from .dtypes import get_float_dtype
 
 
 def filter_date_range(
@@ -22,6 +27,170 @@ def filter_date_range(
     return obj.loc[start_date:end_date]
 
 
+class RunningMoments:
+    def __init__(self):
+        """
+        Per-column count, mean and sum of squared deviations, accumulated over chunks with
+        Chan's parallel update so the full history never has to be in memory. NaNs are ignored.
+        """
+        self.columns: Optional[pd.Index] = None
+        self.count: Optional[np.ndarray] = None
+        self.mean: Optional[np.ndarray] = None
+        self.m2: Optional[np.ndarray] = None
+
+    @property
+    def fitted(self) -> bool:
+        return self.columns is not None
+
+    def reset(self) -> None:
+        self.columns = self.count = self.mean = self.m2 = None
+
+    def partial_fit(self, df: pd.DataFrame) -> "RunningMoments":
+        """
+        :param df: Chunk of rows with the same columns as previous chunks.
+        :return: This object.
+        """
+        values = df.to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(float)
+        filled = np.where(valid, values, 0.0)
+        mean = np.divide(filled.sum(axis=0), count, out=np.zeros(values.shape[1]), where=count > 0)
+        m2 = (np.where(valid, values - mean, 0.0) ** 2).sum(axis=0)
+
+        if not self.fitted:
+            self.columns, self.count, self.mean, self.m2 = df.columns, count, mean, m2
+            return self
+        self.check_columns(df)
+        total = self.count + count
+        delta = mean - self.mean
+        ratio = np.divide(count, total, out=np.zeros_like(total), where=total > 0)
+        self.mean = self.mean + delta * ratio
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * ratio
+        self.count = total
+        return self
+
+    def check_columns(self, df: pd.DataFrame) -> None:
+        if not self.fitted:
+            raise ValueError("Transform must be fitted first.")
+        if not self.columns.equals(df.columns):
+            raise ValueError("Columns must match the columns seen during fitting.")
+
+    def std(self) -> np.ndarray:
+        """
+        :return: Population (``ddof=0``) standard deviation per column; NaN for empty columns.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.sqrt(self.m2 / self.count)
+
+
+class _FittedTransform(ABC):
+    def __init__(self):
+        self.moments = RunningMoments()
+
+    @property
+    def fitted(self) -> bool:
+        return self.moments.fitted
+
+    def fit(self, df: pd.DataFrame) -> "_FittedTransform":
+        """
+        Estimate the transform parameters on a training window, discarding previous state.
+
+        :param df: Training feature matrix.
+        :return: This object.
+        """
+        self.moments.reset()
+        return self.partial_fit(df)
+
+    def partial_fit(self, df: pd.DataFrame) -> "_FittedTransform":
+        """
+        Update the transform parameters with another chunk of training rows.
+
+        :param df: Chunk of the training feature matrix.
+        :return: This object.
+        """
+        self.moments.partial_fit(df)
+        return self
+
+    @abstractmethod
+    def transform_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Apply the fitted transform to a float array in place.
+
+        :param values: 2-D array with the fitted columns in the same order.
+        :return: ``values``, modified in place.
+        """
+        pass
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the fitted transform. Statistics are kept in float64; the output has the
+        package-wide float dtype.
+
+        :param df: Feature matrix with the fitted columns.
+        :return: Transformed copy of ``df``.
+        """
+        self.moments.check_columns(df)
+        values = self.transform_array(df.to_numpy(dtype=get_float_dtype(), copy=True))
+        return pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
+
+    def __call__(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transform ``df`` so an instance can be passed as ``FeatureEngineer`` clipper or scaler.
+        A fitted transform is applied as is. An unfitted one is fitted on ``df`` through a copy,
+        like ``clip_by_std`` and ``standard_scale``, and stays unfitted, so no state leaks from
+        one call (or column) into the next. Call ``fit`` to reuse training statistics.
+        """
+        if self.fitted:
+            return self.transform(df)
+        return copy.deepcopy(self).fit(df).transform(df)
+
+
+class ClipByStd(_FittedTransform):
+    def __init__(self, mul: float = 3.0):
+        """
+        Fitted counterpart of ``clip_by_std``: clipping bounds are estimated once and reused.
+
+        :param mul: Standard deviation multiplier for clipping bounds.
+        """
+        super().__init__()
+        self.mul = mul
+
+    def bounds(self) -> tuple:
+        """
+        :return: Lower and upper clipping bound per column.
+        """
+        std = self.moments.std()
+        return self.moments.mean - self.mul * std, self.moments.mean + self.mul * std
+
+    def transform_array(self, values: np.ndarray) -> np.ndarray:
+        lower, upper = self.bounds()
+        return np.clip(values, lower, upper, out=values)
+
+
+class StandardScale(_FittedTransform):
+    """
+    Fitted counterpart of ``standard_scale``: means and scales are estimated once and reused.
+    Constant columns are only centered.
+    """
+
+    def scale(self) -> np.ndarray:
+        """
+        :return: Divisor per column.
+        """
+        moments = self.moments
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = moments.m2 / moments.count
+        # Same tolerance as scikit-learn's StandardScaler for treating a column as constant.
+        eps = np.finfo(float).eps
+        constant = var <= moments.count * eps * var + (moments.count * moments.mean * eps) ** 2
+        return np.where(constant, 1.0, np.sqrt(var))
+
+    def transform_array(self, values: np.ndarray) -> np.ndarray:
+        values -= self.moments.mean
+        values /= self.scale()
+        return values
+
+
 def clip_by_std(
     df: pd.DataFrame,
     mul: float = 3.0,
@@ -33,11 +202,7 @@ def clip_by_std(
     :param mul: Standard deviation multiplier for clipping bounds.
     :return: Clipped feature matrix.
     """
-    mean = df.mean(axis=0)
-    std = df.std(axis=0, ddof=0)
-    lower = mean - mul * std
-    upper = mean + mul * std
-    return df.clip(lower=lower, upper=upper, axis=1)
+    return ClipByStd(mul).fit(df).transform(df)
 
 
 def standard_scale(df: pd.DataFrame) -> pd.DataFrame:
@@ -47,7 +212,4 @@ def standard_scale(df: pd.DataFrame) -> pd.DataFrame:
     :param df: Input feature matrix.
     :return: Standardized feature matrix.
     """
-    scaler = StandardScaler().set_output(transform="pandas")
-    transformed = scaler.fit_transform(df)
-    transformed.index = df.index
-    return transformed
+    return StandardScale().fit(df).transform(df)
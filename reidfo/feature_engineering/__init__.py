@@ -1,3 +1,8 @@
 from .feature_engineer import FeatureEngineer
 from .time_series_data import TimeSeriesData
-from .functional_dictionary import keys as functional_keys, hls_keys, windows_keys
+from .array_time_series_data import ArrayTimeSeriesData
+from .chunked import ChunkedFeatureEngineer
+from .lags import LaggedFeatures
+from .functional_dictionary import (
+    keys as functional_keys, hls_keys, windows_keys, register_feature, unregister_feature
+)
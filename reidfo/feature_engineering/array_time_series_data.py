@@ -0,0 +1,213 @@
+import datetime as dt
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from reidfo.core.dtypes import as_float
+from .time_series_data import TimeSeriesData
+
+
+class ArrayTimeSeriesData:
+    __slots__ = ("columns", "series_name", "_index_type", "_index_name", "_tz",
+                 "_index", "_series", "_features", "_start", "_stop",
+                 "_index_view", "_series_view", "_features_view")
+
+    def __init__(self, series: pd.Series, feature_matrix: pd.DataFrame, capacity: Optional[int] = None):
+        """
+        Array-backed counterpart of ``TimeSeriesData`` for datasets grown block by block.
+
+        Index, series and features live in preallocated NumPy buffers that double in size
+        when full, so appending a block costs amortized O(block length) instead of a full
+        ``pd.concat``. ``series`` and ``feature_matrix`` are built on access as views onto the
+        buffers and cached until the next append or trim.
+
+        :param series: Time series indexed by date.
+        :param feature_matrix: Feature matrix indexed by date with one column per feature.
+        :param capacity: Optional number of rows to preallocate.
+        """
+        series, feature_matrix = as_float(series), as_float(feature_matrix)
+        if not series.index.equals(feature_matrix.index):
+            raise ValueError("Series and feature matrix must have matching indices.")
+
+        index = series.index
+        self.columns = feature_matrix.columns
+        self.series_name = series.name
+        self._index_type = type(index)
+        self._index_name = index.name
+        self._tz = getattr(index, "tz", None)
+
+        n_rows = len(index)
+        capacity = max(capacity or 0, n_rows, 1)
+        index_values = self._index_values(index)
+        series_values = series.to_numpy()
+        feature_values = feature_matrix.to_numpy()
+        self._index = np.empty(capacity, dtype=index_values.dtype)
+        self._series = np.empty(capacity, dtype=series_values.dtype)
+        self._features = np.empty((capacity, len(self.columns)), dtype=feature_values.dtype)
+        self._index[:n_rows] = index_values
+        self._series[:n_rows] = series_values
+        self._features[:n_rows] = feature_values
+        self._start, self._stop = 0, n_rows
+        self._index_view = None
+        self._series_view = None
+        self._features_view = None
+
+    @classmethod
+    def from_time_series_data(cls, data: TimeSeriesData, capacity: Optional[int] = None) -> "ArrayTimeSeriesData":
+        """
+        :param data: TimeSeriesData to copy into buffers.
+        :param capacity: Optional number of rows to preallocate.
+        :return: Array-backed copy of ``data``.
+        """
+        return cls(data.series, data.feature_matrix, capacity)
+
+    def to_time_series_data(self) -> TimeSeriesData:
+        """
+        :return: TimeSeriesData holding copies of the current rows.
+        """
+        return TimeSeriesData(self.series.copy(), self.feature_matrix.copy())
+
+    def _index_values(self, index: pd.Index) -> np.ndarray:
+        if getattr(index, "tz", None) is not None:
+            index = index.tz_convert(None)
+        return index.to_numpy()
+
+    def _make_index(self, values: np.ndarray) -> pd.Index:
+        index = pd.Index(values, name=self._index_name)
+        if self._tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self._tz)
+        return index
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._index)
+
+    @property
+    def index(self) -> pd.Index:
+        if self._index_view is None:
+            self._index_view = self._make_index(self._index[self._start:self._stop])
+        return self._index_view
+
+    @property
+    def series(self) -> pd.Series:
+        if self._series_view is None:
+            self._series_view = pd.Series(self._series[self._start:self._stop], index=self.index,
+                                          name=self.series_name, copy=False)
+        return self._series_view
+
+    @property
+    def feature_matrix(self) -> pd.DataFrame:
+        if self._features_view is None:
+            self._features_view = pd.DataFrame(self._features[self._start:self._stop], index=self.index,
+                                               columns=self.columns, copy=False)
+        return self._features_view
+
+    def _invalidate(self) -> None:
+        self._index_view = None
+        self._series_view = None
+        self._features_view = None
+
+    def trim(self, start: dt.date | int, end: dt.date | int) -> "ArrayTimeSeriesData":
+        """
+        Trim the stored rows to the requested range without copying.
+
+        :param start: Start date or positional index.
+        :param end: End date or positional index.
+        :return: The trimmed object.
+        """
+        if isinstance(start, dt.date) and isinstance(end, dt.date):
+            positions = self.index.slice_indexer(start, end)
+        elif isinstance(start, int) and isinstance(end, int):
+            positions = slice(start, end)
+        else:
+            raise ValueError("start and end dates must have matching types.")
+        first, last, _ = positions.indices(len(self))
+        self._start, self._stop = self._start + first, self._start + max(first, last)
+        self._invalidate()
+        return self
+
+    def _check_compatibility(self, series: pd.Series, feature_matrix: pd.DataFrame) -> None:
+        if not series.index.equals(feature_matrix.index):
+            raise ValueError("Series and feature matrix must have matching indices.")
+
+        if type(series.index) is not self._index_type:
+            raise TypeError("Index types differ.")
+
+        if len(self) and len(series) and self.index[-1] >= series.index[0]:
+            raise ValueError("Right-hand series must start after left-hand series ends.")
+
+        if not self.columns.equals(feature_matrix.columns):
+            raise ValueError("Feature matrices must have identical columns in the same order.")
+
+        if feature_matrix.to_numpy().dtype != self._features.dtype:
+            raise ValueError("Feature matrix column dtypes must match.")
+
+        if series.to_numpy().dtype != self._series.dtype:
+            raise ValueError("Series dtypes must match.")
+
+    def _reserve(self, n_rows: int) -> None:
+        if self._stop + n_rows <= self.capacity:
+            return
+        size = len(self)
+        capacity = max(2 * self.capacity, size + n_rows)
+        for name in ("_index", "_series", "_features"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:size] = old[self._start:self._stop]
+            setattr(self, name, new)
+        self._start, self._stop = 0, size
+
+    def append(self, series: pd.Series, feature_matrix: pd.DataFrame) -> "ArrayTimeSeriesData":
+        """
+        Append a block of rows in amortized O(block length).
+
+        :param series: Series block starting after the last stored date.
+        :param feature_matrix: Feature block with the same index as ``series``.
+        :return: This object extended with the new block.
+        """
+        series, feature_matrix = as_float(series), as_float(feature_matrix)
+        self._check_compatibility(series, feature_matrix)
+        n_rows = len(series)
+        self._reserve(n_rows)
+        rows = slice(self._stop, self._stop + n_rows)
+        self._index[rows] = self._index_values(series.index)
+        self._series[rows] = series.to_numpy()
+        self._features[rows] = feature_matrix.to_numpy()
+        self._stop += n_rows
+        self._invalidate()
+        return self
+
+    def __add__(self, other: "TimeSeriesData | ArrayTimeSeriesData") -> "ArrayTimeSeriesData":
+        """
+        :param other: TimeSeriesData or ArrayTimeSeriesData to append after this one.
+        :return: New object containing both consecutive time blocks.
+        """
+        self._check_type(other)
+        result = ArrayTimeSeriesData(self.series, self.feature_matrix, len(self) + len(other.series))
+        return result.append(other.series, other.feature_matrix)
+
+    def __iadd__(self, other: "TimeSeriesData | ArrayTimeSeriesData") -> "ArrayTimeSeriesData":
+        """
+        :param other: TimeSeriesData or ArrayTimeSeriesData to append after this one.
+        :return: This object extended with the new time block.
+        """
+        self._check_type(other)
+        return self.append(other.series, other.feature_matrix)
+
+    @staticmethod
+    def _check_type(other) -> None:
+        if not isinstance(other, (TimeSeriesData, ArrayTimeSeriesData)):
+            raise TypeError("Can add only TimeSeriesData objects\n"
+                            f"Other type: {type(other)}")
+
+    def __repr__(self) -> str:
+        return (f"Series: {self.series}\n"
+                f"Features: {self.feature_matrix}")
+
+    def __str__(self) -> str:
+        return (f"Series: {self.series.shape}\n"
+                f"Features: {self.feature_matrix.shape}")
@@ -0,0 +1,187 @@
+import datetime as dt
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import pandas as pd
+from loguru import logger
+
+from .collector.base_collector import BaseCollector
+
+
+def _callable_key(func: Optional[Callable], _seen: Optional[frozenset] = None) -> str:
+    if func is None:
+        return "None"
+    seen = (_seen or frozenset()) | {id(func)}
+    if isinstance(func, functools.partial):
+        return (f"partial({_callable_key(func.func, seen)}, {_value_key(func.args, seen)}, "
+                f"{_value_key(sorted(func.keywords.items()), seen)})")
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        # Lambdas share a qualified name; their bytecode and constants tell them apart.
+        name += f"[{code.co_code.hex()}|{code.co_consts!r}]"
+        # Functions built by the same factory share their code; their captured state differs.
+        cells = []
+        for cell in getattr(func, "__closure__", None) or ():
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:
+                cells.append("<empty>")
+        defaults = getattr(func, "__defaults__", None)
+        kwdefaults = sorted((getattr(func, "__kwdefaults__", None) or {}).items())
+        name += f"[{_value_key(cells, seen)}|{_value_key(defaults, seen)}|{_value_key(kwdefaults, seen)}]"
+    elif hasattr(func, "__dict__"):
+        # Callable objects such as fitted transforms are identified by their state as well.
+        try:
+            name += f"[{hashlib.sha256(pickle.dumps(func)).hexdigest()}]"
+        except (pickle.PicklingError, TypeError, AttributeError):
+            name += f"[{id(func)}]"
+    return name
+
+
+def _value_key(value: Any, seen: frozenset) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"({', '.join(_value_key(item, seen) for item in value)})"
+    if callable(value):
+        # Recursive closures refer back to a function that is already being keyed.
+        return "<recursive>" if id(value) in seen else _callable_key(value, seen)
+    return repr(value)
+
+
+def _json_default(value: Any) -> str:
+    # Callables in collector parameters are keyed by value, not by their memory address.
+    return _callable_key(value) if callable(value) else repr(value)
+
+
+class FeatureCache:
+    def __init__(self,
+                 max_entries: int = 128,
+                 directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        """
+        Content-addressed cache of transformed feature matrices.
+
+        Entries are keyed by ``fingerprint``, a hash of the input series (values, index and
+        name), the collector's ``describe()``, the clip/scale callables and the date range.
+        Recently used entries stay in memory; with a directory, entries are also written to disk
+        and reloaded across processes.
+
+        :param max_entries: Maximum number of feature matrices kept in memory.
+        :param directory: Optional directory for the on-disk tier.
+        :param max_disk_bytes: Optional size limit of the on-disk tier; least recently used
+            files are removed first.
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative.")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(series: pd.Series,
+                    collector: BaseCollector,
+                    clipper: Optional[Callable] = None,
+                    scaler: Optional[Callable] = None,
+                    start_date: Optional[dt.date] = None,
+                    end_date: Optional[dt.date] = None) -> str:
+        """
+        :param series: Series passed to the collector.
+        :param collector: Collector instance.
+        :param clipper: Clipping callable, or ``None``.
+        :param scaler: Scaling callable, or ``None``.
+        :param start_date: Optional filtering start date.
+        :param end_date: Optional filtering end date.
+        :return: Hex digest identifying the feature matrix these inputs produce.
+        """
+        digest = hashlib.sha256()
+        digest.update(pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes())
+        digest.update(json.dumps({
+            "name": repr(series.name),
+            "dtype": str(series.dtype),
+            "collector": collector.describe(),
+            "clipper": _callable_key(clipper),
+            "scaler": _callable_key(scaler),
+            "start_date": repr(start_date),
+            "end_date": repr(end_date),
+        }, sort_keys=True, default=_json_default).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        :param key: Fingerprint of the requested entry.
+        :return: A copy of the cached feature matrix, or ``None`` on a miss.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            logger.debug(f"Feature cache memory hit: {key}")
+            return self._memory[key].copy()
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            featm = pd.read_pickle(self._path(key))
+            os.utime(self._path(key))
+            self._remember(key, featm)
+            logger.debug(f"Feature cache disk hit: {key}")
+            return featm.copy()
+        return None
+
+    def put(self, key: str, featm: pd.DataFrame) -> None:
+        """
+        :param key: Fingerprint of the entry.
+        :param featm: Feature matrix to store; a copy is kept.
+        """
+        featm = featm.copy()
+        self._remember(key, featm)
+        if self.directory is not None:
+            # Write next to the final path and rename, so readers never see a partial file.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                featm.to_pickle(tmp_path)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            self._evict_disk()
+
+    def clear(self) -> None:
+        """
+        Remove all entries from both tiers.
+        """
+        self._memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key: str, featm: pd.DataFrame) -> None:
+        self._memory[key] = featm
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        if self.max_disk_bytes is None:
+            return
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
@@ -0,0 +1,116 @@
+import datetime as dt
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from reidfo.core.preprocessing import ClipByStd, StandardScale, filter_date_range
+from .collector.base_collector import BaseCollector
+from .feature_engineer import transform_features
+from .feature_store import FeatureStore
+from .time_series_data import TimeSeriesData
+
+
+class ChunkedFeatureEngineer:
+    def __init__(self,
+                 store: FeatureStore,
+                 clipper=ClipByStd,
+                 scaler=StandardScale,
+                 log_returns: bool = False):
+        """
+        Out-of-core counterpart of ``FeatureEngineer.get_data`` for series that do not fit in memory.
+
+        The input is read one time chunk at a time. Each chunk goes through
+        ``BaseCollector.collect_chunk``, which prepends a look-back halo or carries the collector's
+        state forward, so the features equal the in-memory result. Feature chunks are written to
+        a ``FeatureStore`` as they are produced. Clipping and scaling are fitted with
+        ``partial_fit`` over the stored raw chunks and then applied chunk by chunk. Peak memory
+        is therefore bounded by the chunk size, not the series length.
+
+        :param store: FeatureStore receiving the raw and the final feature chunks.
+        :param clipper: ClipByStd class or instance, or None. A class is instantiated and fitted
+            on every run, an unfitted instance is fitted on the run's data, and a fitted instance
+            is applied as is.
+        :param scaler: StandardScale class or instance, or None, handled like ``clipper``.
+        :param log_returns: If True, use log returns instead of percentage changes.
+        """
+        self.store = store
+        self.clipper = clipper
+        self.scaler = scaler
+        self.log_returns = log_returns
+
+    @staticmethod
+    def _resolve(transform):
+        return transform() if isinstance(transform, type) else transform
+
+    def _compute_returns(self, chunk: pd.Series, previous: Optional[pd.Series]) -> pd.Series:
+        # The last value of the previous chunk supplies the first return of this one.
+        values = chunk if previous is None else pd.concat([previous, chunk])
+        if self.log_returns:
+            return np.log(values).diff().iloc[1:]
+        return values.pct_change(fill_method=None).iloc[1:]
+
+    def run(self,
+            chunks: Iterable[pd.Series],
+            collector: BaseCollector,
+            key: str,
+            start_date: Optional[dt.date] = None,
+            end_date: Optional[dt.date] = None,
+            original: bool = False) -> None:
+        """
+        Collect, clip and scale features chunk by chunk and store them under ``key``. Read the
+        result back with ``store.read`` or, one chunk at a time, ``store.iter_blocks``.
+
+        :param chunks: Consecutive, non-overlapping time chunks of one series, in time order.
+        :param collector: An instance of a BaseCollector subclass supporting ``collect_chunk``.
+        :param key: Dataset name of the result in the store; an existing dataset is replaced.
+        :param start_date: Optional filtering start date.
+        :param end_date: Optional filtering end date.
+        :param original: Optional flag to indicate whether to use the original series or the return series.
+        :raises ValueError: If the transformed features contain NaNs.
+        """
+        clipper = self._resolve(self.clipper)
+        scaler = self._resolve(self.scaler)
+        fit_clipper = clipper is not None and not clipper.fitted
+        fit_scaler = scaler is not None and not scaler.fitted
+        clip = clipper.transform if clipper is not None else None
+        scale = scaler.transform if scaler is not None else None
+        # Fitting needs all chunks before any can be transformed, so raw features are staged on disk.
+        target = f"{key}.raw" if fit_clipper or fit_scaler else key
+
+        self.store.delete(target)
+        self.store.delete(key)
+        try:
+            state, previous = None, None
+            for chunk in chunks:
+                if not len(chunk):
+                    continue
+                ts = chunk if original else self._compute_returns(chunk, previous)
+                previous = chunk.iloc[-1:]
+                featm, state = collector.collect_chunk(ts, state)
+                featm = filter_date_range(featm, start_date, end_date)
+                if not len(featm):
+                    continue
+                series = filter_date_range(ts, start_date, end_date)
+
+                if target == key:
+                    featm = transform_features(featm, clip, scale)
+                elif fit_clipper:
+                    clipper.partial_fit(featm)
+                else:
+                    scaler.partial_fit(featm if clip is None else clip(featm))
+                self.store.append(target, TimeSeriesData(series, featm))
+
+            if target != key:
+                if fit_clipper and fit_scaler:
+                    for block in self.store.iter_blocks(target):
+                        scaler.partial_fit(clip(block.feature_matrix))
+                for block in self.store.iter_blocks(target):
+                    featm = transform_features(block.feature_matrix, clip, scale)
+                    self.store.append(key, TimeSeriesData(block.series, featm))
+        except BaseException:
+            self.store.delete(key)
+            raise
+        finally:
+            if target != key:
+                self.store.delete(target)
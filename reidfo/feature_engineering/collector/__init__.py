@@ -1,3 +1,8 @@
 from .custom_collector import CustomCollector
 from .half_life_collector import HalfLifeCollector
 from .windowed_collector import WindowedCollector
+from .moment_collector import MomentCollector
+from .quantile_collector import QuantileCollector
+from .panel_collector import PanelCollector
+from .cross_sectional_collector import CrossSectionalCollector
+from .multi_frequency_collector import MultiFrequencyCollector
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from reidfo.core.dtypes import get_float_dtype
+
 
 # reviewed
 class BaseCollector(ABC):
@@ -20,3 +23,90 @@ class BaseCollector(ABC):
         :param time_series: input time series
         """
         pass
+
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Collect features for every column of a panel at once.
+
+        The default implementation calls ``collect`` per column; subclasses override it with
+        computations over the whole 2-D block.
+
+        :param panel: DataFrame with time on the index and one series per column.
+        :return: DataFrame aligned with ``panel`` whose columns are a MultiIndex of
+            (series name, feature name).
+        """
+        return pd.concat({column: self.collect(panel[column]) for column in panel.columns}, axis=1)
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Value-based description of the collector, stable across instances and processes.
+
+        :return: Dict with the qualified ``collector`` class name and its ``params``; nested
+            collectors are described recursively and NumPy values converted to Python ones.
+            Other objects (e.g. callables) are left as is for the caller to serialize.
+        """
+        collector_type = type(self)
+        return {
+            "collector": f"{collector_type.__module__}.{collector_type.__qualname__}",
+            "params": self._describe_value(self.feat_params),
+        }
+
+    @classmethod
+    def _describe_value(cls, value: Any) -> Any:
+        if isinstance(value, BaseCollector):
+            return value.describe()
+        if isinstance(value, dict):
+            return {str(key): cls._describe_value(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._describe_value(item) for item in value]
+        if isinstance(value, (np.ndarray, np.generic)):
+            return value.tolist()
+        return value
+
+    def lookback(self) -> Optional[int]:
+        """
+        Number of observations preceding a chunk that ``collect`` needs to reproduce the chunk's
+        features exactly, or None if the features depend on the whole history.
+        """
+        return None
+
+    def collect_chunk(self, time_series: pd.Series, state: Any = None) -> Tuple[pd.DataFrame, Any]:
+        """
+        Collect features for one time chunk of a longer series.
+
+        The default implementation prepends the trailing ``lookback()`` observations of the
+        previous chunks (the halo) and drops their rows from the result. Collectors whose
+        features have unbounded memory override it to carry their own state instead.
+
+        :param time_series: Next chunk of the series, following the previous chunk in time.
+        :param state: State returned for the previous chunk, or None for the first chunk.
+        :return: Tuple of (features aligned with ``time_series``, state for the next chunk).
+        """
+        lookback = self.lookback()
+        if lookback is None:
+            raise NotImplementedError(f"{type(self).__name__} does not support chunked collection.")
+        halo = time_series.iloc[:0] if state is None else state
+        extended = pd.concat([halo, time_series]) if len(halo) else time_series
+        featm = self.collect(extended).iloc[len(halo):]
+        return featm, extended.iloc[max(len(extended) - lookback, 0):]
+
+    @staticmethod
+    def _frame(features: Dict[str, np.ndarray], index: pd.Index) -> pd.DataFrame:
+        """
+        Assemble per-feature arrays into a feature matrix of the package-wide float dtype.
+        """
+        block = np.empty((len(index), len(features)), dtype=get_float_dtype())
+        for i, values in enumerate(features.values()):
+            block[:, i] = values
+        return pd.DataFrame(block, index=index, columns=list(features.keys()), copy=False)
+
+    @staticmethod
+    def _panel_frame(panel: pd.DataFrame, features: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """
+        Assemble per-feature (time x series) arrays into the layout returned by ``collect_panel``.
+        """
+        n_obs, n_series = panel.shape
+        block = np.stack(list(features.values()), axis=-1, dtype=get_float_dtype())
+        block = block.reshape(n_obs, n_series * len(features))
+        columns = pd.MultiIndex.from_product([panel.columns, list(features.keys())])
+        return pd.DataFrame(block, index=panel.index, columns=columns)
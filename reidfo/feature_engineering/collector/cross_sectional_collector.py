@@ -0,0 +1,63 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+from scipy.stats import rankdata
+
+from .panel_collector import PanelCollector
+
+_FEATURES = ("rank", "zscore", "demeaned", "dispersion")
+
+
+# Row-wise statistics over the assets observed at each date; NaNs are left out.
+def _row_moments(values: np.ndarray):
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=1, keepdims=True)
+    filled = np.where(valid, values, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = filled.sum(axis=1, keepdims=True) / count
+        squares = np.where(valid, values - mean, 0.0) ** 2
+        std = np.sqrt(squares.sum(axis=1, keepdims=True) / (count - 1))
+    return count, mean, std
+
+
+class CrossSectionalCollector(PanelCollector):
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per-date features of each series relative to the other series of the panel:
+
+        - ``rank``: percentile rank across series (``rank(axis=1, pct=True)``, ties averaged);
+        - ``zscore``: deviation from the cross-sectional mean in cross-sectional standard deviations;
+        - ``demeaned``: deviation from the cross-sectional mean;
+        - ``dispersion``: cross-sectional standard deviation, identical for every series.
+
+        Dates with fewer than two observed series give NaN z-scores and dispersion, and dates
+        where all series are equal give NaN z-scores.
+        """
+        return self._panel_frame(panel, self._features(panel.to_numpy(dtype=float)))
+
+    def _feature_names(self):
+        names = self.feat_params.get("features", list(_FEATURES))
+        if not isinstance(names, (tuple, list)):
+            raise TypeError("Params['features'] must be a tuple or list of feature names")
+        unknown = [name for name in names if name not in _FEATURES]
+        if unknown:
+            raise ValueError(f"Unknown cross-sectional features {unknown}; available: {list(_FEATURES)}")
+        return names
+
+    def _features(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        names = self._feature_names()
+        count, mean, std = _row_moments(values)
+        features = {}
+        for name in names:
+            if name == "rank":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    features[name] = rankdata(values, axis=1, nan_policy="omit") / count
+            elif name == "zscore":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    features[name] = np.where(std > 0, (values - mean) / std, np.nan)
+            elif name == "demeaned":
+                features[name] = values - mean
+            else:
+                features[name] = np.broadcast_to(std, values.shape)
+        return features
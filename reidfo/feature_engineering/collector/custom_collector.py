@@ -1,13 +1,19 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import pandas as pd
 
+from reidfo.core.dtypes import as_float
+
 from .base_collector import BaseCollector
-from ..functional_dictionary import functional_dictionary, hls_keys, windows_keys
+from ..functional_dictionary import functional_dictionary, hls_keys, lookbacks, register_feature, windows_keys
+from ..planner import FeaturePlan
 
 
 # reviewed
 class CustomCollector(BaseCollector):
+    # Adds feature functions usable in ``function_list``; see ``functional_dictionary.register_feature``.
+    register = staticmethod(register_feature)
+
     def __init__(self, params: Dict[str, Any]):
         """
         :param params: Parameters for the feature engineering function.
@@ -21,7 +27,22 @@ class CustomCollector(BaseCollector):
     def collect(self, time_series: pd.Series) -> pd.DataFrame:
         prefix = time_series.name if time_series.name is not None else "main"
         feat_dict = self._extract_features(time_series, self.feat_params, prefix)
-        return pd.DataFrame(feat_dict)
+        return as_float(pd.DataFrame(feat_dict))
+
+    def describe(self) -> Dict[str, Any]:
+        description = super().describe()
+        # Registrations can be replaced under the same key, so the functions are part of the description.
+        description["functions"] = {key: functional_dictionary.get(key)
+                                    for key in self.feat_params.get("function_list", [])}
+        return description
+
+    def lookback(self) -> Optional[int]:
+        func_keys = set(self.feat_params.get("function_list", []))
+        # Half-life features have unbounded memory; other features must declare their lookback.
+        if func_keys & set(hls_keys) or not func_keys <= set(lookbacks):
+            return None
+        window = max(self.feat_params.get("windows", [6, 12]), default=1)
+        return max((lookbacks[key] + (window - 1 if key in windows_keys else 0) for key in func_keys), default=0)
 
     @staticmethod
     def _extract_features(series: pd.Series, feat_params: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
@@ -34,14 +55,8 @@ class CustomCollector(BaseCollector):
         hls = feat_params.get("halflives", [5, 20, 60]) if use_hls else []
         windows = feat_params.get("windows", [6, 12]) if use_windows else []
 
-        features = {}
-        for key in func_keys:
-            if key in hls_keys:
-                for hl in hls:
-                    features[f"{prefix}_{key}_{hl}"] = functional_dictionary[key](series, hl)
-            elif key in windows_keys:
-                for w in windows:
-                    features[f"{prefix}_{key}_{w}"] = functional_dictionary[key](series, w)
-            else:
-                features[f"{prefix}_{key}"] = functional_dictionary[key](series)
-        return features
+        plan = FeaturePlan(func_keys, hls, windows)
+        return {
+            f"{prefix}_{name}": pd.Series(values, index=series.index)
+            for name, values in plan.evaluate(series).items()
+        }
@@ -1,20 +1,44 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 
-from ..util import compute_ewm_mean, compute_log_downside_deviation, compute_ewm_sortino_ratio
+from ..kernels import EWMKernel
 from .base_collector import BaseCollector
 
 
 # reviewed
 class HalfLifeCollector(BaseCollector):
     def collect(self, time_series: pd.Series) -> pd.DataFrame:
+        features, _ = self._features(time_series.to_numpy(dtype=float))
+        return self._frame(features, time_series.index)
+
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        features, _ = self._features(panel.to_numpy(dtype=float))
+        return self._panel_frame(panel, features)
+
+    def collect_chunk(self, time_series: pd.Series,
+                      state: Optional[np.ndarray] = None) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+        # The exponentially weighted sums are carried across chunks instead of a halo.
+        features, state = self._features(time_series.to_numpy(dtype=float), state)
+        return self._frame(features, time_series.index), state
+
+    def _halflives(self) -> List[float]:
         hls = self.feat_params.get("halflives", [5, 20, 60])
         if not isinstance(hls, (tuple, list)):
             raise TypeError("Params['halflives'] must be a tuple or list of integers")
+        return hls
+
+    def _features(self, values: np.ndarray,
+                  initial: Optional[np.ndarray] = None) -> Tuple[Dict[str, np.ndarray], Optional[np.ndarray]]:
+        hls = self._halflives()
+        sums = EWMKernel(values).block(hls, initial)
+        block = EWMKernel.moments(sums)
         features = {}
-        for hl in hls:
+        for i, hl in enumerate(hls):
             features.update({
-                f"ret_{hl}": compute_ewm_mean(time_series, hl),
-                f"DD-log_{hl}": compute_log_downside_deviation(time_series, hl),
-                f"sortino_{hl}": compute_ewm_sortino_ratio(time_series, hl),
+                f"ret_{hl}": block["mean"][..., i],
+                f"DD-log_{hl}": block["log_downside_deviation"][..., i],
+                f"sortino_{hl}": block["sortino"][..., i],
             })
-        return pd.DataFrame(features)
+        return features, (sums[:, -1] if len(values) else initial)
@@ -0,0 +1,35 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from ..kernels import PowerSumKernel
+from .base_collector import BaseCollector
+
+
+class MomentCollector(BaseCollector):
+    def collect(self, time_series: pd.Series) -> pd.DataFrame:
+        return self._frame(self._features(time_series.to_numpy(dtype=float)), time_series.index)
+
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        return self._panel_frame(panel, self._features(panel.to_numpy(dtype=float)))
+
+    def lookback(self) -> int:
+        return max([w - 1 for w in self._windows()] + [0])
+
+    def _windows(self):
+        windows = self.feat_params.get("windows", [20, 60])
+        if not isinstance(windows, (tuple, list)):
+            raise TypeError("Params['windows'] must be a tuple or list of integers")
+        return windows
+
+    def _features(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        # Rolling power sums up to the fourth order serve every window size.
+        kernel = PowerSumKernel(values)
+        features = {}
+        for w in self._windows():
+            features.update({
+                f"skew_{w}": kernel.skew(w),
+                f"kurt_{w}": kernel.kurt(w),
+            })
+        return features
@@ -0,0 +1,86 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from reidfo.core.dtypes import get_float_dtype
+from .base_collector import BaseCollector
+
+_AGGREGATIONS = ("compound", "sum", "last", "mean")
+
+
+class MultiFrequencyCollector(BaseCollector):
+    def __init__(self, params: Dict[str, Any]):
+        """
+        Run a collector on the series and on its lower-frequency aggregates, and align every
+        result to the original index.
+
+        Each frequency is resampled once with a vectorized aggregation. A period is known to be
+        complete at the first observation of the next period, so its features become available
+        there and are carried forward: the position of each base timestamp is found with one
+        ``searchsorted`` over those timestamps. Features thus never depend on later observations,
+        and the trailing, possibly incomplete period is not used.
+
+        :param params: Dict with ``collector`` (BaseCollector applied at every frequency),
+            ``frequencies`` (pandas offset aliases; None stands for the original frequency;
+            defaults to ``[None, "W", "ME"]``) and ``aggregation`` (``"compound"`` for simple
+            returns, ``"sum"`` for log returns, ``"last"`` for prices or ``"mean"``; defaults
+            to ``"compound"``).
+        """
+        super().__init__(params)
+        if not isinstance(self.feat_params.get("collector"), BaseCollector):
+            raise TypeError("Params['collector'] must be a BaseCollector instance")
+        self.collector: BaseCollector = self.feat_params["collector"]
+        self.frequencies: List[Optional[str]] = list(self.feat_params.get("frequencies", [None, "W", "ME"]))
+        self.aggregation: str = self.feat_params.get("aggregation", "compound")
+        if self.aggregation not in _AGGREGATIONS:
+            raise ValueError(f"aggregation must be one of: {list(_AGGREGATIONS)}")
+
+    def collect(self, time_series: pd.Series) -> pd.DataFrame:
+        return self._collect(time_series.to_frame(), lambda frame: self.collector.collect(frame.iloc[:, 0]))
+
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        return self._collect(panel, self.collector.collect_panel)
+
+    def _aggregate(self, frame: pd.DataFrame, freq: str) -> pd.DataFrame:
+        if self.aggregation == "compound":
+            return np.expm1(np.log1p(frame).resample(freq).sum(min_count=1))
+        resampler = frame.resample(freq)
+        if self.aggregation == "sum":
+            return resampler.sum(min_count=1)
+        return resampler.last() if self.aggregation == "last" else resampler.mean()
+
+    def _collect(self, frame: pd.DataFrame, collect) -> pd.DataFrame:
+        index = frame.index
+        if not isinstance(index, pd.DatetimeIndex):
+            raise TypeError("MultiFrequencyCollector requires a DatetimeIndex.")
+
+        parts = []
+        for freq in self.frequencies:
+            if freq is None:
+                parts.append(collect(frame))
+                continue
+            first = pd.Series(index, index=index).resample(freq).min()
+            observed = first.notna().to_numpy()
+            aggregated = self._aggregate(frame, freq)[observed]
+            featm = collect(aggregated)
+
+            # Period k is available from the first observation of period k + 1 on.
+            available = pd.DatetimeIndex(first[observed]).asi8[1:]
+            positions = np.searchsorted(available, index.asi8, side="right") - 1
+            values = featm.to_numpy(dtype=get_float_dtype())[np.maximum(positions, 0)]
+            values[positions < 0] = np.nan
+            parts.append(pd.DataFrame(values, index=index, columns=self._suffix(featm.columns, freq), copy=False))
+
+        featm = pd.concat(parts, axis=1)
+        if isinstance(featm.columns, pd.MultiIndex):
+            # Keep the (series, feature) grouping of ``collect_panel``.
+            positions = pd.Index(frame.columns).get_indexer(featm.columns.get_level_values(0))
+            featm = featm.iloc[:, np.argsort(positions, kind="stable")]
+        return featm
+
+    @staticmethod
+    def _suffix(columns: pd.Index, freq: str) -> pd.Index:
+        if isinstance(columns, pd.MultiIndex):
+            return pd.MultiIndex.from_tuples([(series, f"{name}_{freq}") for series, name in columns])
+        return pd.Index([f"{name}_{freq}" for name in columns])
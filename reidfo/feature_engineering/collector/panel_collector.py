@@ -0,0 +1,24 @@
+from abc import abstractmethod
+
+import pandas as pd
+
+from .base_collector import BaseCollector
+
+
+class PanelCollector(BaseCollector):
+    """
+    Base class for collectors whose features depend on the whole cross-section of a panel,
+    so they are only available through ``collect_panel`` (``FeatureEngineer.get_data_many``).
+    """
+
+    def collect(self, time_series: pd.Series) -> pd.DataFrame:
+        raise TypeError(f"{type(self).__name__} needs the full panel; use FeatureEngineer.get_data_many.")
+
+    @abstractmethod
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        :param panel: DataFrame with time on the index and one series per column.
+        :return: DataFrame aligned with ``panel`` whose columns are a MultiIndex of
+            (series name, feature name).
+        """
+        pass
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from reidfo.core.dtypes import as_float
+
+from .base_collector import BaseCollector
+
+
+class QuantileCollector(BaseCollector):
+    def collect(self, time_series: pd.Series) -> pd.DataFrame:
+        return self._features(time_series.to_frame()).droplevel(0, axis=1)
+
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        return self._features(panel)
+
+    def lookback(self) -> int:
+        return max([w - 1 for w in self._windows()] + [0])
+
+    def _windows(self):
+        windows = self.feat_params.get("windows", [20, 60])
+        if not isinstance(windows, (tuple, list)):
+            raise TypeError("Params['windows'] must be a tuple or list of integers")
+        return windows
+
+    def _quantiles(self):
+        quantiles = self.feat_params.get("quantiles", [0.05, 0.5, 0.95])
+        if not isinstance(quantiles, (tuple, list)):
+            raise TypeError("Params['quantiles'] must be a tuple or list of floats")
+        if not all(0.0 <= q <= 1.0 for q in quantiles):
+            raise ValueError("quantiles must satisfy: 0 <= q <= 1")
+        return quantiles
+
+    def _features(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rolling quantiles of every column, with linear interpolation as ``np.quantile``.
+
+        pandas keeps each window in an indexable skiplist, so every step is an O(log w) insert,
+        delete and rank lookup instead of a sort of the whole window.
+        """
+        quantiles = self._quantiles()
+        features = {}
+        for w in self._windows():
+            rolling = panel.rolling(window=w)
+            for q in quantiles:
+                features[f"quantile_{q:g}_{w}"] = rolling.quantile(q)
+        featm = as_float(pd.concat(features, axis=1))
+        # Order the columns as (series, feature), like ``collect_panel`` of the other collectors.
+        return featm.swaplevel(axis=1)[pd.MultiIndex.from_product([panel.columns, list(features)])]
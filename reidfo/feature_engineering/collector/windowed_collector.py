@@ -1,34 +1,52 @@
+from typing import Dict
+
+import numpy as np
 import pandas as pd
 
-from ..util import (
-    compute_observation, compute_absolute_change, compute_previous_absolute_change,
-    compute_centered_mean, compute_centered_std,
-    compute_left_mean, compute_left_std,
-    compute_right_mean, compute_right_std
-)
+from ..kernels import PrefixSumKernel
 from .base_collector import BaseCollector
 
 
 # reviewed
 class WindowedCollector(BaseCollector):
     def collect(self, time_series: pd.Series) -> pd.DataFrame:
-        windows = self.feat_params.get("windows", [6, 12])
-        if not isinstance(windows, (tuple, list)):
-            raise TypeError("Params['windows'] must be a tuple or list of integers")
+        return self._frame(self._features(time_series.to_numpy(dtype=float)), time_series.index)
+
+    def collect_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        return self._panel_frame(panel, self._features(panel.to_numpy(dtype=float)))
+
+    def _features(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute every feature from one prefix-sum kernel shared by all window sizes, so each
+        additional window costs three vectorized segment lookups instead of six rolling passes.
+        """
+        abs_change = np.full(values.shape, np.nan)
+        abs_change[1:] = np.abs(np.diff(values, axis=0))
+        prev_abs_change = np.full(values.shape, np.nan)
+        prev_abs_change[1:] = abs_change[:-1]
 
         features = {
-            "observation": compute_observation(time_series),
-            "abs_change": compute_absolute_change(time_series),
-            "prev_abs_change": compute_previous_absolute_change(time_series),
+            "observation": values,
+            "abs_change": abs_change,
+            "prev_abs_change": prev_abs_change,
         }
-        for w in windows:
-            features.update({
-                f"centered_mean_{w}": compute_centered_mean(time_series, w),
-                f"centered_std_{w}": compute_centered_std(time_series, w),
-                f"left_mean_{w}": compute_left_mean(time_series, w),
-                f"left_std_{w}": compute_left_std(time_series, w),
-                f"right_mean_{w}": compute_right_mean(time_series, w),
-                f"right_std_{w}": compute_right_std(time_series, w),
-            })
-
-        return pd.DataFrame(features)
+        kernel = PrefixSumKernel(values)
+        for w in self._windows():
+            half = w // 2
+            segments = {"centered": (0, w), "left": (0, half), "right": (half, w)}
+            for name, (start, stop) in segments.items():
+                mean, std = kernel.moments(w, start, stop)
+                features[f"{name}_mean_{w}"] = mean
+                features[f"{name}_std_{w}"] = std
+
+        return features
+
+    def lookback(self) -> int:
+        # Rolling features look back one window; the previous absolute change looks back two rows.
+        return max([w - 1 for w in self._windows()] + [2])
+
+    def _windows(self):
+        windows = self.feat_params.get("windows", [6, 12])
+        if not isinstance(windows, (tuple, list)):
+            raise TypeError("Params['windows'] must be a tuple or list of integers")
+        return windows
@@ -1,34 +1,117 @@
+import numpy as np
 import pandas as pd
 import datetime as dt
-from typing import Optional
+from functools import partial
+from typing import Dict, Hashable, Optional, Sequence
 from loguru import logger
 
+from reidfo.core.dtypes import as_float
 from reidfo.core.preprocessing import clip_by_std, filter_date_range, standard_scale
+from .cache import FeatureCache
 from .collector.base_collector import BaseCollector
+from .parallel import collect_in_pool
 from .time_series_data import TimeSeriesData
 
 
+def transform_features(featm: pd.DataFrame, clipper=None, scaler=None) -> pd.DataFrame:
+    """
+    Clip and scale a collected feature matrix and reject remaining NaNs.
+
+    :param featm: Collected feature matrix.
+    :param clipper: Optional callable applied first.
+    :param scaler: Optional callable applied after clipping.
+    :return: Transformed feature matrix in the package-wide float dtype.
+    :raises ValueError: If the transformed matrix contains NaNs.
+    """
+    if clipper is not None:
+        featm = clipper(featm)
+    if scaler is not None:
+        featm = scaler(featm)
+    featm = as_float(featm)
+
+    if featm.isnull().any().any():
+        nan_cols = featm.columns[featm.isnull().any()].tolist()
+        logger.warning(f"Feature matrix contains NaNs in columns: {nan_cols}")
+        logger.debug(f"Preview of NaN columns:\n{featm[nan_cols].head()}")
+        raise ValueError("Feature matrix contains NaNs.")
+    return featm
+
+
 # reviewed
 class FeatureEngineer:
     def __init__(self,
                  df: pd.DataFrame,
                  clipper = clip_by_std,
-                 scaler = standard_scale):
+                 scaler = standard_scale,
+                 cache: Optional[FeatureCache] = None,
+                 log_returns: bool = False):
         """
         Extract a named time series from a time-indexed DataFrame, apply a collector,
         and return aligned TimeSeriesData.
 
+        Construction is cheap: columns are copied and their returns computed only when first
+        requested, and both are memoized per column.
+
         :param df: DataFrame with dates on the index and one column per named series.
+        :param cache: Optional FeatureCache reused across ``get_data`` calls.
+        :param log_returns: If True, use log returns instead of percentage changes.
         """
-        self.df = df.copy()
-        self.returns_df = self.df.pct_change(fill_method=None).iloc[1:]
+        self._source = df
         self.clipper = clipper
         self.scaler = scaler
+        self.cache = cache
+        self.log_returns = log_returns
+        self._originals: Dict[Hashable, pd.Series] = {}
+        self._returns: Dict[Hashable, pd.Series] = {}
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        :return: Original values of every column.
+        """
+        return self._get_panel(None, original=True)
+
+    @property
+    def returns_df(self) -> pd.DataFrame:
+        """
+        :return: Returns of every column, without the leading undefined row.
+        """
+        return self._get_panel(None)
+
+    def _compute_returns(self, values: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+        if self.log_returns:
+            return np.log(values).diff().iloc[1:]
+        return values.pct_change(fill_method=None).iloc[1:]
+
+    def _check_columns(self, columns: Sequence[Hashable]) -> None:
+        missing = [column for column in columns if column not in self._source.columns]
+        if len(missing) == 1 and len(columns) == 1:
+            raise ValueError(f"Column '{missing[0]}' not found.")
+        if missing:
+            raise ValueError(f"Columns {missing} not found.")
+
+    def _memoize(self, columns: Sequence[Hashable], original: bool) -> Dict[Hashable, pd.Series]:
+        self._check_columns(columns)
+        memo = self._originals if original else self._returns
+        pending = [column for column in columns if column not in memo]
+        if pending:
+            # Missing columns are copied, or turned into returns, together in one vectorized call.
+            block = self._source[pending].copy()
+            if not original:
+                block = self._compute_returns(block)
+            memo.update({column: block[column] for column in pending})
+        return memo
 
     def _get_column(self, column: str, original: bool = False) -> pd.Series:
-        if column not in self.df.columns:
-            raise ValueError(f"Column '{column}' not found.")
-        return self.df[column] if original else self.returns_df[column]
+        return self._memoize([column], original)[column]
+
+    def _get_panel(self, columns: Optional[Sequence[Hashable]], original: bool = False) -> pd.DataFrame:
+        columns = list(self._source.columns) if columns is None else list(columns)
+        memo = self._memoize(columns, original)
+        return pd.DataFrame({column: memo[column] for column in columns})
+
+    def _transform(self, featm: pd.DataFrame) -> pd.DataFrame:
+        return transform_features(featm, self.clipper, self.scaler)
 
     def get_data(self,
                  column: str,
@@ -47,19 +130,105 @@ class FeatureEngineer:
         :return: TimeSeriesData object containing aligned series and features.
         """
         ts = self._get_column(column, original=original)
-        featm = collector.collect(ts)
-        featm = filter_date_range(featm, start_date, end_date)
-
-        if self.clipper is not None:
-            featm = self.clipper(featm)
-        if self.scaler is not None:
-            featm = self.scaler(featm)
+        featm = None
+        if self.cache is not None:
+            key = self.cache.fingerprint(ts, collector, self.clipper, self.scaler, start_date, end_date)
+            featm = self.cache.get(key)
 
-        if featm.isnull().any().any():
-            nan_cols = featm.columns[featm.isnull().any()].tolist()
-            logger.warning(f"Feature matrix contains NaNs in columns: {nan_cols}")
-            logger.debug(f"Preview of NaN columns:\n{featm[nan_cols].head()}")
-            raise ValueError("Feature matrix contains NaNs.")
+        if featm is None:
+            featm = collector.collect(ts)
+            featm = filter_date_range(featm, start_date, end_date)
+            featm = self._transform(featm)
+            if self.cache is not None:
+                self.cache.put(key, featm)
 
         series = filter_date_range(ts, start_date, end_date)
         return TimeSeriesData(series=series, feature_matrix=featm)
+
+    def get_data_many(self,
+                      collector: BaseCollector | Sequence[BaseCollector],
+                      columns: Optional[Sequence[Hashable]] = None,
+                      start_date: Optional[dt.date] = None,
+                      end_date: Optional[dt.date] = None,
+                      original: bool = False,
+                      stacked: bool = False) -> Dict[Hashable, TimeSeriesData] | pd.DataFrame:
+        """
+        Collect features for several columns in one pass.
+
+        The collector runs once over the whole (time x column) panel through
+        ``BaseCollector.collect_panel``. Clipping and scaling then run once on the wide
+        feature matrix. Both act column by column, so each series gets the same
+        features as a separate ``get_data`` call.
+
+        Several collectors can be combined, including panel collectors such as
+        ``CrossSectionalCollector`` that need the whole cross-section; their features are
+        joined per column in the given collector order.
+
+        :param collector: An instance of a BaseCollector subclass, or a sequence of them.
+        :param columns: Column identifiers to process; defaults to all columns.
+        :param start_date: Optional filtering start date.
+        :param end_date: Optional filtering end date.
+        :param original: Optional flag to indicate whether to use the original series or the return series.
+        :param stacked: If True, return the wide feature matrix with (column, feature) MultiIndex
+            columns instead of one TimeSeriesData per column.
+        :return: Dict mapping each column to its TimeSeriesData, or the stacked feature matrix.
+        """
+        panel = self._get_panel(columns, original=original)
+        featm = self._collect_panel(panel, collector)
+        featm = filter_date_range(featm, start_date, end_date)
+
+        # Clippers and scalers expect flat feature names; restore the (column, feature) labels afterwards.
+        labels = featm.columns
+        featm = featm.set_axis([f"{column}:{feature}" for column, feature in labels], axis=1)
+        featm = self._transform(featm).set_axis(labels, axis=1)
+        if stacked:
+            return featm
+
+        panel = filter_date_range(panel, start_date, end_date)
+        return {
+            column: TimeSeriesData(series=panel[column], feature_matrix=featm[column])
+            for column in panel.columns
+        }
+
+    @staticmethod
+    def _collect_panel(panel: pd.DataFrame, collector: BaseCollector | Sequence[BaseCollector]) -> pd.DataFrame:
+        if isinstance(collector, BaseCollector):
+            return collector.collect_panel(panel)
+        featm = pd.concat([c.collect_panel(panel) for c in collector], axis=1)
+        # Group the joined features by column with one stable reorder instead of a loop over columns.
+        positions = pd.Index(panel.columns).get_indexer(featm.columns.get_level_values(0))
+        return featm.iloc[:, np.argsort(positions, kind="stable")]
+
+    def get_data_parallel(self,
+                          collector: BaseCollector,
+                          columns: Optional[Sequence[Hashable]] = None,
+                          n_jobs: Optional[int] = None,
+                          start_date: Optional[dt.date] = None,
+                          end_date: Optional[dt.date] = None,
+                          original: bool = False,
+                          chunksize: int = 1) -> Dict[Hashable, TimeSeriesData]:
+        """
+        Collect features column by column on a process pool.
+
+        Each column goes through the same collection, clipping and scaling as ``get_data``.
+        The input panel is shared with the workers through shared memory rather than pickled.
+        The collector, clipper and scaler must be picklable (no lambdas).
+
+        :param collector: An instance of a BaseCollector subclass.
+        :param columns: Column identifiers to process; defaults to all columns.
+        :param n_jobs: Number of worker processes; defaults to the number of CPUs.
+        :param start_date: Optional filtering start date.
+        :param end_date: Optional filtering end date.
+        :param original: Optional flag to indicate whether to use the original series or the return series.
+        :param chunksize: Number of columns sent to a worker per task.
+        :return: Dict mapping each column, in request order, to its TimeSeriesData.
+        """
+        panel = self._get_panel(columns, original=original)
+        transform = partial(transform_features, clipper=self.clipper, scaler=self.scaler)
+        featms = collect_in_pool(panel, collector, transform, n_jobs, start_date, end_date, chunksize)
+
+        panel = filter_date_range(panel, start_date, end_date)
+        return {
+            column: TimeSeriesData(series=panel[column], feature_matrix=featm)
+            for column, featm in zip(panel.columns, featms)
+        }
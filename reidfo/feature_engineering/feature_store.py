@@ -0,0 +1,210 @@
+import datetime as dt
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .time_series_data import TimeSeriesData
+
+_META = "meta.json"
+
+
+class FeatureStore:
+    def __init__(self, root: str):
+        """
+        Columnar on-disk store of TimeSeriesData.
+
+        Each dataset lives in its own directory with a ``meta.json`` file and one subdirectory
+        per appended time block. A block holds ``index.npy``, ``series.npy`` and one
+        ``feature_<i>.npy`` per feature column. Reads open the arrays with ``np.load(mmap_mode="r")``,
+        so only the blocks overlapping the requested date range and the requested feature
+        columns are touched. Appending writes a new block and leaves existing ones unchanged.
+
+        :param root: Directory holding the datasets.
+        """
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str, *parts: str) -> str:
+        return os.path.join(self.root, key, *parts)
+
+    def keys(self) -> List[str]:
+        """
+        :return: Names of the stored datasets.
+        """
+        return sorted(name for name in os.listdir(self.root) if os.path.exists(self._path(name, _META)))
+
+    def metadata(self, key: str) -> Dict[str, Any]:
+        """
+        :param key: Dataset name.
+        :return: Stored metadata (columns, dtypes, index timezone and block list).
+        """
+        if not os.path.exists(self._path(key, _META)):
+            raise KeyError(f"Dataset '{key}' not found.")
+        with open(self._path(key, _META)) as file:
+            return json.load(file)
+
+    def _write_metadata(self, key: str, meta: Dict[str, Any]) -> None:
+        # Replace atomically so a crash never leaves a half-written block list.
+        tmp = self._path(key, _META + ".tmp")
+        with open(tmp, "w") as file:
+            json.dump(meta, file)
+        os.replace(tmp, self._path(key, _META))
+
+    @staticmethod
+    def _index_values(index: pd.Index) -> np.ndarray:
+        if getattr(index, "tz", None) is not None:
+            index = index.tz_convert(None)
+        values = index.to_numpy()
+        if values.dtype == object:
+            raise ValueError("Index must have a datetime or numeric dtype to be stored.")
+        return values
+
+    def write(self, key: str, data: TimeSeriesData) -> None:
+        """
+        Store a dataset, replacing any existing dataset with the same name.
+
+        :param key: Dataset name.
+        :param data: TimeSeriesData (or ArrayTimeSeriesData) to store.
+        """
+        self.delete(key)
+        os.makedirs(self._path(key))
+        features = data.feature_matrix
+        meta = {
+            "columns": list(features.columns),
+            "series_name": data.series.name,
+            "series_dtype": str(data.series.to_numpy().dtype),
+            "feature_dtypes": [str(dtype) for dtype in features.dtypes],
+            "index_name": data.series.index.name,
+            "tz": str(data.series.index.tz) if getattr(data.series.index, "tz", None) is not None else None,
+            "blocks": [],
+        }
+        self._write_block(key, meta, data)
+
+    def append(self, key: str, data: TimeSeriesData) -> None:
+        """
+        Add a time block after the last stored one without rewriting existing blocks.
+
+        :param key: Dataset name; written from scratch if it does not exist yet.
+        :param data: TimeSeriesData starting after the last stored date, with the same columns and dtypes.
+        """
+        if not os.path.exists(self._path(key, _META)):
+            self.write(key, data)
+            return
+
+        meta = self.metadata(key)
+        features = data.feature_matrix
+        if list(features.columns) != meta["columns"]:
+            raise ValueError("Feature matrices must have identical columns in the same order.")
+        if [str(dtype) for dtype in features.dtypes] != meta["feature_dtypes"]:
+            raise ValueError("Feature matrix column dtypes must match.")
+        if str(data.series.to_numpy().dtype) != meta["series_dtype"]:
+            raise ValueError("Series dtypes must match.")
+        if meta["blocks"] and len(data.series):
+            last = np.load(self._path(key, meta["blocks"][-1]["name"], "index.npy"), mmap_mode="r")
+            if len(last) and last[-1] >= self._index_values(data.series.index)[0]:
+                raise ValueError("Right-hand series must start after left-hand series ends.")
+        self._write_block(key, meta, data)
+
+    def _write_block(self, key: str, meta: Dict[str, Any], data: TimeSeriesData) -> None:
+        name = f"{len(meta['blocks']):06d}"
+        os.makedirs(self._path(key, name))
+        np.save(self._path(key, name, "index.npy"), self._index_values(data.series.index))
+        np.save(self._path(key, name, "series.npy"), data.series.to_numpy())
+        for i, column in enumerate(data.feature_matrix.columns):
+            np.save(self._path(key, name, f"feature_{i}.npy"), data.feature_matrix[column].to_numpy())
+        meta["blocks"].append({"name": name, "rows": len(data.series)})
+        self._write_metadata(key, meta)
+
+    def delete(self, key: str) -> None:
+        """
+        :param key: Dataset name to remove; missing datasets are ignored.
+        """
+        if os.path.isdir(self._path(key)):
+            shutil.rmtree(self._path(key))
+
+    def _bound(self, value: Optional[dt.date], tz: Optional[str], index_dtype: np.dtype):
+        if value is None:
+            return None
+        if index_dtype.kind != "M":
+            return value
+        stamp = pd.Timestamp(value)
+        if tz is not None:
+            stamp = (stamp.tz_localize(tz) if stamp.tz is None else stamp).tz_convert("UTC").tz_localize(None)
+        return stamp.to_datetime64()
+
+    def iter_blocks(self, key: str, features: Optional[Sequence[str]] = None) -> Iterator[TimeSeriesData]:
+        """
+        Load a dataset one stored block at a time, so datasets larger than memory can be streamed.
+
+        :param key: Dataset name.
+        :param features: Optional feature names to load; defaults to all.
+        :return: Iterator of TimeSeriesData, one per block in time order.
+        """
+        meta = self.metadata(key)
+        for i in range(len(meta["blocks"])):
+            yield self._read_blocks(key, meta, features, [meta["blocks"][i]], None, None)
+
+    def read(self,
+             key: str,
+             start_date: Optional[dt.date] = None,
+             end_date: Optional[dt.date] = None,
+             features: Optional[Sequence[str]] = None) -> TimeSeriesData:
+        """
+        Load a dataset, optionally restricted to a date range and a subset of features.
+
+        :param key: Dataset name.
+        :param start_date: Optional inclusive start date.
+        :param end_date: Optional inclusive end date.
+        :param features: Optional feature names to load; defaults to all.
+        :return: TimeSeriesData with the requested rows and features.
+        """
+        meta = self.metadata(key)
+        return self._read_blocks(key, meta, features, meta["blocks"], start_date, end_date)
+
+    def _read_blocks(self,
+                     key: str,
+                     meta: Dict[str, Any],
+                     features: Optional[Sequence[str]],
+                     blocks: List[Dict[str, Any]],
+                     start_date: Optional[dt.date],
+                     end_date: Optional[dt.date]) -> TimeSeriesData:
+        columns = meta["columns"] if features is None else list(features)
+        missing = [column for column in columns if column not in meta["columns"]]
+        if missing:
+            raise ValueError(f"Features {missing} not found.")
+        positions = [meta["columns"].index(column) for column in columns]
+
+        index_parts, series_parts, feature_parts = [], [], []
+        for block in blocks:
+            index = np.load(self._path(key, block["name"], "index.npy"), mmap_mode="r")
+            lower = self._bound(start_date, meta["tz"], index.dtype)
+            upper = self._bound(end_date, meta["tz"], index.dtype)
+            first = 0 if lower is None else int(np.searchsorted(index, lower, side="left"))
+            last = len(index) if upper is None else int(np.searchsorted(index, upper, side="right"))
+            if first >= last:
+                continue
+            rows = slice(first, last)
+            index_parts.append(np.asarray(index[rows]))
+            series_parts.append(np.asarray(np.load(self._path(key, block["name"], "series.npy"), mmap_mode="r")[rows]))
+            feature_parts.append([
+                np.asarray(np.load(self._path(key, block["name"], f"feature_{i}.npy"), mmap_mode="r")[rows])
+                for i in positions
+            ])
+
+        index = pd.Index(np.concatenate(index_parts) if index_parts else np.array([], dtype="datetime64[ns]"),
+                         name=meta["index_name"])
+        if meta["tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        series = pd.Series(np.concatenate(series_parts) if series_parts else np.array([], dtype=meta["series_dtype"]),
+                           index=index, name=meta["series_name"])
+        feature_matrix = pd.DataFrame(
+            {column: np.concatenate([part[j] for part in feature_parts]) if feature_parts
+             else np.array([], dtype=meta["feature_dtypes"][positions[j]])
+             for j, column in enumerate(columns)},
+            index=index,
+        )
+        return TimeSeriesData(series, feature_matrix)
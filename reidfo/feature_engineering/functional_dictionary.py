@@ -1,13 +1,103 @@
+from typing import Callable, Optional
+
 from .util import *
 
-functional_dictionary = {
-    "obs": compute_observation,
-    "ab_ch": compute_absolute_change,
-    "ab_pr_ch": compute_previous_absolute_change,
+HALFLIFE = "halflife"
+WINDOW = "window"
+
+functional_dictionary = {}
+keys = functional_dictionary.keys()
+hls_keys = set()
+windows_keys = set()
+vectorized_keys = set()
+# Observations before a row that each feature reads, beyond the window of window features.
+lookbacks = {}
+
+
+def register_feature(key: str,
+                     func: Optional[Callable] = None,
+                     parameter: Optional[str] = None,
+                     vectorized: bool = False,
+                     overwrite: bool = False,
+                     lookback: Optional[int] = None):
+    """
+    Register a feature function for ``CustomCollector``. Can also be used as a decorator.
+
+    By default the function receives the pandas series, plus the half-life or window length
+    for parameterized features, and returns a series aligned with it. Vectorized functions
+    receive NumPy arrays instead:
+
+    - plain: the 1-D values, returning one value per observation;
+    - ``parameter="halflife"``: the 1-D values and the half-life, returning one value per observation;
+    - ``parameter="window"``: a zero-copy ``sliding_window_view`` of shape (n_windows x window),
+      returning one value per window. Results are aligned to each window's last observation,
+      and windows containing NaNs yield NaN.
+
+    :param key: Feature key used in ``function_list``.
+    :param func: Feature function; omit to use as a decorator.
+    :param parameter: None, ``"halflife"`` or ``"window"``.
+    :param vectorized: If True, the function works on NumPy arrays as described above.
+    :param overwrite: If True, replace an existing registration with the same key.
+    :param lookback: Number of earlier observations each value depends on; for window features,
+        in addition to the ``window - 1`` rows of the window. Vectorized window functions only
+        see their window and default to 0. Features without a declared lookback make
+        ``CustomCollector.lookback`` return None, i.e. unbounded history.
+    :return: ``func``, or a decorator registering the decorated function.
+    """
+    if parameter not in (None, HALFLIFE, WINDOW):
+        raise ValueError(f"parameter must be one of: None, '{HALFLIFE}', '{WINDOW}'")
+    if key in functional_dictionary and not overwrite:
+        raise ValueError(f"Feature '{key}' is already registered.")
+    if lookback is not None and lookback < 0:
+        raise ValueError("lookback must be a non-negative integer.")
+    if lookback is None and vectorized and parameter == WINDOW:
+        lookback = 0
+
+    def register(f: Callable) -> Callable:
+        if not callable(f):
+            raise TypeError("Feature function must be callable.")
+        unregister_feature(key)
+        functional_dictionary[key] = f
+        if parameter == HALFLIFE:
+            hls_keys.add(key)
+        elif parameter == WINDOW:
+            windows_keys.add(key)
+        if vectorized:
+            vectorized_keys.add(key)
+        if lookback is not None and parameter != HALFLIFE:
+            lookbacks[key] = lookback
+        return f
+
+    return register if func is None else register(func)
+
+
+def unregister_feature(key: str) -> None:
+    """
+    :param key: Feature key to remove; missing keys are ignored.
+    """
+    functional_dictionary.pop(key, None)
+    hls_keys.discard(key)
+    windows_keys.discard(key)
+    vectorized_keys.discard(key)
+    lookbacks.pop(key, None)
+
+
+for _key, (_func, _lookback) in {
+    "obs": (compute_observation, 0),
+    "ab_ch": (compute_absolute_change, 1),
+    "ab_pr_ch": (compute_previous_absolute_change, 2),
+}.items():
+    register_feature(_key, _func, lookback=_lookback)
+
+for _key, _func in {
     "exp_do": compute_downside_deviation,
     "ewm_me": compute_ewm_mean,
     "log_exp_do": compute_log_downside_deviation,
     "ewm_sor": compute_ewm_sortino_ratio,
+}.items():
+    register_feature(_key, _func, parameter=HALFLIFE)
+
+for _key, _func in {
     "cen_me": compute_centered_mean,
     "cen_std": compute_centered_std,
     "le_me": compute_left_mean,
@@ -15,9 +105,21 @@ functional_dictionary = {
     "ri_me": compute_right_mean,
     "ri_std": compute_right_std,
     "slope": compute_slope,
-    "mean_difference": lambda ts, w: compute_right_mean(ts, w) - compute_left_mean(ts,w),
-}
+    "intercept": compute_intercept,
+    "r2": compute_r_squared,
+    "mean_difference": lambda ts, w: compute_right_mean(ts, w) - compute_left_mean(ts, w),
+}.items():
+    register_feature(_key, _func, parameter=WINDOW, lookback=0)
 
-keys = functional_dictionary.keys()
-hls_keys = {"exp_do", "ewm_me", "log_exp_do", "ewm_sor"}
-windows_keys = {"cen_me", "cen_std", "le_me", "le_std", "ri_me", "ri_std", "slope", "mean_difference"}
+# Stock registrations, which the planner and the streaming engine evaluate with fused kernels.
+_builtin_functions = dict(functional_dictionary)
+
+
+def is_builtin(key: str) -> bool:
+    """
+    :param key: Feature key.
+    :return: True if ``key`` is still registered with its stock function, False if it was
+        replaced with ``overwrite=True`` or is not a built-in key.
+    """
+    return key in _builtin_functions and functional_dictionary.get(key) is _builtin_functions[key] \
+        and key not in vectorized_keys
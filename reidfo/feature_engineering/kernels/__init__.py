@@ -0,0 +1,4 @@
+from .prefix_sum import PrefixSumKernel
+from .regression import RollingRegressionKernel
+from .ewm import EWMKernel
+from .power_sum import PowerSumKernel
@@ -0,0 +1,92 @@
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from scipy.signal import lfilter
+
+
+class EWMKernel:
+    def __init__(self, values: np.ndarray):
+        """
+        Exponentially weighted moments of a series for several half-lives at once.
+
+        Reproduces ``ewm(halflife=hl).mean()`` (``adjust=True``, ``ignore_na=False``) through the
+        recursions ``num_t = x_t + d * num_{t-1}`` and ``den_t = 1 + d * den_{t-1}``, with
+        ``d = 0.5 ** (1 / hl)``. The observations, their squared negative parts and the
+        validity mask are filtered together, so each half-life costs a single pass.
+
+        :param values: 1-D array of observations, or 2-D array with one series per column.
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        self.shape = values.shape
+        # Stacked on a leading axis so one filter call handles all three inputs.
+        self.inputs = np.stack([filled, np.minimum(filled, 0.0) ** 2, valid.astype(float)])
+
+    @staticmethod
+    def decay(halflife: float) -> float:
+        """
+        :param halflife: Half-life of the exponentially weighted window.
+        :return: Per-step decay factor ``1 - alpha``.
+        """
+        if halflife <= 0:
+            raise ValueError("halflife must satisfy: halflife > 0")
+        return 0.5 ** (1.0 / halflife)
+
+    def sums(self, halflife: float, initial: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Exponentially weighted sums of the observations, the squared negative parts and the
+        validity mask.
+
+        :param halflife: Half-life of the exponentially weighted window.
+        :param initial: Optional sums of shape ``(3,) + values.shape[1:]`` reached just before the
+            first observation, to continue a series processed in chunks.
+        :return: Array of shape ``(3,) + values.shape``.
+        """
+        decay = self.decay(halflife)
+        if initial is None:
+            return lfilter([1.0], [1.0, -decay], self.inputs, axis=1)
+        zi = decay * np.expand_dims(np.asarray(initial, dtype=float), axis=1)
+        return lfilter([1.0], [1.0, -decay], self.inputs, axis=1, zi=zi)[0]
+
+    def block(self, halflives: Sequence[float], initial: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        :param halflives: Half-lives to evaluate.
+        :param initial: Optional sums of shape ``(3,) + values.shape[1:] + (len(halflives),)``
+            reached just before the first observation.
+        :return: Sums of shape ``(3,) + values.shape + (len(halflives),)``.
+        """
+        block = np.empty((3,) + self.shape + (len(halflives),))
+        for i, hl in enumerate(halflives):
+            block[..., i] = self.sums(hl, None if initial is None else initial[..., i])
+        return block
+
+    @staticmethod
+    def moments(block: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        :param block: Sums as returned by ``block``.
+        :return: Dict with ``mean``, ``downside_deviation``, ``log_downside_deviation`` and
+            ``sortino`` arrays of shape ``block.shape[1:]``.
+        """
+        num, neg_num, den = block
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(den > 0, num / den, np.nan)
+            downside = np.sqrt(np.where(den > 0, neg_num / den, np.nan))
+        downside_safe = np.where(downside == 0, 1e-20, downside)
+        return {
+            "mean": mean,
+            "downside_deviation": downside,
+            "log_downside_deviation": np.log(downside_safe),
+            "sortino": mean / downside_safe,
+        }
+
+    def fit(self, halflives: Sequence[float], initial: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Compute the half-life feature block.
+
+        :param halflives: Half-lives to evaluate.
+        :param initial: Optional sums reached just before the first observation (see ``block``).
+        :return: Dict with ``mean``, ``downside_deviation``, ``log_downside_deviation`` and
+            ``sortino`` arrays of shape ``values.shape + (len(halflives),)``.
+        """
+        return self.moments(self.block(halflives, initial))
@@ -0,0 +1,64 @@
+from typing import Tuple
+
+import numpy as np
+
+from .prefix_sum import PrefixSumKernel
+
+
+class PowerSumKernel(PrefixSumKernel):
+    # Third and fourth powers of the deviations, for skewness and kurtosis.
+    max_power = 4
+
+    def __init__(self, values: np.ndarray):
+        """
+        Prefix-sum kernel extended with block-local sums of third and fourth powers, used to
+        derive rolling skewness and kurtosis for any number of window sizes. Every window is
+        expanded around its own block anchor, so the moments keep their accuracy along long series.
+
+        :param values: 1-D array of observations, or 2-D array with one series per column.
+        """
+        super().__init__(values)
+
+    def _central_moments(self, window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        _, (sums, squares, cubes, quads), invalid = self._segment_sums(window, 0, window)
+        # Raw moments about the anchor, converted to central moments of the window.
+        d, s2, s3, s4 = sums / window, squares / window, cubes / window, quads / window
+        m2 = np.maximum(s2 - d ** 2, 0.0)
+        m3 = s3 - 3 * d * s2 + 2 * d ** 3
+        m4 = s4 - 4 * d * s3 + 6 * d ** 2 * s2 - 3 * d ** 4
+        # Windows whose variance is lost in rounding are treated as constant.
+        invalid = invalid | (m2 <= 1e-12 * s2)
+        return m2, m3, m4, invalid
+
+    def skew(self, window: int) -> np.ndarray:
+        """
+        Bias-corrected rolling skewness, as ``rolling(window).skew()``.
+
+        :param window: Rolling window length.
+        :return: Array aligned with the input; NaN for the first ``window - 1`` rows, windows
+            with NaNs and constant windows.
+        """
+        self._resolve(window, 0, None)
+        if window < 3 or window > self.n_obs:
+            return self._empty()
+        m2, m3, _, invalid = self._central_moments(window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            skew = np.sqrt(window * (window - 1)) / (window - 2) * m3 / m2 ** 1.5
+        return self._emit(window, skew, invalid)
+
+    def kurt(self, window: int) -> np.ndarray:
+        """
+        Bias-corrected rolling excess kurtosis, as ``rolling(window).kurt()``.
+
+        :param window: Rolling window length.
+        :return: Array aligned with the input; NaN for the first ``window - 1`` rows, windows
+            with NaNs and constant windows.
+        """
+        self._resolve(window, 0, None)
+        if window < 4 or window > self.n_obs:
+            return self._empty()
+        m2, _, m4, invalid = self._central_moments(window)
+        n = window
+        with np.errstate(invalid="ignore", divide="ignore"):
+            kurt = ((n * n - 1) * m4 / m2 ** 2 - 3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+        return self._emit(window, kurt, invalid)
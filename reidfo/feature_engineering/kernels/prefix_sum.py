@@ -0,0 +1,193 @@
+import math
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class PrefixSumKernel:
+    # Powers of the deviations whose segment sums are kept; subclasses add higher moments.
+    max_power = 2
+
+    def __init__(self, values: np.ndarray):
+        """
+        Block-local prefix and suffix sums of a series, used to derive rolling statistics over
+        any sub-range of a trailing window in O(n) vectorized operations.
+
+        For a segment length ``L`` the series is cut into blocks of ``L`` rows, each with its own
+        anchor (the block median). Within every block, prefix and suffix sums of the powers of
+        the deviations from the anchor are kept. A segment of ``L`` rows covers at most two
+        blocks, so its sums are read from a suffix of one block and a prefix of the next and
+        only add up rows of the segment: rounding error does not build up along the series,
+        and an outlier only affects the segments that contain it. The sums are computed once
+        per segment length and shared by all windows and segments of that length.
+
+        Non-finite values (NaN, inf) are treated as missing: every statistic of a window that
+        contains one is NaN, even for a segment of the window that does not.
+        A 2-D input is treated as a block of series with time on axis 0; every statistic is
+        then computed for all columns at once.
+
+        :param values: 1-D array of observations, or 2-D array with one series per column.
+        """
+        values = np.asarray(values, dtype=float)
+        self.missing = ~np.isfinite(values)
+        self.values = np.where(self.missing, np.nan, values)
+        self.n_obs = values.shape[0]
+        self.shape = values.shape[1:]
+        zeros = np.zeros((1,) + self.shape)
+        self.cum_nan = np.concatenate([zeros, np.cumsum(self.missing, axis=0)])
+        self._scans: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _terms(self, deviations: np.ndarray) -> List[np.ndarray]:
+        """
+        :param deviations: (n_blocks, window, ...) deviations from the block anchors, 0 where missing.
+        :return: Per-row terms whose segment sums are kept: the powers ``1..max_power``.
+        """
+        return [deviations ** p for p in range(1, self.max_power + 1)]
+
+    def _scan(self, length: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :param length: Block length, the length of the segments read from the sums.
+        :return: Block anchors (n_blocks, ...) and the inclusive prefix and suffix sums of every
+            term within its block, each of shape (n_terms, n_blocks * length, ...).
+        """
+        if length not in self._scans:
+            n_blocks = -(-self.n_obs // length)
+            padding = ((0, n_blocks * length - self.n_obs),) + ((0, 0),) * len(self.shape)
+            blocks = np.pad(self.values, padding, constant_values=np.nan)
+            blocks = blocks.reshape((n_blocks, length) + self.shape)
+            with warnings.catch_warnings():
+                # Blocks without observations have no anchor.
+                warnings.simplefilter("ignore", RuntimeWarning)
+                anchors = np.nan_to_num(np.nanmedian(blocks, axis=1))
+            deviations = np.nan_to_num(blocks - anchors[:, None])
+
+            terms = np.stack(self._terms(deviations))
+            prefix = np.cumsum(terms, axis=2)
+            suffix = np.cumsum(terms[:, :, ::-1], axis=2)[:, :, ::-1]
+            flat = (len(terms), n_blocks * length) + self.shape
+            self._scans[length] = (anchors, prefix.reshape(flat), suffix.reshape(flat))
+        return self._scans[length]
+
+    def _pieces(self, window: int, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        Split the segment ``[start, stop)`` of every trailing window into the suffix of one block
+        and the prefix of the next, with blocks as long as the segment. Both pieces only hold
+        rows of the segment, so no sum is ever formed by cancelling rows outside of it.
+
+        :return: Dict with the window ``begins``, the ``anchor`` of the block holding the segment
+            start, the sums of every term over the ``head`` piece (relative to ``anchor``) and
+            over the ``tail`` piece in the next block (relative to that block's anchor, zero if
+            the segment is a whole block), the tail's anchor offset ``delta``, its first row
+            ``tail_start``, its length ``tail_len`` and the ``cross`` mask.
+        """
+        length = stop - start
+        anchors, prefix, suffix = self._scan(length)
+        begins = np.arange(self.n_obs - window + 1)
+        lo, hi = begins + start, begins + stop
+        head_block, tail_block = lo // length, (hi - 1) // length
+        # A segment that does not cross a block boundary is exactly one block.
+        cross = head_block != tail_block
+        expanded = cross.reshape(cross.shape + (1,) * len(self.shape))
+
+        head = np.where(expanded, suffix[:, lo], prefix[:, hi - 1])
+        tail = np.where(expanded, prefix[:, hi - 1], 0.0)
+        return {
+            "begins": begins,
+            "anchor": anchors[head_block],
+            "delta": anchors[tail_block] - anchors[head_block],
+            "head": head,
+            "tail": tail,
+            "tail_start": tail_block * length,
+            "tail_len": np.where(cross, hi - tail_block * length, 0),
+            "cross": cross,
+        }
+
+    def _segment_sums(self, window: int, start: int, stop: int) -> Tuple[np.ndarray, List[np.ndarray], np.ndarray]:
+        """
+        :return: Tuple of the anchor of every window, the sums of the powers ``1..max_power`` of
+            the segment's deviations from that anchor, and the mask of windows with missing values.
+        """
+        pieces = self._pieces(window, start, stop)
+        count = pieces["tail_len"].reshape((-1,) + (1,) * len(self.shape))
+        delta, tail = pieces["delta"], [count] + list(pieces["tail"][:self.max_power])
+        sums = []
+        for p in range(1, self.max_power + 1):
+            # Re-anchor the tail piece: sum((x - a)^p) = sum_k C(p, k) (b - a)^(p - k) sum((x - b)^k).
+            shifted = sum(math.comb(p, k) * delta ** (p - k) * tail[k] for k in range(p + 1))
+            sums.append(pieces["head"][p - 1] + shifted)
+        ends = pieces["begins"] + window
+        invalid = (self.cum_nan[ends] - self.cum_nan[pieces["begins"]]) > 0
+        return pieces["anchor"], sums, invalid
+
+    def _resolve(self, window: int, start: int, stop: Optional[int]) -> Tuple[int, int]:
+        if window < 1:
+            raise ValueError("window must be a positive integer.")
+        stop = window if stop is None else stop
+        if not 0 <= start <= stop <= window:
+            raise ValueError("Segment bounds must satisfy 0 <= start <= stop <= window.")
+        return start, stop
+
+    def _empty(self) -> np.ndarray:
+        return np.full((self.n_obs,) + self.shape, np.nan)
+
+    def _emit(self, window: int, values: np.ndarray, invalid: np.ndarray) -> np.ndarray:
+        out = self._empty()
+        values[invalid] = np.nan
+        out[window - 1:] = values
+        return out
+
+    def mean(self, window: int, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Rolling mean over positions ``[start, stop)`` of each trailing window.
+
+        :param window: Full rolling window length.
+        :param start: First position of the segment within the window.
+        :param stop: End position (exclusive) of the segment; defaults to the full window.
+        :return: Array aligned with the input; the first ``window - 1`` rows are NaN.
+        """
+        start, stop = self._resolve(window, start, stop)
+        if window > self.n_obs or stop == start:
+            return self._empty()
+        anchor, sums, invalid = self._segment_sums(window, start, stop)
+        return self._emit(window, sums[0] / (stop - start) + anchor, invalid)
+
+    def std(self, window: int, start: int = 0, stop: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+        """
+        Rolling standard deviation over positions ``[start, stop)`` of each trailing window.
+
+        :param window: Full rolling window length.
+        :param start: First position of the segment within the window.
+        :param stop: End position (exclusive) of the segment; defaults to the full window.
+        :param ddof: Delta degrees of freedom.
+        :return: Array aligned with the input; the first ``window - 1`` rows are NaN.
+        """
+        start, stop = self._resolve(window, start, stop)
+        length = stop - start
+        if window > self.n_obs or length - ddof <= 0:
+            return self._empty()
+        _, (sums, squares, *_), invalid = self._segment_sums(window, start, stop)
+        variance = np.maximum(squares - sums ** 2 / length, 0.0) / (length - ddof)
+        return self._emit(window, np.sqrt(variance), invalid)
+
+    def moments(self, window: int, start: int = 0, stop: Optional[int] = None,
+                ddof: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rolling mean and standard deviation of the same segment from one pass over the sums.
+
+        :param window: Full rolling window length.
+        :param start: First position of the segment within the window.
+        :param stop: End position (exclusive) of the segment; defaults to the full window.
+        :param ddof: Delta degrees of freedom of the standard deviation.
+        :return: Tuple of (mean, std), as returned by ``mean`` and ``std``.
+        """
+        start, stop = self._resolve(window, start, stop)
+        length = stop - start
+        if window > self.n_obs or length == 0:
+            return self.mean(window, start, stop), self.std(window, start, stop, ddof)
+        anchor, (sums, squares, *_), invalid = self._segment_sums(window, start, stop)
+        mean = self._emit(window, sums / length + anchor, invalid)
+        if length - ddof <= 0:
+            return mean, np.full(mean.shape, np.nan)
+        variance = np.maximum(squares - sums ** 2 / length, 0.0) / (length - ddof)
+        return mean, self._emit(window, np.sqrt(variance), invalid)
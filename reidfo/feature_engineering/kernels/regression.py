@@ -0,0 +1,73 @@
+from typing import Dict, List
+
+import numpy as np
+
+from .prefix_sum import PrefixSumKernel
+
+
+class RollingRegressionKernel(PrefixSumKernel):
+    def __init__(self, values: np.ndarray):
+        """
+        Closed-form rolling least-squares fit of each trailing window against the grid
+        ``x = 0, 1, ..., window - 1``, the same regression ``np.polyfit(x, y, 1)`` solves.
+
+        On top of the block-local sums of the base kernel, keeps the block-local sums of
+        ``j * y`` (position within the block times deviation), from which the window
+        cross-moment follows.
+
+        :param values: 1-D array of observations, or 2-D array with one series per column.
+        """
+        super().__init__(values)
+
+    def _terms(self, deviations: np.ndarray) -> List[np.ndarray]:
+        positions = np.arange(deviations.shape[1], dtype=float).reshape((1, -1) + (1,) * len(self.shape))
+        return super()._terms(deviations) + [positions * deviations]
+
+    def fit(self, window: int) -> Dict[str, np.ndarray]:
+        """
+        Fit every trailing window at once.
+
+        :param window: Rolling window length.
+        :return: Dict with ``slope``, ``intercept`` (value of the fit at the first point of the
+            window) and ``r2`` arrays aligned with the input; the first ``window - 1`` rows are NaN.
+            ``r2`` is NaN for constant or single-point windows; a single-point slope is 0.
+        """
+        self._resolve(window, 0, None)
+        if window > self.n_obs:
+            return {"slope": self._empty(), "intercept": self._empty(), "r2": self._empty()}
+
+        anchor, (sums, squares), invalid = self._segment_sums(window, 0, window)
+        pieces = self._pieces(window, 0, window)
+
+        def expand(array: np.ndarray) -> np.ndarray:
+            return array.reshape(array.shape + (1,) * len(self.shape)).astype(float)
+
+        # Move the block positions to the window grid: the head starts ``begin - block start``
+        # rows into its block, the tail ``tail start - begin`` rows into the window, and the tail
+        # deviations are re-anchored on the head's anchor.
+        begins = pieces["begins"]
+        head_offset = expand(begins % window)
+        tail_offset = expand(pieces["tail_start"] - begins)
+        tail_len = expand(pieces["tail_len"])
+        tail_positions = (tail_offset + (tail_len - 1) / 2) * tail_len
+        head_sum, tail_sum = pieces["head"][0], pieces["tail"][0]
+        cross = (pieces["head"][-1] - head_offset * head_sum
+                 + np.where(expand(pieces["cross"]) > 0,
+                            pieces["tail"][-1] + tail_offset * tail_sum + pieces["delta"] * tail_positions,
+                            0.0))
+
+        x_mean = (window - 1) / 2
+        x_var = window * (window ** 2 - 1) / 12
+        covariance = cross - x_mean * sums
+        slope = covariance / x_var if window > 1 else np.zeros_like(sums)
+        intercept = sums / window + anchor - slope * x_mean
+        total = np.maximum(squares - sums ** 2 / window, 0.0)
+        r2 = np.divide(slope * covariance, total, out=np.full_like(total, np.nan), where=total > 0)
+        if window < 2:
+            r2[:] = np.nan
+
+        return {
+            "slope": self._emit(window, slope, invalid),
+            "intercept": self._emit(window, intercept, invalid),
+            "r2": self._emit(window, r2, invalid),
+        }
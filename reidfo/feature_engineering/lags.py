@@ -0,0 +1,88 @@
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from reidfo.core.dtypes import get_float_dtype
+from .time_series_data import TimeSeriesData
+
+
+class LaggedFeatures:
+    def __init__(self, data: TimeSeriesData, lags: int | Sequence[int]):
+        """
+        Lagged copies of every feature (t, t-1, ..., t-k) for forecasting models.
+
+        Instead of ``shift`` + ``concat``, which stores the feature matrix once per lag, the lags
+        are exposed as a strided view onto the original feature values. The design matrix is
+        written once, only when requested, in C-contiguous (row-major) layout.
+
+        :param data: TimeSeriesData whose feature matrix is lagged.
+        :param lags: Maximum lag ``k`` (lags ``0..k``), or an explicit sequence of non-negative lags.
+        :raises ValueError: If a lag is negative, lags repeat, or the data is too short.
+        """
+        lags = list(range(lags + 1)) if isinstance(lags, (int, np.integer)) else list(lags)
+        if not lags or min(lags) < 0:
+            raise ValueError("lags must be non-negative.")
+        if len(set(lags)) != len(lags):
+            raise ValueError("lags must be unique.")
+        self.lags: List[int] = lags
+        self.max_lag = max(lags)
+        if len(data.series) <= self.max_lag:
+            raise ValueError("Data must be longer than the largest lag.")
+
+        self.data = data
+        self.features = data.feature_matrix.columns
+        values = data.feature_matrix.to_numpy(dtype=get_float_dtype())
+        # (T - k, F, k + 1) windows ordered oldest first; reorder to (T - k, k + 1, F) by lag.
+        windows = sliding_window_view(values, self.max_lag + 1, axis=0)
+        self._windows = windows.transpose(0, 2, 1)[:, ::-1, :]
+
+    @property
+    def view(self) -> np.ndarray:
+        """
+        :return: Read-only view of shape (T - k, len(lags), F) where ``view[i, j]`` holds the
+            features at row ``i + k`` lagged by ``lags[j]``. It is a copy only if the lags are
+            not an increasing, evenly spaced sequence.
+        """
+        lags = self.lags
+        step = lags[1] - lags[0] if len(lags) > 1 else 1
+        if step > 0 and lags == list(range(lags[0], lags[-1] + 1, step)):
+            return self._windows[:, lags[0]:lags[-1] + 1:step]
+        return self._windows[:, lags]
+
+    @property
+    def index(self) -> pd.Index:
+        """
+        :return: Index of the rows with every lag available.
+        """
+        return self.data.series.index[self.max_lag:]
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        :return: Column names, ordered by lag and then feature; lag 0 keeps the feature name.
+        """
+        return [str(f) if lag == 0 else f"{f}_lag{lag}" for lag in self.lags for f in self.features]
+
+    def to_array(self) -> np.ndarray:
+        """
+        :return: C-contiguous design matrix of shape (T - k, len(lags) * F), written in one pass.
+        """
+        n_rows, n_features = len(self._windows), len(self.features)
+        out = np.empty((n_rows, len(self.lags), n_features), dtype=self._windows.dtype)
+        for j, lag in enumerate(self.lags):
+            out[:, j] = self._windows[:, lag]
+        return out.reshape(n_rows, len(self.lags) * n_features)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        :return: Design matrix as a DataFrame wrapping ``to_array()`` without a further copy.
+        """
+        return pd.DataFrame(self.to_array(), index=self.index, columns=self.columns, copy=False)
+
+    def to_time_series_data(self) -> TimeSeriesData:
+        """
+        :return: TimeSeriesData of the series from row ``k`` on and the lagged design matrix.
+        """
+        return TimeSeriesData(self.data.series.iloc[self.max_lag:], self.to_frame())
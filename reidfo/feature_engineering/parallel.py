@@ -0,0 +1,112 @@
+import datetime as dt
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from reidfo.core.preprocessing import filter_date_range
+from .collector.base_collector import BaseCollector
+
+# Per-process state populated once by ``_init_worker``; tasks only carry a column position.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def share_panel(panel: pd.DataFrame) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Copy the values of a panel into a shared-memory block in column-major order, so every
+    series is a contiguous slice that workers can read without copying.
+
+    :param panel: DataFrame with time on the index and one series per column.
+    :return: The shared-memory block (owned by the caller, who must close and unlink it)
+        and a float64 view onto it.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(panel.size, 1) * np.dtype(float).itemsize)
+    values = np.ndarray(panel.shape, dtype=float, buffer=shm.buf, order="F")
+    values[:] = panel.to_numpy(dtype=float)
+    return shm, values
+
+
+def read_shared(name: str, shape: Tuple[int, ...], key: Any = ...) -> np.ndarray:
+    """
+    Attach to a block created by ``share_panel``, copy ``values[key]`` out of it and close the
+    handle again, so workers hold no handle on the block between tasks.
+
+    :param name: Name of the shared-memory block.
+    :param shape: Shape of the shared array, as passed to ``share_panel``.
+    :param key: Index into the shared array selecting the values to copy; defaults to all.
+    :return: Private copy of the selected values.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    values = None
+    try:
+        values = np.ndarray(shape, dtype=float, buffer=shm.buf, order="F")
+        return np.array(values[key])
+    finally:
+        # The view must be released before the handle can be closed.
+        del values
+        shm.close()
+
+
+def _init_worker(shm_name: str,
+                 shape: Tuple[int, int],
+                 index: pd.Index,
+                 columns: pd.Index,
+                 collector: BaseCollector,
+                 transform: Callable[[pd.DataFrame], pd.DataFrame],
+                 start_date: Optional[dt.date],
+                 end_date: Optional[dt.date]) -> None:
+    _WORKER_STATE.update({
+        "shm_name": shm_name,
+        "shape": shape,
+        "index": index,
+        "columns": columns,
+        "collector": collector,
+        "transform": transform,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
+
+
+def _collect_column(position: int) -> pd.DataFrame:
+    state = _WORKER_STATE
+    values = read_shared(state["shm_name"], state["shape"], (slice(None), position))
+    ts = pd.Series(values, index=state["index"], name=state["columns"][position])
+    featm = state["collector"].collect(ts)
+    featm = filter_date_range(featm, state["start_date"], state["end_date"])
+    return state["transform"](featm)
+
+
+def collect_in_pool(panel: pd.DataFrame,
+                    collector: BaseCollector,
+                    transform: Callable[[pd.DataFrame], pd.DataFrame],
+                    n_jobs: Optional[int] = None,
+                    start_date: Optional[dt.date] = None,
+                    end_date: Optional[dt.date] = None,
+                    chunksize: int = 1) -> List[pd.DataFrame]:
+    """
+    Collect, date-filter and transform the features of every panel column on a process pool.
+
+    The panel is placed in shared memory once; the collector and transform are sent once per
+    worker, and each task only names a column position. Results come back in column order.
+
+    :param panel: DataFrame with time on the index and one series per column.
+    :param collector: Collector applied to each column; must be picklable.
+    :param transform: Callable applied to each date-filtered feature matrix; must be picklable.
+    :param n_jobs: Number of worker processes; defaults to the number of CPUs.
+    :param start_date: Optional filtering start date.
+    :param end_date: Optional filtering end date.
+    :param chunksize: Number of columns sent to a worker per task.
+    :return: List of feature matrices, one per column of ``panel``.
+    """
+    shm, _ = share_panel(panel)
+    try:
+        with ProcessPoolExecutor(max_workers=n_jobs,
+                                 initializer=_init_worker,
+                                 initargs=(shm.name, panel.shape, panel.index, panel.columns,
+                                           collector, transform, start_date, end_date)) as pool:
+            return list(pool.map(_collect_column, range(panel.shape[1]), chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
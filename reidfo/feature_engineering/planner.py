@@ -0,0 +1,152 @@
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .functional_dictionary import functional_dictionary, hls_keys, is_builtin, vectorized_keys, windows_keys
+from .kernels import EWMKernel, PrefixSumKernel, RollingRegressionKernel
+
+_VALUES = ("values",)
+_SERIES = ("series",)
+_EWM_STATS = {
+    "exp_do": "downside_deviation",
+    "ewm_me": "mean",
+    "log_exp_do": "log_downside_deviation",
+    "ewm_sor": "sortino",
+}
+_REGRESSION_STATS = {"slope": "slope", "intercept": "intercept", "r2": "r2"}
+
+
+class _Node(NamedTuple):
+    func: Callable[..., Any]
+    inputs: Tuple[Hashable, ...]
+
+
+def _abs_diff(values: np.ndarray) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    out[1:] = np.abs(np.diff(values, axis=0))
+    return out
+
+
+def _lag(values: np.ndarray) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    out[1:] = values[:-1]
+    return out
+
+
+def _sliding(key: str, func: Callable[[np.ndarray], np.ndarray], w: int) -> Callable[[np.ndarray], np.ndarray]:
+    def apply(values: np.ndarray) -> np.ndarray:
+        out = np.full(values.shape, np.nan)
+        if len(values) < w:
+            return out
+        result = np.asarray(func(sliding_window_view(values, w)), dtype=float)
+        if result.shape != (len(values) - w + 1,):
+            raise ValueError(f"Feature '{key}' must return one value per window.")
+        # Windows containing NaNs are void, as with ``rolling(window).apply``.
+        nans = np.concatenate([[0], np.cumsum(np.isnan(values))])
+        out[w - 1:] = np.where(nans[w:] > nans[:-w], np.nan, result)
+        return out
+    return apply
+
+
+class FeaturePlan:
+    def __init__(self, function_list: Sequence[str], halflives: Sequence[float], windows: Sequence[int]):
+        """
+        Compile requested ``functional_dictionary`` features into a DAG of shared primitives.
+
+        Every node (prefix sums, the EWM block of all half-lives, rolling segment statistics,
+        rolling fits, differences) is keyed by what it computes, so features that need the same
+        intermediate result reference one node and it is evaluated once. Keys the planner does
+        not know, and built-in keys re-registered with ``overwrite=True``, are evaluated through
+        ``functional_dictionary``; vectorized window functions receive a zero-copy sliding
+        window view of the values.
+
+        :param function_list: Feature keys, in output order.
+        :param halflives: Half-lives for half-life parameterized keys.
+        :param windows: Window lengths for window parameterized keys.
+        """
+        self.halflives = list(halflives)
+        self.windows = list(windows)
+        self.nodes: Dict[Hashable, _Node] = {}
+        self.outputs: List[Tuple[str, Hashable]] = []
+        # The regression kernel extends the prefix-sum kernel, so one object serves both when needed.
+        self._sums_kernel = RollingRegressionKernel if set(_REGRESSION_STATS) & set(function_list) else PrefixSumKernel
+
+        for key in function_list:
+            if key in hls_keys:
+                for i, hl in enumerate(self.halflives):
+                    self.outputs.append((f"{key}_{hl}", self._halflife_node(key, i, hl)))
+            elif key in windows_keys:
+                for w in self.windows:
+                    self.outputs.append((f"{key}_{w}", self._window_node(key, w)))
+            else:
+                self.outputs.append((key, self._plain_node(key)))
+
+    def _add(self, key: Hashable, func: Callable[..., Any], *inputs: Hashable) -> Hashable:
+        # Inputs are always added before their consumers, so insertion order is a topological order.
+        if key not in self.nodes:
+            self.nodes[key] = _Node(func, inputs)
+        return key
+
+    def _sums(self) -> Hashable:
+        return self._add(("rolling_sums",), self._sums_kernel, _VALUES)
+
+    def _plain_node(self, key: str) -> Hashable:
+        if is_builtin(key):
+            if key == "obs":
+                return _VALUES
+            abs_diff = self._add(("abs_diff",), _abs_diff, _VALUES)
+            if key == "ab_ch":
+                return abs_diff
+            if key == "ab_pr_ch":
+                return self._add(("lag", "abs_diff"), _lag, abs_diff)
+        return self._add(("custom", key), functional_dictionary[key], self._custom_input(key))
+
+    def _halflife_node(self, key: str, i: int, hl: float) -> Hashable:
+        if key not in _EWM_STATS or not is_builtin(key):
+            return self._add(("custom", key, hl), lambda s: functional_dictionary[key](s, hl), self._custom_input(key))
+        block = self._add(("ewm",), lambda x: EWMKernel(x).fit(self.halflives), _VALUES)
+        stat = _EWM_STATS[key]
+        return self._add(("ewm", stat, i), lambda b: b[stat][..., i], block)
+
+    def _segment_node(self, stat: str, w: int, start: int, stop: int) -> Hashable:
+        return self._add((stat, w, start, stop), lambda k: getattr(k, stat)(w, start, stop), self._sums())
+
+    def _window_node(self, key: str, w: int) -> Hashable:
+        half = w // 2
+        segments = {
+            "cen_me": ("mean", 0, w), "cen_std": ("std", 0, w),
+            "le_me": ("mean", 0, half), "le_std": ("std", 0, half),
+            "ri_me": ("mean", half, w), "ri_std": ("std", half, w),
+        }
+        builtin = is_builtin(key)
+        if builtin and key in segments:
+            stat, start, stop = segments[key]
+            return self._segment_node(stat, w, start, stop)
+        if builtin and key == "mean_difference":
+            right, left = self._segment_node("mean", w, half, w), self._segment_node("mean", w, 0, half)
+            return self._add(("sub", right, left), np.subtract, right, left)
+        if builtin and key in _REGRESSION_STATS:
+            fit = self._add(("fit", w), lambda k: k.fit(w), self._sums())
+            stat = _REGRESSION_STATS[key]
+            return self._add(("fit", w, stat), lambda f: f[stat], fit)
+        if key in vectorized_keys:
+            return self._add(("custom", key, w), _sliding(key, functional_dictionary[key], w), _VALUES)
+        return self._add(("custom", key, w), lambda s: functional_dictionary[key](s, w), _SERIES)
+
+    @staticmethod
+    def _custom_input(key: str) -> Hashable:
+        return _VALUES if key in vectorized_keys else _SERIES
+
+    def evaluate(self, series: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every node once, in dependency order.
+
+        :param series: Input time series.
+        :return: Dict mapping output names (without prefix) to arrays aligned with ``series``.
+        """
+        results: Dict[Hashable, Any] = {_VALUES: series.to_numpy(dtype=float), _SERIES: series}
+        for key, node in self.nodes.items():
+            results[key] = node.func(*(results[name] for name in node.inputs))
+        return {name: np.asarray(results[key], dtype=float) for name, key in self.outputs}
@@ -0,0 +1,311 @@
+import math
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .collector.base_collector import BaseCollector
+from .collector.custom_collector import CustomCollector
+from .collector.half_life_collector import HalfLifeCollector
+from .collector.windowed_collector import WindowedCollector
+from .functional_dictionary import hls_keys, is_builtin, windows_keys
+from .kernels import EWMKernel
+
+
+class _ColumnState:
+    def __init__(self, halflives: Sequence[float], windows: Sequence[int], regression_windows: Sequence[int]):
+        """
+        Incremental state of one series: EWM sums per half-life, a ring buffer of the most
+        recent observations and anchored rolling regression sums per window.
+        """
+        self.halflives = list(halflives)
+        self.decays = np.array([EWMKernel.decay(hl) for hl in halflives])
+        # Rows: weighted sum of observations, of squared negative parts, and of the validity mask.
+        self.ewm_sums = np.zeros((3, len(halflives)))
+        self.capacity = max([*windows, *regression_windows, 1])
+        self.buffer = np.full(self.capacity, np.nan)
+        self.n_seen = 0
+        self.last = math.nan
+        self.abs_change = math.nan
+        self.prev_abs_change = math.nan
+        # Per window: sum(d), sum(j * d) over window positions j, sum(d ** 2) and the NaN count, of
+        # the deviations d = y - anchor. Like the batch kernels, the anchor is the window median,
+        # reset on every sync, so the sums stay small on high price levels and long streams.
+        self.regression = {w: np.zeros(4) for w in regression_windows}
+        self.anchors = {w: 0.0 for w in regression_windows}
+        self._since_sync = 0
+
+    def update(self, x: float) -> None:
+        valid = not math.isnan(x)
+        filled = x if valid else 0.0
+        self.ewm_sums = self.decays * self.ewm_sums + np.array([[filled], [min(filled, 0.0) ** 2], [float(valid)]])
+
+        self.prev_abs_change, self.abs_change = self.abs_change, abs(x - self.last)
+        self.last = x
+
+        for w, sums in self.regression.items():
+            anchor = self.anchors[w]
+            deviation = x - anchor if valid else 0.0
+            if self.n_seen >= w:
+                oldest = self.buffer[(self.n_seen - w) % self.capacity]
+                oldest_deviation = 0.0 if math.isnan(oldest) else oldest - anchor
+                sums[1] += (w - 1) * deviation - (sums[0] - oldest_deviation)
+                sums[0] += deviation - oldest_deviation
+                sums[2] += deviation ** 2 - oldest_deviation ** 2
+                sums[3] += (not valid) - math.isnan(oldest)
+            else:
+                sums[1] += self.n_seen * deviation
+                sums[0] += deviation
+                sums[2] += deviation ** 2
+                sums[3] += not valid
+
+        self.buffer[self.n_seen % self.capacity] = x
+        self.n_seen += 1
+        self._since_sync += 1
+        # Re-deriving the sums from the buffer bounds floating-point drift at O(1) amortized cost.
+        if self._since_sync >= self.capacity:
+            self.sync_regression()
+
+    def sync_regression(self) -> None:
+        for w, sums in self.regression.items():
+            values = self.window(w)
+            if values is None:
+                continue
+            missing = np.isnan(values)
+            anchor = 0.0 if missing.all() else float(np.median(values[~missing]))
+            filled = np.where(missing, 0.0, values - anchor)
+            self.anchors[w] = anchor
+            sums[:] = [filled.sum(), np.arange(w) @ filled, filled @ filled, missing.sum()]
+        self._since_sync = 0
+
+    def warm_up(self, values: np.ndarray) -> None:
+        """
+        Set the state as if ``values`` had been passed to ``update`` one by one, using the
+        vectorized kernels instead of a per-observation loop.
+        """
+        if len(values) == 0:
+            return
+        if self.halflives:
+            kernel = EWMKernel(values)
+            for i, hl in enumerate(self.halflives):
+                self.ewm_sums[:, i] = kernel.sums(hl)[:, -1]
+        tail = values[-self.capacity:]
+        self.buffer[:] = np.nan
+        self.n_seen = len(values)
+        self.buffer[np.arange(self.n_seen - len(tail), self.n_seen) % self.capacity] = tail
+        self.last = values[-1]
+        changes = np.abs(np.diff(values[-3:]))
+        self.abs_change = changes[-1] if len(changes) else math.nan
+        self.prev_abs_change = changes[-2] if len(changes) > 1 else math.nan
+        self.sync_regression()
+
+    def window(self, w: int) -> Optional[np.ndarray]:
+        if self.n_seen < w:
+            return None
+        return self.buffer[np.arange(self.n_seen - w, self.n_seen) % self.capacity]
+
+    def ewm(self, i: int) -> Tuple[float, float]:
+        num, neg, den = self.ewm_sums[:, i]
+        if den <= 0:
+            return math.nan, math.nan
+        return num / den, math.sqrt(neg / den)
+
+    def segment(self, w: int, start: int, stop: int) -> Tuple[float, float]:
+        values = self.window(w)
+        if values is None or np.isnan(values).any():
+            return math.nan, math.nan
+        segment = values[start:stop]
+        mean = segment.mean() if len(segment) else math.nan
+        std = segment.std(ddof=1) if len(segment) > 1 else math.nan
+        return mean, std
+
+    def fit(self, w: int) -> Tuple[float, float, float]:
+        s_d, s_jd, s_dd, n_nan = self.regression[w]
+        anchor = self.anchors[w]
+        if self.n_seen < w or n_nan > 0:
+            return math.nan, math.nan, math.nan
+        if w == 1:
+            return 0.0, s_d + anchor, math.nan
+        # The slope and r2 do not depend on the anchor; only the intercept is shifted back.
+        x_mean = (w - 1) / 2
+        covariance = s_jd - x_mean * s_d
+        slope = covariance / (w * (w ** 2 - 1) / 12)
+        total = max(s_dd - s_d ** 2 / w, 0.0)
+        r2 = slope * covariance / total if total > 0 else math.nan
+        return slope, s_d / w + anchor - slope * x_mean, r2
+
+
+def _log_dd(state: _ColumnState, i: int) -> float:
+    dd = state.ewm(i)[1]
+    return math.log(1e-20 if dd == 0 else dd)
+
+
+def _sortino(state: _ColumnState, i: int) -> float:
+    mean, dd = state.ewm(i)
+    return mean / (1e-20 if dd == 0 else dd)
+
+
+# Streaming equivalents of the functional_dictionary entries; halflife features receive the
+# position of their half-life, window features the window length.
+_stream_functions: Dict[str, Callable[..., float]] = {
+    "obs": lambda s: s.last,
+    "ab_ch": lambda s: s.abs_change,
+    "ab_pr_ch": lambda s: s.prev_abs_change,
+    "exp_do": lambda s, i: s.ewm(i)[1],
+    "ewm_me": lambda s, i: s.ewm(i)[0],
+    "log_exp_do": _log_dd,
+    "ewm_sor": _sortino,
+    "cen_me": lambda s, w: s.segment(w, 0, w)[0],
+    "cen_std": lambda s, w: s.segment(w, 0, w)[1],
+    "le_me": lambda s, w: s.segment(w, 0, w // 2)[0],
+    "le_std": lambda s, w: s.segment(w, 0, w // 2)[1],
+    "ri_me": lambda s, w: s.segment(w, w // 2, w)[0],
+    "ri_std": lambda s, w: s.segment(w, w // 2, w)[1],
+    "slope": lambda s, w: s.fit(w)[0],
+    "intercept": lambda s, w: s.fit(w)[1],
+    "r2": lambda s, w: s.fit(w)[2],
+    "mean_difference": lambda s, w: s.segment(w, w // 2, w)[0] - s.segment(w, 0, w // 2)[0],
+}
+_regression_keys = {"slope", "intercept", "r2"}
+
+_FeatureSpec = List[Tuple[str, Callable[[_ColumnState], float]]]
+
+
+class StreamingFeatureEngine:
+    def __init__(self, collector: BaseCollector, from_prices: bool = False):
+        """
+        Incremental counterpart of running ``collector.collect`` on an ever-growing series.
+
+        Each column keeps its own state, so appending an observation updates the newest
+        feature row in O(window) time for window features and O(1) for half-life and slope
+        features; the row matches the last row of the batch collector output on the full
+        history. Clipping and scaling are not applied, since they depend on the whole sample.
+
+        Supported collectors: ``HalfLifeCollector``, ``WindowedCollector`` and ``CustomCollector``
+        with ``functional_dictionary`` keys.
+
+        :param collector: Collector whose features are reproduced.
+        :param from_prices: If True, observations are prices and features are computed on their
+            percentage changes, as ``FeatureEngineer`` does by default.
+        """
+        self.collector = collector
+        self.from_prices = from_prices
+        self._states: Dict[Hashable, _ColumnState] = {}
+        self._specs: Dict[Hashable, _FeatureSpec] = {}
+        self._last_price: Dict[Hashable, float] = {}
+
+    def _spec(self, column: Hashable) -> Tuple[List[float], List[int], List[int], _FeatureSpec]:
+        collector = self.collector
+        if isinstance(collector, HalfLifeCollector):
+            hls = list(collector._halflives())
+            spec = []
+            for i, hl in enumerate(hls):
+                spec += [
+                    (f"ret_{hl}", lambda s, i=i: s.ewm(i)[0]),
+                    (f"DD-log_{hl}", lambda s, i=i: _log_dd(s, i)),
+                    (f"sortino_{hl}", lambda s, i=i: _sortino(s, i)),
+                ]
+            return hls, [], [], spec
+
+        if isinstance(collector, WindowedCollector):
+            windows = list(collector._windows())
+            spec = [
+                ("observation", _stream_functions["obs"]),
+                ("abs_change", _stream_functions["ab_ch"]),
+                ("prev_abs_change", _stream_functions["ab_pr_ch"]),
+            ]
+            names = [("centered_mean", "cen_me"), ("centered_std", "cen_std"), ("left_mean", "le_me"),
+                     ("left_std", "le_std"), ("right_mean", "ri_me"), ("right_std", "ri_std")]
+            for w in windows:
+                spec += [(f"{name}_{w}", lambda s, f=_stream_functions[key], w=w: f(s, w)) for name, key in names]
+            return [], windows, [], spec
+
+        if isinstance(collector, CustomCollector):
+            params = collector.feat_params
+            func_keys = list(params.get("function_list", []))
+            # Built-in keys re-registered with other functions have no streaming equivalent.
+            unsupported = [key for key in func_keys if key not in _stream_functions or not is_builtin(key)]
+            if not func_keys or unsupported:
+                raise ValueError(f"Unsupported streaming feature keys: {unsupported or func_keys}")
+            hls = list(params.get("halflives", [5, 20, 60])) if set(hls_keys) & set(func_keys) else []
+            windows = list(params.get("windows", [6, 12])) if set(windows_keys) & set(func_keys) else []
+            prefix = column if column is not None else "main"
+            spec = []
+            for key in func_keys:
+                func = _stream_functions[key]
+                if key in hls_keys:
+                    spec += [(f"{prefix}_{key}_{hl}", lambda s, f=func, i=i: f(s, i)) for i, hl in enumerate(hls)]
+                elif key in windows_keys:
+                    spec += [(f"{prefix}_{key}_{w}", lambda s, f=func, w=w: f(s, w)) for w in windows]
+                else:
+                    spec.append((f"{prefix}_{key}", func))
+            regression_windows = windows if _regression_keys & set(func_keys) else []
+            return hls, windows, regression_windows, spec
+
+        raise TypeError(f"Streaming is not supported for {type(collector).__name__}.")
+
+    def _state(self, column: Hashable) -> _ColumnState:
+        if column not in self._states:
+            hls, windows, regression_windows, spec = self._spec(column)
+            self._states[column] = _ColumnState(hls, windows, regression_windows)
+            self._specs[column] = spec
+        return self._states[column]
+
+    def feature_names(self, column: Hashable) -> List[str]:
+        """
+        :param column: Column identifier.
+        :return: Feature names produced for the column, in batch collector order.
+        """
+        self._state(column)
+        return [name for name, _ in self._specs[column]]
+
+    def warm_up(self, history: pd.Series | pd.DataFrame) -> None:
+        """
+        Initialize the state of one or more columns from their history.
+
+        :param history: Series named by its column, or DataFrame with one column per series.
+        """
+        frame = history.to_frame() if isinstance(history, pd.Series) else history
+        for column in frame.columns:
+            values = frame[column].to_numpy(dtype=float)
+            if self.from_prices:
+                if len(values):
+                    self._last_price[column] = values[-1]
+                values = values[1:] / values[:-1] - 1.0
+            self._states.pop(column, None)
+            self._state(column).warm_up(values)
+
+    def update(self, column: Hashable, timestamp: Hashable, value: float) -> Optional[pd.Series]:
+        """
+        Append one observation and return the newest feature row.
+
+        :param column: Column identifier.
+        :param timestamp: Timestamp of the observation, used as the name of the row.
+        :param value: New observation (a price when ``from_prices`` is set).
+        :return: Series of features indexed by feature name, or ``None`` for the first price
+            of a column in ``from_prices`` mode.
+        """
+        value = float(value)
+        if self.from_prices:
+            previous = self._last_price.get(column)
+            self._last_price[column] = value
+            if previous is None:
+                return None
+            value = value / previous - 1.0
+
+        state = self._state(column)
+        state.update(value)
+        spec = self._specs[column]
+        return pd.Series([func(state) for _, func in spec], index=[name for name, _ in spec],
+                         name=timestamp, dtype=float)
+
+    def update_bar(self, timestamp: Hashable, values: Mapping[Hashable, float]) -> Dict[Hashable, pd.Series]:
+        """
+        Append one observation for each of several columns.
+
+        :param timestamp: Timestamp of the bar.
+        :param values: Mapping from column to its new observation.
+        :return: Dict mapping each column to its newest feature row (columns without a row are omitted).
+        """
+        rows = {column: self.update(column, timestamp, value) for column, value in values.items()}
+        return {column: row for column, row in rows.items() if row is not None}
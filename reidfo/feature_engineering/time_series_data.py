@@ -1,6 +1,8 @@
 import datetime as dt
 import pandas as pd
 
+from reidfo.core.dtypes import as_float
+
 
 # reviewed
 class TimeSeriesData:
@@ -8,9 +10,10 @@ class TimeSeriesData:
         """
         :param series: Time series indexed by date.
         :param feature_matrix: Feature matrix indexed by date with one column per feature.
+            Floating columns of both are cast to the package-wide float dtype.
         """
-        self.series = series
-        self.feature_matrix = feature_matrix
+        self.series = as_float(series)
+        self.feature_matrix = as_float(feature_matrix)
 
         if not self.series.index.equals(self.feature_matrix.index):
             raise ValueError("Series and feature matrix must have matching indices.")
@@ -1,6 +1,12 @@
 import numpy as np
 import pandas as pd
 
+from .kernels import PrefixSumKernel, RollingRegressionKernel
+
+
+def _like(values: np.ndarray, series: pd.Series) -> pd.Series:
+    return pd.Series(values, index=series.index, name=series.name)
+
 
 # reviewed
 def compute_downside_deviation(series: pd.Series, halflife: float) -> pd.Series:
@@ -124,9 +130,8 @@ def compute_left_mean(series: pd.Series, window: int) -> pd.Series:
     :return: Left-half rolling mean series.
     """
     half_window = window // 2
-    return series.rolling(window=window, min_periods=window).apply(
-        lambda values: np.mean(values[:half_window]), raw=True
-    )
+    kernel = PrefixSumKernel(series.to_numpy(dtype=float))
+    return _like(kernel.mean(window, 0, half_window), series)
 
 
 # reviewed
@@ -139,9 +144,8 @@ def compute_left_std(series: pd.Series, window: int) -> pd.Series:
     :return: Left-half rolling standard deviation series.
     """
     half_window = window // 2
-    return series.rolling(window=window, min_periods=window).apply(
-        lambda values: np.std(values[:half_window], ddof=1), raw=True
-    )
+    kernel = PrefixSumKernel(series.to_numpy(dtype=float))
+    return _like(kernel.std(window, 0, half_window), series)
 
 
 # reviewed
@@ -154,9 +158,8 @@ def compute_right_mean(series: pd.Series, window: int) -> pd.Series:
     :return: Right-half rolling mean series.
     """
     half_window = window // 2
-    return series.rolling(window=window, min_periods=window).apply(
-        lambda values: np.mean(values[half_window:]), raw=True
-    )
+    kernel = PrefixSumKernel(series.to_numpy(dtype=float))
+    return _like(kernel.mean(window, half_window, window), series)
 
 
 # reviewed
@@ -169,9 +172,8 @@ def compute_right_std(series: pd.Series, window: int) -> pd.Series:
     :return: Right-half rolling standard deviation series.
     """
     half_window = window // 2
-    return series.rolling(window=window, min_periods=window).apply(
-        lambda values: np.std(values[half_window:], ddof=1), raw=True
-    )
+    kernel = PrefixSumKernel(series.to_numpy(dtype=float))
+    return _like(kernel.std(window, half_window, window), series)
 
 
 def compute_slope(series: pd.Series, window: int) -> pd.Series:
@@ -182,11 +184,30 @@ def compute_slope(series: pd.Series, window: int) -> pd.Series:
     :param window: Rolling window length.
     :return: Rolling slope series.
     """
-    def slope(values):
-        if len(values) < 2:
-            return 0.0
-        x_values = np.arange(len(values))
-        slope_value, _ = np.polyfit(x_values, values, 1)
-        return slope_value
+    kernel = RollingRegressionKernel(series.to_numpy(dtype=float))
+    return _like(kernel.fit(window)["slope"], series)
+
+
+def compute_intercept(series: pd.Series, window: int) -> pd.Series:
+    """
+    Compute the intercept of the best-fit line over each rolling window, measured at the
+    first observation of the window.
+
+    :param series: Input time series.
+    :param window: Rolling window length.
+    :return: Rolling intercept series.
+    """
+    kernel = RollingRegressionKernel(series.to_numpy(dtype=float))
+    return _like(kernel.fit(window)["intercept"], series)
+
+
+def compute_r_squared(series: pd.Series, window: int) -> pd.Series:
+    """
+    Compute the coefficient of determination of the best-fit line over each rolling window.
 
-    return series.rolling(window=window, min_periods=window).apply(slope, raw=True)
+    :param series: Input time series.
+    :param window: Rolling window length.
+    :return: Rolling R-squared series; NaN where the window is constant.
+    """
+    kernel = RollingRegressionKernel(series.to_numpy(dtype=float))
+    return _like(kernel.fit(window)["r2"], series)
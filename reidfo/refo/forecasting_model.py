@@ -3,6 +3,7 @@ from typing import Optional
 
 import pandas as pd
 
+from reidfo.core.dtypes import as_float, as_labels
 from reidfo.core.validation_utils import check_index_is_datetime, check_columns_are_strings
 
 
@@ -14,11 +15,12 @@ class ForecastingModel(ABC):
         :param feature_matrix: DataFrame with a datetime index and string column names;
             rows are timestamps, columns are separate time series.
         :param labels: Target labels indexed by the same datetime index as ``feature_matrix``.
+            Integer labels are stored as ``int8``, floating features in the package-wide float dtype.
         :param seed: Random seed for reproducibility.
         :raises ValueError: If index is not datetime, columns are not strings, or index alignment fails.
         """
-        self.feature_matrix = feature_matrix.copy()
-        self.labels = labels.copy()
+        self.feature_matrix = as_float(feature_matrix, copy=True)
+        self.labels = as_labels(labels.copy())
         self.seed = seed
 
         check_index_is_datetime(self.feature_matrix)
@@ -4,6 +4,7 @@ import pandas as pd
 from loguru import logger
 from xgboost import XGBClassifier
 
+from reidfo.core.dtypes import as_float, as_labels
 from .forecasting_model import ForecastingModel
 
 
@@ -66,7 +67,7 @@ class XGBoostModel(ForecastingModel):
         :raises AssertionError: If the model has not been trained yet.
         """
         assert self._trained, "Model not trained yet!"
-        probs = self.model.predict_proba(feature_matrix.values)
+        probs = self.model.predict_proba(as_float(feature_matrix).values)
         self._forecasted_probabilities.extend(probs.tolist())
         logger.debug(f"Probabilities: {self._forecasted_probabilities}")
         prob_df = pd.DataFrame(self._forecasted_probabilities)
@@ -75,7 +76,7 @@ class XGBoostModel(ForecastingModel):
         self._forecasted_probabilities = prob_df.values.tolist()
         n_rows = feature_matrix.shape[0]
         preds = prob_df.iloc[-n_rows:, :].values.argmax(axis=1)
-        return pd.Series(preds[:-1], index=feature_matrix.index[1:])
+        return as_labels(pd.Series(preds[:-1], index=feature_matrix.index[1:]))
 
     def get_model_params(self) -> Optional[dict]:
         """
@@ -1,3 +1,8 @@
 from .abstract import RegimeModel
+from .batch import fit_regimes_batch
 from .jump_model import StatisticalJumpModel
+from .jump_solver import JumpSolver
+from .online import OnlineRegimeFilter
 from .regime_stats import RegimeStats
+from .penalty_search import information_criterion, search_jump_penalty
+from .walk_forward import WalkForwardEngine
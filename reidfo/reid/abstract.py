@@ -3,6 +3,7 @@ from typing import Optional
 
 import pandas as pd
 
+from reidfo.core.dtypes import as_float
 from reidfo.core.validation_utils import check_columns_are_strings, check_index_is_datetime
 
 
@@ -16,11 +17,12 @@ class RegimeModel(ABC):
 
         :param time_series: Series indexed by datetime.
         :param feature_matrix: DataFrame with a datetime index and string column names.
+            Floating data of both inputs is stored in the package-wide float dtype.
         :param seed: Random seed for reproducibility.
         :raises ValueError: If index is not datetime or columns are not strings.
         """
-        self.time_series = time_series.copy()
-        self.feature_matrix = feature_matrix.copy()
+        self.time_series = as_float(time_series, copy=True)
+        self.feature_matrix = as_float(feature_matrix, copy=True)
         self.seed = seed
         self._labels: Optional[pd.Series] = None
         self._fitted = False
@@ -0,0 +1,132 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from jumpmodels.jump import JumpModel
+from numpy.random import RandomState
+
+from reidfo.core.dtypes import LABEL_DTYPE, get_float_dtype
+from reidfo.feature_engineering.parallel import read_shared, share_panel
+from .jump_solver import JumpSolver
+
+# Per-process state populated once by ``_init_worker``; tasks only carry asset positions.
+_WORKER_STATE: Dict[str, Any] = {}
+
+MISSING_LABEL = -1
+
+
+def _init_worker(feature_shm: str, return_shm: str, shape: Tuple[int, int, int], params: Dict[str, Any]) -> None:
+    _WORKER_STATE.update(params, feature_shm=feature_shm, return_shm=return_shm, shape=shape, n_features=shape[2])
+
+
+def _fit_worker_assets(positions: range) -> List[Tuple[np.ndarray, np.ndarray]]:
+    # Tasks are contiguous ranges of assets; only their columns are read from shared memory.
+    state = _WORKER_STATE
+    n_obs, n_assets, n_features = state["shape"]
+    start, stop = positions.start, positions.stop
+    features = read_shared(state["feature_shm"], (n_obs, n_assets * n_features),
+                           (slice(None), slice(start * n_features, stop * n_features)))
+    returns = read_shared(state["return_shm"], (n_obs, n_assets), (slice(None), slice(start, stop)))
+    return _fit_assets(dict(state, features=features, returns=returns), range(stop - start))
+
+
+def _fit_assets(state: Dict[str, Any], positions: Sequence[int]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    n_features = state["n_features"]
+    results = []
+    for i in positions:
+        X = state["features"][:, i * n_features:(i + 1) * n_features]
+        ret = state["returns"][:, i]
+        # Assets are fitted on the rows where all of their inputs are observed.
+        rows = np.flatnonzero(~np.isnan(X).any(axis=1) & ~np.isnan(ret))
+        labels = np.full(len(X), MISSING_LABEL, dtype=LABEL_DTYPE)
+        if len(rows) < state["n_regimes"]:
+            results.append((labels, np.full((state["n_regimes"], n_features), np.nan)))
+            continue
+
+        if state["backend"] == "native":
+            model = JumpSolver(n_components=state["n_regimes"], jump_penalty=state["jump_penalty"],
+                               random_state=state["seed"])
+        else:
+            model = JumpModel(n_components=state["n_regimes"], jump_penalty=state["jump_penalty"],
+                              random_state=state["seed"])
+        model.fit(X[rows], ret[rows], sort_by=state["sort_by"])
+        labels[rows] = np.asarray(model.labels_)
+        results.append((labels, np.asarray(model.centers_)))
+    return results
+
+
+def fit_regimes_batch(returns: pd.DataFrame,
+                      features: pd.DataFrame,
+                      n_regimes: int = 2,
+                      jump_penalty: float = 0.0,
+                      sort_by: Optional[Literal["cumret", "vol", "freq", "ret"]] = "cumret",
+                      seed: Optional[RandomState | int] = 42,
+                      backend: Literal["jumpmodels", "native"] = "jumpmodels",
+                      n_jobs: int = 1,
+                      chunksize: Optional[int] = None) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Fit one discrete jump model per asset of a panel.
+
+    Unlike one ``StatisticalJumpModel`` per asset, the panel is validated and converted once,
+    and every fit runs on array slices of it. With ``n_jobs > 1`` the feature and return panels
+    are placed in shared memory and the assets are split over a process pool.
+
+    :param returns: (T x N) returns with one column per asset, e.g. ``FeatureEngineer.returns_df``.
+    :param features: Feature panel with the same index and (asset, feature) MultiIndex columns,
+        e.g. ``FeatureEngineer.get_data_many(..., stacked=True)``. Every asset needs the same features.
+    :param n_regimes: Number of regimes.
+    :param jump_penalty: Penalty controlling regime-switch frequency.
+    :param sort_by: Regime sorting within every asset, as in ``jumpmodels.JumpModel.fit``.
+    :param seed: Random state of every fit.
+    :param backend: ``"jumpmodels"`` for ``JumpModel`` or ``"native"`` for ``JumpSolver``, which
+        starts from the same initializations and gives the same fits, faster.
+    :param n_jobs: Number of worker processes; 1 fits in the calling process.
+    :param chunksize: Number of assets per task; defaults to spreading the assets evenly over the workers.
+    :return: Tuple of the (T x N) ``int8`` label panel, with ``-1`` where an asset has missing
+        inputs, and the (N, K, F) array of per-asset centroids.
+    :raises ValueError: If the indices or assets differ, or the assets do not share their features.
+    """
+    if not isinstance(features.columns, pd.MultiIndex):
+        raise ValueError("features must have (asset, feature) MultiIndex columns.")
+    if not features.index.equals(returns.index):
+        raise ValueError("Index mismatch: 'features' and 'returns' must have identical indices.")
+    if backend not in ("jumpmodels", "native"):
+        raise ValueError("backend must be one of: ['jumpmodels', 'native']")
+    assets = returns.columns
+    if set(features.columns.get_level_values(0)) != set(assets):
+        raise ValueError("features and returns must cover the same assets.")
+    feature_names = features[assets[0]].columns
+    layout = pd.MultiIndex.from_product([assets, feature_names])
+    if len(layout) != features.shape[1] or not layout.isin(features.columns).all():
+        raise ValueError("Every asset must have the same features.")
+    features = features.reindex(columns=layout)
+
+    params = {"n_regimes": n_regimes, "jump_penalty": jump_penalty, "sort_by": sort_by,
+              "seed": seed, "backend": backend}
+    shape = (len(returns), len(assets), len(feature_names))
+    if n_jobs == 1:
+        state = dict(params, n_features=len(feature_names),
+                     features=features.to_numpy(dtype=float), returns=returns.to_numpy(dtype=float))
+        results = _fit_assets(state, range(len(assets)))
+    else:
+        chunksize = chunksize or max(1, -(-len(assets) // n_jobs))
+        tasks = [range(start, min(start + chunksize, len(assets))) for start in range(0, len(assets), chunksize)]
+        feature_shm, _ = share_panel(features)
+        return_shm, _ = share_panel(returns)
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs,
+                                     initializer=_init_worker,
+                                     initargs=(feature_shm.name, return_shm.name, shape, params)) as pool:
+                results = [result for chunk in pool.map(_fit_worker_assets, tasks) for result in chunk]
+        finally:
+            for shm in (feature_shm, return_shm):
+                shm.close()
+                shm.unlink()
+
+    labels = np.empty((len(returns), len(assets)), dtype=LABEL_DTYPE)
+    centers = np.empty((len(assets), n_regimes, len(feature_names)), dtype=get_float_dtype())
+    for i, (asset_labels, asset_centers) in enumerate(results):
+        labels[:, i] = asset_labels
+        centers[i] = asset_centers
+    return pd.DataFrame(labels, index=returns.index, columns=assets, copy=False), centers
@@ -1,10 +1,13 @@
 from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
 from jumpmodels.jump import JumpModel
 from numpy.random import RandomState
 
+from reidfo.core.dtypes import as_float, as_labels
 from .abstract import RegimeModel
+from .jump_solver import JumpSolver
 
 
 class StatisticalJumpModel(RegimeModel):
@@ -16,7 +19,8 @@ class StatisticalJumpModel(RegimeModel):
                  cont: bool = False,
                  prob: bool = False,
                  jump_penalty: float = 0.0,
-                 seed: Optional[RandomState | int] = 42):
+                 seed: Optional[RandomState | int] = 42,
+                 backend: Literal["jumpmodels", "native"] = "jumpmodels"):
         """
         Initialize a jump-based regime model.
 
@@ -30,7 +34,11 @@ class StatisticalJumpModel(RegimeModel):
         :param prob: Reserved for probabilistic predictions.
         :param jump_penalty: Penalty controlling regime-switch frequency.
         :param seed: Random state for reproducibility.
-        :raises ValueError: If ``feature_matrix`` and ``time_series`` indices differ.
+        :param backend: ``"jumpmodels"`` fits ``jumpmodels.JumpModel``; ``"native"`` fits the
+            batched NumPy ``JumpSolver`` (discrete models only), which draws the same k-means++
+            initializations from ``seed`` and reaches the same solution.
+        :raises ValueError: If ``feature_matrix`` and ``time_series`` indices differ, or the
+            backend is unknown or does not support ``cont``.
         """
         super().__init__(time_series, feature_matrix, seed)
         self.returns = self.time_series
@@ -43,8 +51,20 @@ class StatisticalJumpModel(RegimeModel):
         self.cont = cont
         self.prob = prob
         self.jump_penalty = jump_penalty
+        if backend not in ("jumpmodels", "native"):
+            raise ValueError("backend must be one of: ['jumpmodels', 'native']")
+        if backend == "native" and cont:
+            raise ValueError("The native backend only supports discrete jump models.")
+        self.backend = backend
 
-        self.jm: Optional[JumpModel] = None
+        self.jm: Optional[JumpModel | JumpSolver] = None
+
+    @property
+    def centers_(self) -> Optional[np.ndarray]:
+        """
+        :return: Fitted regime centroids of shape (n_regimes, n_features), or ``None`` before ``fit``.
+        """
+        return None if self.jm is None else self.jm.centers_
 
     def _sort_labels_by_mean(self, labels: pd.Series) -> pd.Series:
         regime_means = self.returns.groupby(labels).mean()
@@ -52,24 +72,52 @@ class StatisticalJumpModel(RegimeModel):
         label_map = {old: new for new, old in enumerate(sorted_regimes)}
         return labels.map(label_map)
 
-    def fit(self) -> None:
+    def fit(self, init_centers: Optional[np.ndarray] = None, n_init: Optional[int] = None) -> None:
         """
         Fit the underlying ``JumpModel`` on the training feature matrix and return series.
+
+        A warm fit (``init_centers`` given) runs coordinate descent from those centroids alone
+        by default, which usually takes a few iterations instead of ``n_init`` full runs. It
+        finds the local optimum next to the given centroids: when they come from similar data
+        (a neighbouring penalty or an earlier window) this is typically the cold-fit solution,
+        but the labels and objective can differ from a cold fit, which keeps the best of
+        several k-means++ starts.
+
+        :param init_centers: Optional regime centroids of shape (n_regimes, n_features), e.g.
+            from a fit with a neighbouring penalty or an earlier window.
+        :param n_init: Number of k-means++ initializations; defaults to 10 for a cold fit and
+            to 0 (the given centroids only) for a warm fit.
+        :raises ValueError: If ``init_centers`` has the wrong shape, or there is no initialization.
         """
-        self.jm = JumpModel(
-            n_components=self.n_regimes,
-            jump_penalty=self.jump_penalty,
-            cont=self.cont,
-            random_state=self.seed,
-        )
+        if n_init is None:
+            n_init = 10 if init_centers is None else 0
+        if init_centers is not None:
+            init_centers = np.asarray(init_centers, dtype=float)
+            if init_centers.shape != (self.n_regimes, self.feature_matrix.shape[1]):
+                raise ValueError("init_centers must have shape (n_regimes, n_features).")
+        elif n_init < 1:
+            raise ValueError("A cold fit needs at least one k-means++ initialization.")
+        if self.backend == "native":
+            self.jm = JumpSolver(n_components=self.n_regimes, jump_penalty=self.jump_penalty,
+                                 random_state=self.seed, n_init=n_init)
+        else:
+            self.jm = JumpModel(
+                n_components=self.n_regimes,
+                jump_penalty=self.jump_penalty,
+                cont=self.cont,
+                random_state=self.seed,
+                n_init=n_init,
+            )
+        if init_centers is not None:
+            # Both backends add existing centers of matching shape to their initializations.
+            self.jm.centers_ = init_centers
         sort_arg = None if self.sort_by == "mean" else self.sort_by
         self.jm.fit(self.feature_matrix, self.returns, sort_by=sort_arg)
 
         labels = self.jm.labels_
         if self.sort_by == "mean":
-            self._labels = self._sort_labels_by_mean(labels)
-        else:
-            self._labels = labels
+            labels = self._sort_labels_by_mean(labels)
+        self._labels = as_labels(labels)
         self._fitted = True
 
     def predict(self, feature_matrix: pd.DataFrame) -> pd.Series | pd.DataFrame:
@@ -78,11 +126,11 @@ class StatisticalJumpModel(RegimeModel):
 
         :param feature_matrix: Must share columns with the training matrix and start after the
             last training timestamp.
-        :return: Series of predicted regime labels.
+        :return: Series of predicted regime labels, stored as ``int8``.
         :raises ValueError: If columns or temporal ordering are inconsistent with training.
         """
         super().predict(feature_matrix)
-        labels = self.jm.predict_online(feature_matrix)
+        labels = self.jm.predict_online(as_float(feature_matrix))
         if self.sort_by == "mean":
             labels = self._sort_labels_by_mean(labels)
-        return labels
+        return as_labels(labels)
@@ -0,0 +1,238 @@
+from typing import Literal, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.random import RandomState
+from sklearn.cluster import kmeans_plusplus as _kmeans_plusplus
+from sklearn.utils import check_random_state
+
+SortBy = Optional[Literal["cumret", "vol", "freq", "ret"]]
+
+
+def penalty_matrix(jump_penalty: float, n_regimes: int) -> np.ndarray:
+    """
+    :param jump_penalty: Cost of one regime switch.
+    :param n_regimes: Number of regimes.
+    :return: (K, K) matrix with ``jump_penalty`` off the diagonal and zeros on it.
+    """
+    return jump_penalty * (1.0 - np.eye(n_regimes))
+
+
+def loss_matrix(X: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """
+    Half squared Euclidean distance of every row to every centroid, for a batch of centroid sets.
+
+    :param X: (T, F) data matrix.
+    :param centers: (B, K, F) centroids; regimes with NaN centroids get an infinite loss.
+    :return: (B, T, K) loss array.
+    """
+    sq_norms = np.einsum("tf,tf->t", X, X)[None, :, None]
+    cross = np.einsum("tf,bkf->btk", X, np.nan_to_num(centers))
+    center_norms = np.einsum("bkf,bkf->bk", centers, centers)[:, None, :]
+    loss = 0.5 * np.maximum(sq_norms - 2.0 * cross + center_norms, 0.0)
+    return np.where(np.isnan(center_norms), np.inf, loss)
+
+
+def value_matrix(loss: np.ndarray, penalty: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of the dynamic program: ``V[t, k] = L[t, k] + min_j (V[t-1, j] + P[j, k])``.
+    Row ``t`` only depends on rows up to ``t`` and gives the online state estimate.
+
+    :param loss: (..., T, K) loss array.
+    :param penalty: (K, K) penalty matrix.
+    :return: Value array of the same shape as ``loss``.
+    """
+    values = np.empty_like(loss)
+    values[..., 0, :] = loss[..., 0, :]
+    for t in range(1, loss.shape[-2]):
+        values[..., t, :] = loss[..., t, :] + (values[..., t - 1, :, None] + penalty).min(axis=-2)
+    return values
+
+
+def viterbi(loss: np.ndarray, penalty: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Optimal state sequences of a batch of loss arrays, in O(T * K^2) per batch member.
+
+    :param loss: (B, T, K) loss array.
+    :param penalty: (K, K) penalty matrix.
+    :return: (B, T) labels and (B,) optimal objective values.
+    """
+    n_batch, n_obs, _ = loss.shape
+    values = value_matrix(loss, penalty)
+    batch = np.arange(n_batch)
+    labels = np.empty((n_batch, n_obs), dtype=np.intp)
+    labels[:, -1] = values[:, -1].argmin(axis=1)
+    objective = values[batch, -1, labels[:, -1]]
+    for t in range(n_obs - 1, 0, -1):
+        labels[:, t - 1] = (values[:, t - 1] + penalty[:, labels[:, t]].T).argmin(axis=1)
+    return labels, objective
+
+
+def update_centers(X: np.ndarray, labels: np.ndarray, n_regimes: int) -> np.ndarray:
+    """
+    Closed-form centroid update: the mean of the rows assigned to each regime.
+
+    :param X: (T, F) data matrix.
+    :param labels: (B, T) labels.
+    :param n_regimes: Number of regimes.
+    :return: (B, K, F) centroids; NaN for regimes without rows.
+    """
+    one_hot = (labels[..., None] == np.arange(n_regimes)).astype(X.dtype)
+    counts = one_hot.sum(axis=1)[..., None]
+    sums = np.einsum("btk,tf->bkf", one_hot, X)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def kmeans_plusplus(X: np.ndarray,
+                    n_regimes: int,
+                    n_init: int,
+                    random_state: Optional[RandomState | int] = None) -> np.ndarray:
+    """
+    k-means++ seeding for ``n_init`` runs, drawn like ``jumpmodels``: scikit-learn's
+    ``kmeans_plusplus`` on one ``RandomState``, so equal seeds give ``JumpModel``'s initial centroids.
+
+    :param X: (T, F) data matrix.
+    :param n_regimes: Number of centroids per run.
+    :param n_init: Number of runs.
+    :param random_state: Seed, ``RandomState`` or None.
+    :return: (n_init, K, F) initial centroids.
+    """
+    random_state = check_random_state(random_state)
+    if n_init == 0:
+        return np.empty((0, n_regimes, X.shape[1]))
+    return np.stack([_kmeans_plusplus(X, n_regimes, random_state=random_state)[0] for _ in range(n_init)])
+
+
+class JumpSolver:
+    def __init__(self,
+                 n_components: int = 2,
+                 jump_penalty: float = 0.0,
+                 random_state: Optional[RandomState | int] = None,
+                 n_init: int = 10,
+                 max_iter: int = 1000,
+                 tol: float = 1e-8):
+        """
+        Discrete statistical jump model solved with NumPy.
+
+        Coordinate descent alternates a dynamic program for the labels (O(T * K^2)) with the
+        closed-form centroid update. All initializations (k-means++ seeds plus any existing
+        ``centers_``) are run as one batch: every step updates all of them with array operations,
+        and runs stop contributing once they converge. The run with the lowest objective is kept.
+        Initializations, stopping rule and the choice of the best run follow ``jumpmodels.JumpModel``,
+        so with the same ``random_state`` both reach the same solution up to floating-point ties.
+        Attribute names and the ``fit`` / ``predict_online`` surface follow it as well.
+
+        :param n_components: Number of regimes.
+        :param jump_penalty: Cost of one regime switch.
+        :param random_state: Seed, ``RandomState`` or None for the k-means++ initializations.
+        :param n_init: Number of k-means++ initializations; 0 starts from an existing
+            ``centers_`` alone.
+        :param max_iter: Maximum number of coordinate-descent iterations.
+        :param tol: Minimum objective decrease for a run to keep iterating.
+        """
+        self.n_components = n_components
+        self.jump_penalty = jump_penalty
+        self.random_state = random_state
+        self.n_init = n_init
+        self.max_iter = max_iter
+        self.tol = tol
+
+    @property
+    def jump_penalty_mx(self) -> np.ndarray:
+        return penalty_matrix(self.jump_penalty, self.n_components)
+
+    def _init_centers(self, X: np.ndarray) -> np.ndarray:
+        centers = kmeans_plusplus(X, self.n_components, self.n_init, self.random_state)
+        previous = getattr(self, "centers_", None)
+        if previous is not None and np.shape(previous) == (self.n_components, X.shape[1]):
+            centers = np.concatenate([centers, np.asarray(previous, dtype=X.dtype)[None]])
+        return centers
+
+    def fit(self,
+            X: pd.DataFrame | np.ndarray,
+            ret_ser: Optional[pd.Series | np.ndarray] = None,
+            sort_by: SortBy = "cumret") -> "JumpSolver":
+        """
+        :param X: (T, F) feature matrix without NaNs.
+        :param ret_ser: Optional returns aligned with ``X``, used to sort the regimes.
+        :param sort_by: Regimes are ordered by decreasing cumulative return (``"cumret"``),
+            decreasing mean return (``"ret"``), increasing volatility (``"vol"``) or decreasing
+            frequency (``"freq"``); None keeps the solver's order. Without returns, regimes are
+            ordered by frequency.
+        :return: This object, with ``centers_``, ``labels_``, ``val_`` and ``n_iter_``.
+        :raises ValueError: If ``X`` contains NaNs.
+        """
+        X_arr = np.asarray(X, dtype=float)
+        if np.isnan(X_arr).any():
+            raise ValueError("Feature matrix contains NaNs.")
+        penalty = self.jump_penalty_mx
+        centers = self._init_centers(X_arr)
+
+        labels, objective = viterbi(loss_matrix(X_arr, centers), penalty)
+        active = np.ones(len(centers), dtype=bool)
+        n_iter = 0
+        while active.any() and n_iter < self.max_iter:
+            n_iter += 1
+            new_centers = update_centers(X_arr, labels[active], self.n_components)
+            new_labels, new_objective = viterbi(loss_matrix(X_arr, new_centers), penalty)
+            improved = ((new_labels != labels[active]).any(axis=1)
+                        & (objective[active] - new_objective > self.tol))
+            # Runs keep the centroids behind their current labels and stop once they converge.
+            positions = np.flatnonzero(active)
+            centers[positions] = new_centers
+            labels[positions] = new_labels
+            objective[positions] = new_objective
+            active[positions[~improved]] = False
+
+        best = int(np.argmin(objective))
+        centers, labels = centers[best], labels[best]
+        order = self._order(labels, ret_ser, sort_by)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        self.centers_ = centers[order]
+        self.val_ = float(objective[best])
+        self.n_iter_ = n_iter
+        labels = rank[labels]
+        self.labels_ = pd.Series(labels, index=X.index) if isinstance(X, pd.DataFrame) else labels
+        return self
+
+    def _order(self, labels: np.ndarray, ret_ser, sort_by: SortBy) -> np.ndarray:
+        counts = np.bincount(labels, minlength=self.n_components).astype(float)
+        if sort_by is None:
+            return np.arange(self.n_components)
+        if ret_ser is None or sort_by == "freq":
+            return np.argsort(-counts, kind="stable")
+        returns = pd.Series(np.asarray(ret_ser, dtype=float)).groupby(labels)
+        if sort_by == "cumret":
+            criterion = -returns.sum()
+        elif sort_by == "ret":
+            criterion = -returns.mean()
+        elif sort_by == "vol":
+            criterion = returns.std()
+        else:
+            raise ValueError("sort_by must be one of: ['cumret', 'vol', 'freq', 'ret'] or None")
+        # Empty regimes have no statistic and are placed last.
+        criterion = criterion.reindex(range(self.n_components)).to_numpy()
+        return np.argsort(criterion, kind="stable")
+
+    def predict(self, X: pd.DataFrame | np.ndarray) -> pd.Series | np.ndarray:
+        """
+        :param X: (T, F) feature matrix.
+        :return: Optimal labels of the whole sequence, which may use later rows.
+        """
+        labels, _ = viterbi(loss_matrix(np.asarray(X, dtype=float), self.centers_[None]), self.jump_penalty_mx)
+        return self._wrap(labels[0], X)
+
+    def predict_online(self, X: pd.DataFrame | np.ndarray) -> pd.Series | np.ndarray:
+        """
+        :param X: (T, F) feature matrix.
+        :return: Labels where row ``t`` only uses rows up to ``t``.
+        """
+        loss = loss_matrix(np.asarray(X, dtype=float), self.centers_[None])[0]
+        return self._wrap(value_matrix(loss, self.jump_penalty_mx).argmin(axis=1), X)
+
+    @staticmethod
+    def _wrap(labels: np.ndarray, X: pd.DataFrame | np.ndarray) -> pd.Series | np.ndarray:
+        return pd.Series(labels, index=X.index) if isinstance(X, pd.DataFrame) else labels
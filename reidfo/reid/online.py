@@ -0,0 +1,140 @@
+from typing import Any, Dict, Hashable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from reidfo.core.dtypes import LABEL_DTYPE
+from .jump_model import StatisticalJumpModel
+
+
+class OnlineRegimeFilter:
+    def __init__(self,
+                 centers: np.ndarray,
+                 jump_penalty: float,
+                 columns: Optional[Sequence[Hashable]] = None,
+                 label_map: Optional[Sequence[int]] = None):
+        """
+        Stateful counterpart of ``predict_online``: keeps the cost vector of the jump-model dynamic
+        program from the last row, so every new feature row costs O(K * F) instead of a pass
+        over the whole history.
+
+        With a constant jump penalty, the DP step ``min_j (V[j] + P[j, k])`` reduces to
+        ``min(V[k], min(V) + penalty)``. The cost vector is kept relative to its minimum, which
+        leaves every label unchanged and keeps it bounded on long streams.
+
+        :param centers: (K, F) regime centroids of a fitted model.
+        :param jump_penalty: Jump penalty of the fitted model.
+        :param columns: Optional feature names; Series and mapping rows are ordered by them.
+        :param label_map: Optional relabelling of the centroid order, e.g. the post-fit sorting
+            of ``StatisticalJumpModel(sort_by="mean")``.
+        """
+        self.centers = np.asarray(centers, dtype=float)
+        if self.centers.ndim != 2:
+            raise ValueError("centers must be a 2-D array of shape (n_regimes, n_features).")
+        self.jump_penalty = float(jump_penalty)
+        self.columns = None if columns is None else list(columns)
+        if self.columns is not None and len(self.columns) != self.centers.shape[1]:
+            raise ValueError("columns must name every feature of centers.")
+        self.label_map = np.arange(len(self.centers)) if label_map is None else np.asarray(label_map)
+        self.values: Optional[np.ndarray] = None
+        self.n_seen = 0
+
+    @classmethod
+    def from_model(cls, model: StatisticalJumpModel) -> "OnlineRegimeFilter":
+        """
+        :param model: Fitted discrete ``StatisticalJumpModel`` (either backend).
+        :return: Filter with the model's centroids, penalty and feature names, and an empty state.
+        :raises ValueError: If the model is not fitted or continuous.
+        """
+        if model.centers_ is None:
+            raise ValueError("Model must be fitted before streaming predictions.")
+        if model.cont:
+            raise ValueError("Online filtering only supports discrete jump models.")
+        label_map = None
+        if model.sort_by == "mean":
+            raw = np.asarray(model.jm.labels_)
+            sorted_labels = np.asarray(model.get_training_labels())
+            label_map = np.arange(model.n_regimes)
+            label_map[raw] = sorted_labels
+        return cls(model.centers_, model.jump_penalty, model.feature_matrix.columns, label_map)
+
+    def _row(self, row: pd.Series | Mapping[Hashable, float] | np.ndarray) -> np.ndarray:
+        if isinstance(row, (pd.Series, Mapping)) and self.columns is not None:
+            row = [row[column] for column in self.columns]
+        x = np.asarray(row, dtype=float)
+        if x.shape != self.centers.shape[1:]:
+            raise ValueError(f"Feature row must have {self.centers.shape[1]} values.")
+        if np.isnan(x).any():
+            raise ValueError("Feature row contains NaNs.")
+        return x
+
+    def update(self, row: pd.Series | Mapping[Hashable, float] | np.ndarray) -> int:
+        """
+        Advance the filter by one feature row.
+
+        :param row: Features of the newest observation, as an array in centroid order or a
+            Series / mapping keyed by feature name.
+        :return: Regime label of the row, using only this and earlier rows.
+        :raises ValueError: If the row has the wrong length or contains NaNs.
+        """
+        diff = self.centers - self._row(row)
+        loss = 0.5 * np.einsum("kf,kf->k", diff, diff)
+        if self.values is None:
+            values = loss
+        else:
+            values = loss + np.minimum(self.values, self.jump_penalty)
+        self.values = values - values.min()
+        self.n_seen += 1
+        return int(self.label_map[self.values.argmin()])
+
+    def update_many(self, feature_matrix: pd.DataFrame) -> pd.Series:
+        """
+        Advance the filter over several rows.
+
+        :param feature_matrix: New rows in time order.
+        :return: Series of ``int8`` labels indexed like ``feature_matrix``.
+        """
+        columns = feature_matrix.columns if self.columns is None else self.columns
+        values = feature_matrix[columns].to_numpy(dtype=float)
+        labels = np.array([self.update(x) for x in values], dtype=LABEL_DTYPE)
+        return pd.Series(labels, index=feature_matrix.index)
+
+    @property
+    def label(self) -> Optional[int]:
+        """
+        :return: Current regime label, or ``None`` before the first row.
+        """
+        return None if self.values is None else int(self.label_map[self.values.argmin()])
+
+    def reset(self) -> None:
+        """
+        Forget the streamed history and keep the fitted model.
+        """
+        self.values = None
+        self.n_seen = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        :return: JSON-serializable state: the model (centroids, penalty, feature names, label map)
+            and the cost vector, enough to resume the stream with ``restore``.
+        """
+        return {
+            "centers": self.centers.tolist(),
+            "jump_penalty": self.jump_penalty,
+            "columns": self.columns,
+            "label_map": self.label_map.tolist(),
+            "values": None if self.values is None else self.values.tolist(),
+            "n_seen": self.n_seen,
+        }
+
+    @classmethod
+    def restore(cls, snapshot: Mapping[str, Any]) -> "OnlineRegimeFilter":
+        """
+        :param snapshot: Output of ``snapshot``.
+        :return: Filter that continues exactly where the snapshotted one stopped.
+        """
+        online = cls(snapshot["centers"], snapshot["jump_penalty"], snapshot["columns"], snapshot["label_map"])
+        if snapshot["values"] is not None:
+            online.values = np.asarray(snapshot["values"], dtype=float)
+        online.n_seen = int(snapshot["n_seen"])
+        return online
@@ -0,0 +1,144 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from jumpmodels.jump import JumpModel
+from numpy.random import RandomState
+
+from reidfo.feature_engineering.parallel import read_shared, share_panel
+from .jump_model import StatisticalJumpModel
+
+# Per-process state populated once by ``_init_worker``; tasks only carry a slice of the grid.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(shm_name: str, shape: Tuple[int, int], cont: bool, seed: Optional[RandomState | int]) -> None:
+    _WORKER_STATE.update({"shm_name": shm_name, "shape": shape, "cont": cont, "seed": seed})
+
+
+def _fit_chain(task: Tuple[int, Sequence[float]]) -> List[Dict[str, Any]]:
+    n_regimes, penalties = task
+    state = _WORKER_STATE
+    values = read_shared(state["shm_name"], state["shape"])
+    jm = JumpModel(n_components=n_regimes, cont=state["cont"], random_state=state["seed"])
+    rows = []
+    for i, penalty in enumerate(penalties):
+        # The first fit of a chain uses the k-means++ seeds; every later one starts from the
+        # centers of the previous (smaller) penalty alone, which stay on ``jm``.
+        jm.jump_penalty = penalty
+        jm.n_init = 10 if i == 0 else 0
+        jm.fit(values, sort_by=None)
+        labels = np.asarray(jm.labels_)
+        centers = np.array(jm.centers_)
+        rows.append({
+            "n_regimes": n_regimes,
+            "jump_penalty": penalty,
+            "objective": float(jm.val_),
+            "loss": float(np.sum((values - centers[labels]) ** 2)),
+            "n_switches": int(np.count_nonzero(np.diff(labels))),
+            "centers": centers,
+        })
+    return rows
+
+
+def information_criterion(table: pd.DataFrame, n_obs: int, n_features: int) -> pd.Series:
+    """
+    BIC-style score of each fit: ``n_obs * log(loss / n_obs) + log(n_obs) * (K * F + switches)``,
+    where every regime switch is counted as one additional parameter.
+
+    :param table: Table from ``search_jump_penalty`` with ``loss``, ``n_regimes`` and ``n_switches``.
+    :param n_obs: Number of observations of the feature matrix.
+    :param n_features: Number of features.
+    :return: Series of scores aligned with ``table``; lower is better.
+    """
+    n_params = table["n_regimes"] * n_features + table["n_switches"]
+    with np.errstate(divide="ignore"):
+        return n_obs * np.log(table["loss"] / n_obs) + np.log(n_obs) * n_params
+
+
+def search_jump_penalty(time_series: pd.Series,
+                        feature_matrix: pd.DataFrame,
+                        jump_penalties: Sequence[float],
+                        n_regimes: int | Sequence[int] = 2,
+                        sort_by: Optional[Literal["cumret", "vol", "freq", "ret", "mean"]] = "cumret",
+                        cont: bool = False,
+                        seed: Optional[RandomState | int] = 42,
+                        select: Optional[Callable[[pd.DataFrame], Hashable]] = None,
+                        n_jobs: Optional[int] = None,
+                        chain_length: Optional[int] = None) -> Tuple[pd.DataFrame, StatisticalJumpModel]:
+    """
+    Fit ``StatisticalJumpModel`` over a grid of jump penalties (and regime counts) on a process pool.
+
+    The feature matrix is placed in shared memory once and mapped read-only by every worker.
+    The sorted penalty grid of each regime count is cut into chains of ``chain_length``
+    consecutive penalties; a worker fits a chain in increasing order. The first fit of a chain
+    is a cold fit with k-means++ restarts, and every later fit starts from the centroids of the
+    previous penalty alone, which is cheaper than a cold fit and follows the same regimes along
+    the grid; its objective can be above that of a cold fit. The chains do not depend on
+    ``n_jobs``, so neither does the table. The chosen configuration is refitted in the calling
+    process from its centroids.
+
+    :param time_series: Return series aligned with ``feature_matrix``.
+    :param feature_matrix: Feature matrix with datetime index and string columns.
+    :param jump_penalties: Non-negative penalties to try.
+    :param n_regimes: Number of regimes, or a sequence of regime counts to try.
+    :param sort_by: Regime sorting of the chosen model, as in ``StatisticalJumpModel``.
+    :param cont: If True, fits continuous jump models.
+    :param seed: Random state of every fit.
+    :param select: Callable mapping the result table to the index label of the chosen row;
+        defaults to the row with the lowest ``criterion``.
+    :param n_jobs: Number of worker processes; defaults to the number of CPUs.
+    :param chain_length: Number of consecutive penalties per warm-started chain, the unit of
+        parallel work; defaults to the whole grid of each regime count.
+    :return: Tuple of the result table (one row per fit with ``n_regimes``, ``jump_penalty``,
+        ``objective``, ``loss``, ``n_switches`` and ``criterion``, ordered by regime count and
+        penalty) and the chosen, fitted model.
+    :raises ValueError: If the grid is empty, a penalty is negative or ``chain_length`` is not
+        positive, or if the indices differ.
+    """
+    penalties = sorted(float(p) for p in jump_penalties)
+    regime_counts = [n_regimes] if isinstance(n_regimes, (int, np.integer)) else list(n_regimes)
+    if not penalties or not regime_counts:
+        raise ValueError("jump_penalties and n_regimes must not be empty.")
+    if penalties[0] < 0:
+        raise ValueError("jump_penalties must be non-negative.")
+    if not feature_matrix.index.equals(time_series.index):
+        raise ValueError("Index mismatch: 'feature_matrix' and 'time_series' must have identical indices.")
+
+    if chain_length is not None and chain_length < 1:
+        raise ValueError("chain_length must be a positive integer.")
+
+    n_workers = n_jobs or os.cpu_count() or 1
+    chain_length = chain_length or len(penalties)
+    tasks = [
+        (k, penalties[start:start + chain_length])
+        for k in regime_counts
+        for start in range(0, len(penalties), chain_length)
+    ]
+
+    shm, _ = share_panel(feature_matrix)
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_worker,
+                                 initargs=(shm.name, feature_matrix.shape, cont, seed)) as pool:
+            rows = [row for chain in pool.map(_fit_chain, tasks) for row in chain]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    centers = [row.pop("centers") for row in rows]
+    table = pd.DataFrame(rows)
+    table["criterion"] = information_criterion(table, *feature_matrix.shape)
+    chosen = select(table) if select is not None else table["criterion"].idxmin()
+    position = table.index.get_loc(chosen)
+
+    model = StatisticalJumpModel(time_series, feature_matrix,
+                                 n_regimes=int(table["n_regimes"].iloc[position]),
+                                 sort_by=sort_by,
+                                 cont=cont,
+                                 jump_penalty=float(table["jump_penalty"].iloc[position]),
+                                 seed=seed)
+    model.fit(init_centers=centers[position])
+    return table, model
@@ -0,0 +1,154 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from reidfo.core.data_splitting import DataSplitting
+from reidfo.core.dtypes import as_labels
+from reidfo.feature_engineering.parallel import read_shared, share_panel
+from .abstract import RegimeModel
+from .jump_model import StatisticalJumpModel
+
+# Per-process state populated once by ``_init_worker``; tasks only carry fold positions.
+_WORKER_STATE: Dict[str, Any] = {}
+
+Fold = Tuple[slice, slice]
+
+
+def _init_worker(shm_name: str, shape: Tuple[int, int], state: Dict[str, Any]) -> None:
+    _WORKER_STATE.update(state, shm_name=shm_name, shape=shape)
+
+
+def _run_worker_chain(folds: Sequence[Fold]) -> List[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    # Only the rows up to the chain's last test fold are read; fold slices stay valid on them.
+    rows = slice(0, folds[-1][1].stop)
+    values = read_shared(_WORKER_STATE["shm_name"], _WORKER_STATE["shape"], rows)
+    return _run_chain(dict(_WORKER_STATE, values=values), folds)
+
+
+def _run_chain(state: Dict[str, Any], folds: Sequence[Fold]) -> List[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    values, index, columns = state["values"], state["index"], state["columns"]
+    centers = None
+    results = []
+    for train, test in folds:
+        series = pd.Series(values[train, 0], index=index[train])
+        features = pd.DataFrame(values[train, 1:], index=index[train], columns=columns, copy=False)
+        model = state["model_cls"](series, features, **state["model_params"])
+        if centers is not None:
+            model.fit(init_centers=centers)
+        else:
+            model.fit()
+        if state["warm_start"]:
+            centers = getattr(model, "centers_", None)
+
+        test_features = pd.DataFrame(values[test, 1:], index=index[test], columns=columns, copy=False)
+        labels = model.predict(test_features)
+        results.append((np.asarray(labels), getattr(model, "centers_", None)))
+    return results
+
+
+class WalkForwardEngine:
+    def __init__(self,
+                 time_series: pd.Series,
+                 feature_matrix: pd.DataFrame,
+                 model_cls: Type[RegimeModel] = StatisticalJumpModel,
+                 model_params: Optional[Dict[str, Any]] = None,
+                 freq: str = "ME",
+                 min_train: int = 252,
+                 window: Optional[int] = None,
+                 warm_start: bool = True,
+                 chain_length: Optional[int] = None):
+        """
+        Out-of-sample regime labels from periodic refits on expanding or rolling windows.
+
+        The fold schedule comes from ``DataSplitting.walk_forward_schedule`` on the index: the
+        model is refitted at the first observation of every period and predicts the rows up to
+        the next refit. Features must therefore be computed causally (no full-sample scaling).
+        The feature matrix is converted once and every fold reads its rows from that block.
+
+        With ``warm_start``, the folds are cut into chains of ``chain_length`` consecutive folds.
+        The first fold of a chain is a cold fit; every later refit starts from the previous
+        fold's centroids alone (``fit(init_centers=...)``), which replaces the k-means++ restarts
+        and usually converges in a few iterations. A warm refit follows the regimes of the
+        previous fold, so its labels can differ from a cold fit on the same window. Chains do
+        not depend on ``n_jobs``, so results are the same for any number of workers.
+
+        :param time_series: Return series aligned with ``feature_matrix``.
+        :param feature_matrix: Causal feature matrix with datetime index and string columns.
+        :param model_cls: RegimeModel subclass constructed as
+            ``model_cls(time_series, feature_matrix, **model_params)``.
+        :param model_params: Keyword arguments of ``model_cls``.
+        :param freq: Pandas offset alias of the refit frequency.
+        :param min_train: Minimum number of training rows of the first fold.
+        :param window: Optional length of a rolling training window; expanding by default.
+        :param warm_start: If True, initialize each refit from the previous fold's centroids.
+        :param chain_length: Number of consecutive folds per warm-started chain, the unit of
+            parallel work; defaults to all folds in one chain.
+        :raises ValueError: If the indices differ, the schedule is empty or ``chain_length`` is not positive.
+        """
+        if not feature_matrix.index.equals(time_series.index):
+            raise ValueError("Index mismatch: 'feature_matrix' and 'time_series' must have identical indices.")
+        self.time_series = time_series
+        self.feature_matrix = feature_matrix
+        self.model_cls = model_cls
+        self.model_params = dict(model_params or {})
+        self.warm_start = warm_start
+        self.folds: List[Fold] = DataSplitting.walk_forward_schedule(feature_matrix.index, freq, min_train, window)
+        if not self.folds:
+            raise ValueError("No fold has enough training rows; lower min_train.")
+        if chain_length is not None and chain_length < 1:
+            raise ValueError("chain_length must be a positive integer.")
+        self.chain_length = (chain_length or len(self.folds)) if warm_start else 1
+        self.centers: List[Optional[np.ndarray]] = []
+
+    @property
+    def schedule(self) -> pd.DataFrame:
+        """
+        :return: One row per fold with the first and last timestamp of its training and test rows.
+        """
+        index = self.feature_matrix.index
+        return pd.DataFrame(
+            [(index[train][0], index[train][-1], index[test][0], index[test][-1]) for train, test in self.folds],
+            columns=["train_start", "train_end", "test_start", "test_end"],
+        )
+
+    def run(self, n_jobs: int = 1) -> pd.Series:
+        """
+        Fit every fold and collect its out-of-sample labels.
+
+        With ``n_jobs > 1`` the chains run on a process pool sharing the data through shared
+        memory; without ``warm_start`` every fold is an independent task.
+
+        :param n_jobs: Number of worker processes; 1 runs in the calling process.
+        :return: Series of predicted labels over all test rows, stored as ``int8``. The
+            centroids of every fold are kept in ``centers``.
+        """
+        panel = pd.concat([self.time_series.rename("__returns__"), self.feature_matrix], axis=1)
+        state = {
+            "index": self.feature_matrix.index,
+            "columns": self.feature_matrix.columns,
+            "model_cls": self.model_cls,
+            "model_params": self.model_params,
+            "warm_start": self.warm_start,
+        }
+
+        chains = [self.folds[start:start + self.chain_length] for start in range(0, len(self.folds), self.chain_length)]
+        if n_jobs == 1:
+            state["values"] = panel.to_numpy(dtype=float)
+            results = [result for chain in chains for result in _run_chain(state, chain)]
+        else:
+            shm, _ = share_panel(panel)
+            try:
+                with ProcessPoolExecutor(max_workers=n_jobs,
+                                         initializer=_init_worker,
+                                         initargs=(shm.name, panel.shape, state)) as pool:
+                    results = [result for chain in pool.map(_run_worker_chain, chains) for result in chain]
+            finally:
+                shm.close()
+                shm.unlink()
+
+        self.centers = [centers for _, centers in results]
+        labels = np.concatenate([labels for labels, _ in results])
+        index = self.feature_matrix.index[self.folds[0][1].start:self.folds[-1][1].stop]
+        return as_labels(pd.Series(labels, index=index, name="regime"))
@@ -210,3 +210,28 @@ def test_split_date_order_raises(default_df: pd.DataFrame) -> None:
 
     with pytest.raises(ValueError):
         splitter.split(train_date, val_date)
+
+
+def test_walk_forward_refits_at_each_period(default_df: pd.DataFrame) -> None:
+    folds = DataSplitting(default_df).walk_forward("YE", min_train=24)
+
+    index = default_df.index
+    assert [index[test][0].month for _, test in folds] == [1] * len(folds)
+    assert index[folds[0][1]][0] == pd.Timestamp("1998-01-01")
+    assert all(train == slice(0, test.start) for train, test in folds)
+    assert folds[-1][1].stop == len(index)
+    assert all(prev[1].stop == nxt[1].start for prev, nxt in zip(folds, folds[1:]))
+
+
+def test_walk_forward_rolling_window(default_df: pd.DataFrame) -> None:
+    folds = DataSplitting(default_df).walk_forward("YE", min_train=24, window=36)
+
+    assert all(train.stop - train.start == min(36, test.start) for train, test in folds)
+    with pytest.raises(ValueError, match="window at least min_train"):
+        DataSplitting(default_df).walk_forward("YE", min_train=24, window=12)
+
+
+def test_walk_forward_schedule_only_needs_the_index(default_df: pd.DataFrame) -> None:
+    expected = DataSplitting(default_df).walk_forward("YE", min_train=24, window=36)
+
+    assert DataSplitting.walk_forward_schedule(default_df.index, "YE", min_train=24, window=36) == expected
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reidfo.core.dtypes import LABEL_DTYPE, as_float, as_labels, float_dtype, get_float_dtype, set_float_dtype
+
+
+def test_default_is_float64_and_context_restores_it():
+    assert get_float_dtype() == np.float64
+
+    with float_dtype(np.float32) as dtype:
+        assert dtype == np.float32 and get_float_dtype() == np.float32
+
+    assert get_float_dtype() == np.float64
+
+
+def test_set_float_dtype_rejects_non_float_dtypes():
+    with pytest.raises(ValueError, match="float32 or float64"):
+        set_float_dtype(np.float16)
+    with pytest.raises(ValueError, match="float32 or float64"):
+        set_float_dtype(np.int32)
+
+
+def test_as_float_casts_only_floating_columns():
+    df = pd.DataFrame({"x": [1.0, 2.0], "n": [1, 2], "flag": [True, False]})
+
+    assert as_float(df) is df
+    assert as_float(df, copy=True) is not df
+    with float_dtype(np.float32):
+        result = as_float(df)
+        assert result.dtypes.to_dict() == {"x": np.float32, "n": np.int64, "flag": bool}
+        assert as_float(df["x"]).dtype == np.float32
+        assert as_float(np.arange(3.0)).dtype == np.float32
+        assert as_float(np.arange(3)).dtype == np.arange(3).dtype
+
+
+def test_as_labels_compacts_integer_labels():
+    labels = pd.Series([0, 1, 2, 1])
+
+    assert as_labels(labels).dtype == LABEL_DTYPE
+    assert as_labels(np.array([0, 1])).dtype == LABEL_DTYPE
+    assert as_labels(pd.Series([0, 300])).dtype == np.int64
+    text = pd.Series(["bull", "bear"])
+    assert as_labels(text) is text
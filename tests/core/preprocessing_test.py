@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from sklearn.preprocessing import StandardScaler
+
+from reidfo.core.preprocessing import ClipByStd, StandardScale, _FittedTransform, clip_by_std, standard_scale
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {"a": rng.standard_t(3, 200), "b": rng.normal(5.0, 2.0, 200), "c": np.full(200, 1.5)},
+        index=pd.date_range("2024-01-01", periods=200, freq="D"),
+    )
+    frame.iloc[[3, 50], 0] = np.nan
+    return frame
+
+
+def test_clip_by_std_matches_pandas_clip(df):
+    mean, std = df.mean(axis=0), df.std(axis=0, ddof=0)
+    expected = df.clip(lower=mean - 3.0 * std, upper=mean + 3.0 * std, axis=1)
+    assert_frame_equal(clip_by_std(df), expected)
+
+
+def test_standard_scale_matches_sklearn(df):
+    expected = pd.DataFrame(StandardScaler().fit_transform(df), index=df.index, columns=df.columns)
+    assert_frame_equal(standard_scale(df), expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("factory", [lambda: ClipByStd(2.0), StandardScale])
+def test_partial_fit_on_chunks_matches_full_fit(df, factory):
+    full = factory().fit(df)
+    chunked = factory()
+    for start in range(0, len(df), 37):
+        chunked.partial_fit(df.iloc[start:start + 37])
+
+    np.testing.assert_allclose(chunked.moments.mean, full.moments.mean)
+    np.testing.assert_allclose(chunked.moments.std(), full.moments.std())
+    assert_frame_equal(chunked.transform(df), full.transform(df))
+
+
+def test_fitted_transform_is_reused_on_new_data(df):
+    train, test = df.iloc[:150], df.iloc[150:]
+    scaler = StandardScale().fit(train)
+
+    result = scaler(test)
+
+    expected = (test - train.mean()) / train.std(ddof=0).replace(0.0, 1.0)
+    assert_frame_equal(result, expected, rtol=1e-10)
+
+
+def test_unfitted_transform_fits_each_call_without_keeping_state(df):
+    clipper = ClipByStd(2.0)
+
+    first = clipper(df)
+    second = clipper(df[["b", "c"]])
+
+    assert not clipper.fitted
+    assert_frame_equal(first, clip_by_std(df, 2.0))
+    assert_frame_equal(second, clip_by_std(df[["b", "c"]], 2.0))
+
+
+def test_transform_array_modifies_in_place(df):
+    clipper = ClipByStd(1.0).fit(df)
+    values = df.to_numpy(copy=True)
+
+    out = clipper.transform_array(values)
+
+    assert out is values
+    lower, upper = clipper.bounds()
+    assert np.all((values[:, 1] >= lower[1]) & (values[:, 1] <= upper[1]))
+
+
+def test_transform_requires_fit_and_matching_columns(df):
+    with pytest.raises(ValueError, match="fitted"):
+        StandardScale().transform(df)
+    with pytest.raises(ValueError, match="Columns must match"):
+        StandardScale().fit(df).transform(df[["b", "a", "c"]])
+
+
+def test_fitted_transform_requires_transform_array():
+    class Incomplete(_FittedTransform):
+        pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from reidfo.feature_engineering.array_time_series_data import ArrayTimeSeriesData
+from reidfo.feature_engineering.time_series_data import TimeSeriesData
+
+
+def _block(start: str, periods: int, offset: float = 0.0) -> TimeSeriesData:
+    index = pd.date_range(start, periods=periods, freq="D")
+    series = pd.Series(np.arange(periods, dtype=float) + offset, index=index, name="a")
+    features = pd.DataFrame({"f1": series * 2.0, "f2": series - 1.0}, index=index)
+    return TimeSeriesData(series, features)
+
+
+def test_appends_match_concatenated_time_series_data():
+    blocks = [_block("2024-01-01", 3), _block("2024-01-04", 2, 10.0), _block("2024-01-06", 4, 20.0)]
+    expected = blocks[0] + blocks[1] + blocks[2]
+
+    data = ArrayTimeSeriesData.from_time_series_data(blocks[0])
+    for block in blocks[1:]:
+        data += block
+
+    assert len(data) == 9
+    assert_series_equal(data.series, expected.series, check_freq=False)
+    assert_frame_equal(data.feature_matrix, expected.feature_matrix, check_freq=False)
+
+
+def test_capacity_grows_geometrically():
+    data = ArrayTimeSeriesData.from_time_series_data(_block("2024-01-01", 1))
+    capacities = set()
+    for day in pd.date_range("2024-01-02", periods=63, freq="D"):
+        data += _block(str(day.date()), 1)
+        capacities.add(data.capacity)
+    assert len(data) == 64
+    assert capacities == {2, 4, 8, 16, 32, 64}
+
+
+def test_views_share_buffers_until_next_append():
+    data = ArrayTimeSeriesData.from_time_series_data(_block("2024-01-01", 3), capacity=10)
+    features = data.feature_matrix
+
+    assert data.feature_matrix is features
+    assert np.shares_memory(features.to_numpy(), data._features)
+    data += _block("2024-01-04", 1)
+    assert data.feature_matrix is not features
+    assert len(features) == 3
+
+
+def test_trim_by_date_and_position():
+    data = ArrayTimeSeriesData.from_time_series_data(_block("2024-01-01", 6))
+    data.trim(pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-05"))
+    assert list(data.series) == [1.0, 2.0, 3.0, 4.0]
+
+    data.trim(1, 3)
+    assert list(data.series) == [2.0, 3.0]
+
+    with pytest.raises(ValueError, match="matching types"):
+        data.trim(0, pd.Timestamp("2024-01-05"))
+
+
+def test_append_rejects_incompatible_blocks():
+    data = ArrayTimeSeriesData.from_time_series_data(_block("2024-01-01", 3))
+
+    with pytest.raises(ValueError, match="start after"):
+        data += _block("2024-01-03", 2)
+    renamed = _block("2024-01-10", 2)
+    renamed.feature_matrix.columns = ["g1", "g2"]
+    with pytest.raises(ValueError, match="identical columns"):
+        data += renamed
+    with pytest.raises(TypeError):
+        data += 1
+
+
+def test_timezone_aware_index_round_trips():
+    block = _block("2024-01-01", 3)
+    block.series.index = block.series.index.tz_localize("Europe/Zurich")
+    block.feature_matrix.index = block.series.index
+
+    data = ArrayTimeSeriesData.from_time_series_data(block)
+
+    assert data.index.equals(block.series.index)
@@ -0,0 +1,147 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.core.preprocessing import clip_by_std, standard_scale
+from reidfo.feature_engineering.cache import FeatureCache, _callable_key
+from reidfo.feature_engineering.collector.half_life_collector import HalfLifeCollector
+from reidfo.feature_engineering.collector.multi_frequency_collector import MultiFrequencyCollector
+from reidfo.feature_engineering.feature_engineer import FeatureEngineer
+
+
+class CountingCollector(HalfLifeCollector):
+    calls = 0
+
+    def collect(self, time_series: pd.Series) -> pd.DataFrame:
+        CountingCollector.calls += 1
+        return super().collect(time_series)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    prices = 100.0 * np.exp(rng.normal(0.0, 0.01, (60, 2)).cumsum(axis=0))
+    return pd.DataFrame(prices, columns=["a", "b"], index=pd.date_range("2024-01-01", periods=60, freq="D"))
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CountingCollector.calls = 0
+
+
+def test_fingerprint_depends_on_inputs(df):
+    series = df["a"]
+    collector = HalfLifeCollector({"halflives": [2]})
+    base = FeatureCache.fingerprint(series, collector, clip_by_std, standard_scale)
+
+    assert base == FeatureCache.fingerprint(series.copy(), HalfLifeCollector({"halflives": [2]}),
+                                            clip_by_std, standard_scale)
+    assert base != FeatureCache.fingerprint(series * 1.01, collector, clip_by_std, standard_scale)
+    assert base != FeatureCache.fingerprint(series, HalfLifeCollector({"halflives": [3]}),
+                                            clip_by_std, standard_scale)
+    assert base != FeatureCache.fingerprint(series, collector, None, standard_scale)
+    assert base != FeatureCache.fingerprint(series, collector, clip_by_std, standard_scale,
+                                            start_date=df.index[5])
+    assert FeatureCache.fingerprint(series, collector, lambda x: x + 1.0) != \
+        FeatureCache.fingerprint(series, collector, lambda x: x + 2.0)
+
+
+def test_callable_key_includes_closures_and_defaults():
+    def make_clipper(n_std):
+        def clip(x):
+            return x.clip(-n_std, n_std)
+        return clip
+
+    def scale(x, factor=1.0, *, offset=0.0):
+        return x * factor + offset
+
+    def with_defaults(factor=1.0, offset=0.0):
+        def scale(x, factor=factor, *, offset=offset):
+            return x * factor + offset
+        return scale
+
+    def recursive():
+        def walk(n):
+            return n if n <= 0 else walk(n - 1)
+        return walk
+
+    assert _callable_key(make_clipper(3.0)) == _callable_key(make_clipper(3.0))
+    assert _callable_key(make_clipper(3.0)) != _callable_key(make_clipper(4.0))
+    assert _callable_key(with_defaults(2.0)) != _callable_key(with_defaults(3.0))
+    assert _callable_key(with_defaults(offset=1.0)) != _callable_key(with_defaults(offset=2.0))
+    assert "with_defaults.<locals>.scale" in _callable_key(with_defaults())
+    assert _callable_key(scale) != _callable_key(with_defaults())
+    assert _callable_key(recursive()) == _callable_key(recursive())
+
+
+def test_fingerprint_describes_nested_collectors_by_value(df):
+    def multi_frequency(halflives):
+        return MultiFrequencyCollector({"collector": HalfLifeCollector({"halflives": halflives}),
+                                        "frequencies": [None, "W"]})
+
+    base = FeatureCache.fingerprint(df["a"], multi_frequency([5]))
+
+    assert "0x" not in repr(multi_frequency([5]).describe())
+    assert base == FeatureCache.fingerprint(df["a"], multi_frequency([np.int64(5)]))
+    assert base != FeatureCache.fingerprint(df["a"], multi_frequency([60]))
+
+
+def test_get_data_reuses_cached_feature_matrix(df):
+    engineer = FeatureEngineer(df, cache=FeatureCache())
+    collector = CountingCollector({"halflives": [2, 4]})
+
+    first = engineer.get_data("a", collector)
+    second = engineer.get_data("a", collector)
+    engineer.get_data("b", collector)
+
+    assert CountingCollector.calls == 2
+    assert_frame_equal(first.feature_matrix, second.feature_matrix)
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = FeatureCache(max_entries=2)
+    frames = {key: pd.DataFrame({"x": [float(i)]}) for i, key in enumerate("abc")}
+    cache.put("a", frames["a"])
+    cache.put("b", frames["b"])
+    cache.get("a")
+    cache.put("c", frames["c"])
+
+    assert cache.get("b") is None
+    assert_frame_equal(cache.get("a"), frames["a"])
+
+
+def test_disk_tier_survives_new_cache_and_respects_size_limit(df, tmp_path):
+    engineer = FeatureEngineer(df, cache=FeatureCache(directory=str(tmp_path)))
+    collector = CountingCollector({"halflives": [2]})
+    expected = engineer.get_data("a", collector).feature_matrix
+
+    reloaded = FeatureEngineer(df, cache=FeatureCache(directory=str(tmp_path))).get_data("a", collector)
+
+    assert CountingCollector.calls == 1
+    assert_frame_equal(reloaded.feature_matrix, expected)
+
+    size = os.path.getsize(next(tmp_path.iterdir()))
+    limited = FeatureCache(directory=str(tmp_path), max_disk_bytes=int(size * 1.5))
+    limited.put("other", expected)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_disk_write_is_atomic(tmp_path, monkeypatch):
+    cache = FeatureCache(directory=str(tmp_path))
+    frame = pd.DataFrame({"x": [1.0, 2.0]})
+    cache.put("a", frame)
+
+    def fail(self, path, *args, **kwargs):
+        with open(path, "wb") as file:
+            file.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_pickle", fail)
+    with pytest.raises(OSError):
+        cache.put("b", frame)
+
+    assert sorted(os.listdir(tmp_path)) == ["a.pkl"]
+    assert_frame_equal(FeatureCache(directory=str(tmp_path)).get("a"), frame)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from reidfo.core.preprocessing import ClipByStd, StandardScale
+from reidfo.feature_engineering.chunked import ChunkedFeatureEngineer
+from reidfo.feature_engineering.collector.base_collector import BaseCollector
+from reidfo.feature_engineering.collector.custom_collector import CustomCollector
+from reidfo.feature_engineering.collector.half_life_collector import HalfLifeCollector
+from reidfo.feature_engineering.collector.windowed_collector import WindowedCollector
+from reidfo.feature_engineering.feature_engineer import FeatureEngineer
+from reidfo.feature_engineering.feature_store import FeatureStore
+
+
+@pytest.fixture
+def prices() -> pd.Series:
+    rng = np.random.default_rng(13)
+    index = pd.date_range("2024-01-01", periods=200, freq="D")
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(scale=0.01, size=200))), index=index, name="a")
+
+
+def _chunks(series: pd.Series, size: int):
+    for start in range(0, len(series), size):
+        yield series.iloc[start:start + size]
+
+
+def _collectors():
+    return [
+        WindowedCollector({"windows": [5, 12]}),
+        HalfLifeCollector({"halflives": [3, 10]}),
+        CustomCollector({"feat_params": {"function_list": ["obs", "ab_pr_ch", "le_std", "slope"],
+                                         "windows": [4, 9]}}),
+    ]
+
+
+@pytest.mark.parametrize("collector", _collectors())
+@pytest.mark.parametrize("size", [3, 17, 200])
+def test_chunked_collection_matches_collect(prices, collector, size):
+    returns = prices.pct_change(fill_method=None).iloc[1:]
+    state, parts = None, []
+    for chunk in _chunks(returns, size):
+        featm, state = collector.collect_chunk(chunk, state)
+        parts.append(featm)
+
+    assert_frame_equal(pd.concat(parts), collector.collect(returns), check_freq=False, rtol=1e-9)
+
+
+def test_run_matches_in_memory_feature_engineer(prices, tmp_path):
+    collector = WindowedCollector({"windows": [5, 12]})
+    start = pd.Timestamp("2024-01-20")
+    expected = FeatureEngineer(prices.to_frame()).get_data("a", collector, start_date=start)
+    store = FeatureStore(str(tmp_path))
+
+    ChunkedFeatureEngineer(store).run(_chunks(prices, 23), collector, "a", start_date=start)
+
+    result = store.read("a")
+    assert store.keys() == ["a"]
+    assert_series_equal(result.series, expected.series, check_freq=False)
+    assert_frame_equal(result.feature_matrix, expected.feature_matrix, check_freq=False, rtol=1e-9)
+
+
+def test_run_applies_fitted_transforms_without_refitting(prices, tmp_path):
+    collector = HalfLifeCollector({"halflives": [3, 10]})
+    returns = prices.pct_change(fill_method=None).iloc[1:]
+    train = collector.collect(returns).iloc[:100]
+    clipper = ClipByStd().fit(train)
+    scaler = StandardScale().fit(clipper.transform(train))
+    store = FeatureStore(str(tmp_path))
+
+    ChunkedFeatureEngineer(store, clipper=clipper, scaler=scaler).run(
+        _chunks(prices, 50), collector, "a")
+
+    expected = scaler.transform(clipper.transform(collector.collect(returns)))
+    assert [block["rows"] for block in store.metadata("a")["blocks"]] == [49, 50, 50, 50]
+    assert_frame_equal(store.read("a").feature_matrix, expected, check_freq=False, rtol=1e-9)
+
+
+def test_run_rejects_unbounded_collectors_and_cleans_up(prices, tmp_path):
+    class _Whole(BaseCollector):
+        def collect(self, time_series: pd.Series) -> pd.DataFrame:
+            return pd.DataFrame({"demeaned": time_series - time_series.mean()})
+
+    store = FeatureStore(str(tmp_path))
+
+    with pytest.raises(NotImplementedError, match="does not support chunked collection"):
+        ChunkedFeatureEngineer(store).run(_chunks(prices, 50), _Whole({}), "a")
+    assert store.keys() == []
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.cross_sectional_collector import CrossSectionalCollector
+
+
+@pytest.fixture
+def panel() -> pd.DataFrame:
+    rng = np.random.default_rng(17)
+    values = rng.normal(0.0, 0.01, (60, 5))
+    values[3, 1] = np.nan
+    values[7, :4] = np.nan
+    values[9, 2] = values[9, 3]
+    return pd.DataFrame(values, columns=list("abcde"), index=pd.date_range("2024-01-01", periods=60, freq="D"))
+
+
+def test_features_match_pandas_row_operations(panel):
+    result = CrossSectionalCollector({}).collect_panel(panel)
+
+    mean, std = panel.mean(axis=1), panel.std(axis=1)
+    expected = {
+        "rank": panel.rank(axis=1, pct=True),
+        "zscore": panel.sub(mean, axis=0).div(std, axis=0),
+        "demeaned": panel.sub(mean, axis=0),
+        "dispersion": pd.DataFrame({c: std for c in panel.columns}).where(panel.notna().any(axis=1), np.nan),
+    }
+    for name, frame in expected.items():
+        assert_frame_equal(result.xs(name, axis=1, level=1), frame, check_freq=False, check_names=False)
+    assert np.isnan(result.loc[panel.index[7], ("e", "zscore")])
+
+
+def test_feature_selection_and_validation(panel):
+    result = CrossSectionalCollector({"features": ["dispersion"]}).collect_panel(panel)
+
+    assert list(result.columns) == [(c, "dispersion") for c in panel.columns]
+    with pytest.raises(ValueError, match="Unknown cross-sectional features"):
+        CrossSectionalCollector({"features": ["beta"]}).collect_panel(panel)
+    with pytest.raises(TypeError, match="needs the full panel"):
+        CrossSectionalCollector({}).collect(panel["a"])
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.moment_collector import MomentCollector
+
+
+def _series(seed: int, name: str) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.normal(0.0, 0.01, 200), index=pd.date_range("2024-01-01", periods=200, freq="D"), name=name)
+
+
+def test_collect_matches_pandas_rolling_moments():
+    series = _series(1, "a")
+
+    result = MomentCollector({"windows": [5, 30]}).collect(series)
+
+    expected = pd.DataFrame({
+        "skew_5": series.rolling(5).skew(), "kurt_5": series.rolling(5).kurt(),
+        "skew_30": series.rolling(30).skew(), "kurt_30": series.rolling(30).kurt(),
+    })
+    assert_frame_equal(result, expected, check_freq=False, check_names=False, rtol=1e-8)
+
+
+def test_collect_panel_matches_collect():
+    collector = MomentCollector({"windows": [10]})
+    panel = pd.DataFrame({"a": _series(1, "a"), "b": _series(2, "b")})
+
+    result = collector.collect_panel(panel)
+
+    for column in panel.columns:
+        assert_frame_equal(result[column], collector.collect(panel[column]), check_freq=False)
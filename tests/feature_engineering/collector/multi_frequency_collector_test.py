@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.half_life_collector import HalfLifeCollector
+from reidfo.feature_engineering.collector.multi_frequency_collector import MultiFrequencyCollector
+from reidfo.feature_engineering.collector.windowed_collector import WindowedCollector
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(20)
+    index = pd.bdate_range("2024-01-01", periods=260)
+    return pd.Series(rng.normal(0.0, 0.01, 260), index=index, name="a")
+
+
+def _reference(series: pd.Series, collector, freq: str) -> pd.DataFrame:
+    # Manual resample, collect and as-of join on the first date of the following period.
+    aggregated = (1 + series).resample(freq).prod(min_count=1) - 1
+    starts = pd.Series(series.index, index=series.index).resample(freq).min()
+    aggregated, starts = aggregated[starts.notna()], starts[starts.notna()]
+    featm = collector.collect(aggregated).iloc[:-1].set_axis(pd.DatetimeIndex(starts.to_numpy()[1:]), axis=0)
+    return featm.reindex(series.index, method="ffill").add_suffix(f"_{freq}")
+
+
+@pytest.mark.parametrize("freq", ["W", "ME"])
+def test_matches_resample_collect_and_asof_join(series, freq):
+    inner = HalfLifeCollector({"halflives": [2, 4]})
+
+    result = MultiFrequencyCollector({"collector": inner, "frequencies": [None, freq]}).collect(series)
+
+    assert_frame_equal(result[inner.collect(series).columns], inner.collect(series), check_freq=False)
+    expected = _reference(series, inner, freq)
+    assert_frame_equal(result[expected.columns], expected, check_freq=False, rtol=1e-10)
+
+
+def test_features_do_not_use_future_observations(series):
+    collector = MultiFrequencyCollector({"collector": WindowedCollector({"windows": [3]}), "frequencies": ["W", "ME"]})
+    cutoff = series.index[100]
+
+    full = collector.collect(series)
+    truncated = collector.collect(series.loc[:cutoff])
+
+    assert_frame_equal(full.loc[:cutoff], truncated, check_freq=False)
+
+
+def test_collect_panel_matches_collect(series):
+    collector = MultiFrequencyCollector({"collector": HalfLifeCollector({"halflives": [3]}), "aggregation": "sum"})
+    panel = pd.DataFrame({"a": series, "b": series * -2})
+
+    result = collector.collect_panel(panel)
+
+    assert result.columns.get_level_values(0).tolist() == ["a"] * 9 + ["b"] * 9
+    for column in panel.columns:
+        assert_frame_equal(result[column], collector.collect(panel[column]), check_freq=False)
+
+
+def test_invalid_params_raise(series):
+    with pytest.raises(TypeError, match="BaseCollector"):
+        MultiFrequencyCollector({"collector": "half_life"})
+    with pytest.raises(ValueError, match="aggregation must be one of"):
+        MultiFrequencyCollector({"collector": HalfLifeCollector({}), "aggregation": "median"})
+    with pytest.raises(TypeError, match="DatetimeIndex"):
+        MultiFrequencyCollector({"collector": HalfLifeCollector({})}).collect(series.reset_index(drop=True))
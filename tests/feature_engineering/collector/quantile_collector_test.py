@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.quantile_collector import QuantileCollector
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(16)
+    values = rng.normal(0.0, 0.01, 150)
+    values[70] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=150, freq="D"), name="a")
+
+
+def test_collect_matches_numpy_quantiles(series):
+    result = QuantileCollector({"windows": [7, 20], "quantiles": [0.05, 0.5, 0.95]}).collect(series)
+
+    assert list(result.columns) == [f"quantile_{q}_{w}" for w in [7, 20] for q in ["0.05", "0.5", "0.95"]]
+    values = series.to_numpy()
+    for w in [7, 20]:
+        for q in [0.05, 0.5, 0.95]:
+            expected = np.full(len(values), np.nan)
+            for end in range(w, len(values) + 1):
+                expected[end - 1] = np.quantile(values[end - w:end], q)
+            np.testing.assert_allclose(result[f"quantile_{q:g}_{w}"], expected, rtol=1e-12)
+
+
+def test_collect_panel_matches_collect(series):
+    collector = QuantileCollector({"windows": [5], "quantiles": [0.5]})
+    panel = pd.DataFrame({"a": series, "b": series * 2})
+
+    result = collector.collect_panel(panel)
+
+    assert list(result.columns) == [("a", "quantile_0.5_5"), ("b", "quantile_0.5_5")]
+    for column in panel.columns:
+        assert_frame_equal(result[column], collector.collect(panel[column]), check_freq=False)
+
+
+def test_invalid_quantiles_raise(series):
+    with pytest.raises(ValueError, match="0 <= q <= 1"):
+        QuantileCollector({"quantiles": [1.5]}).collect(series)
+    with pytest.raises(TypeError):
+        QuantileCollector({"quantiles": 0.5}).collect(series)
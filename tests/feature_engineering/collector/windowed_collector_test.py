@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.windowed_collector import WindowedCollector
+from reidfo.feature_engineering.util import (
+    compute_observation, compute_absolute_change, compute_previous_absolute_change,
+    compute_centered_mean, compute_centered_std,
+    compute_left_mean, compute_left_std,
+    compute_right_mean, compute_right_std
+)
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(15)
+    values = 100.0 + rng.normal(0.0, 1.0, 300).cumsum()
+    values[[50, 51, 200]] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=300, freq="D"), name="a")
+
+
+@pytest.mark.parametrize("windows", [[6, 12], [1, 2, 5, 30, 400]])
+def test_fused_collect_matches_rolling_functions(series, windows):
+    expected = {
+        "observation": compute_observation(series),
+        "abs_change": compute_absolute_change(series),
+        "prev_abs_change": compute_previous_absolute_change(series),
+    }
+    for w in windows:
+        expected.update({
+            f"centered_mean_{w}": compute_centered_mean(series, w),
+            f"centered_std_{w}": compute_centered_std(series, w),
+            f"left_mean_{w}": compute_left_mean(series, w),
+            f"left_std_{w}": compute_left_std(series, w),
+            f"right_mean_{w}": compute_right_mean(series, w),
+            f"right_std_{w}": compute_right_std(series, w),
+        })
+
+    result = WindowedCollector({"windows": windows}).collect(series)
+
+    assert_frame_equal(result, pd.DataFrame(expected), check_freq=False, rtol=1e-8, atol=1e-10)
+
+
+def test_collect_panel_matches_collect(series):
+    collector = WindowedCollector({"windows": [3, 8]})
+    panel = pd.DataFrame({"a": series, "b": series[::-1].to_numpy()}, index=series.index)
+
+    result = collector.collect_panel(panel)
+
+    for column in panel.columns:
+        assert_frame_equal(result[column], collector.collect(panel[column]), check_freq=False)
+
+
+def test_collect_with_inf_and_outlier_matches_rolling_functions(series):
+    series = series.copy()
+    series.iloc[120] = np.inf
+    series.iloc[160] = 1e6
+    windows = [6, 12]
+    expected = {
+        "observation": compute_observation(series),
+        "abs_change": compute_absolute_change(series),
+        "prev_abs_change": compute_previous_absolute_change(series),
+    }
+    for w in windows:
+        expected.update({
+            f"centered_mean_{w}": compute_centered_mean(series, w),
+            f"centered_std_{w}": compute_centered_std(series, w),
+            f"left_mean_{w}": compute_left_mean(series, w),
+            f"left_std_{w}": compute_left_std(series, w),
+            f"right_mean_{w}": compute_right_mean(series, w),
+            f"right_std_{w}": compute_right_std(series, w),
+        })
+
+    result = WindowedCollector({"windows": windows}).collect(series)
+
+    # Each missing value (three NaNs and the inf) only voids the rows whose windows contain it.
+    assert result.iloc[20:].isna().any(axis=1).sum() <= 4 * max(windows) + 4
+    # pandas' online rolling variance carries ~1e-5 relative error after the outlier leaves the window.
+    assert_frame_equal(result, pd.DataFrame(expected), check_freq=False, rtol=1e-4, atol=1e-10)
+    after_outlier = series.iloc[166:178].to_numpy()
+    assert result["centered_std_12"].iloc[177] == pytest.approx(after_outlier.std(ddof=1), rel=1e-12)
@@ -1,9 +1,17 @@
+from functools import partial
+
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 
+from reidfo.core.dtypes import float_dtype
+from reidfo.core.preprocessing import ClipByStd, StandardScale, clip_by_std, standard_scale
 from reidfo.feature_engineering.feature_engineer import FeatureEngineer
 from reidfo.feature_engineering.collector.base_collector import BaseCollector
+from reidfo.feature_engineering.collector.cross_sectional_collector import CrossSectionalCollector
+from reidfo.feature_engineering.collector.half_life_collector import HalfLifeCollector
+from reidfo.feature_engineering.collector.windowed_collector import WindowedCollector
 from reidfo.feature_engineering.time_series_data import TimeSeriesData
 
 
@@ -116,6 +124,24 @@ def test_get_data_applies_clipper_then_scaler(df):
     assert_frame_equal(result.feature_matrix, expected_features)
 
 
+def test_unfitted_transform_instances_are_fitted_per_get_data_call(long_df):
+    collector = WindowedCollector({"windows": [4, 7]})
+    shared = FeatureEngineer(long_df, clipper=ClipByStd(2.0), scaler=StandardScale())
+    fresh = FeatureEngineer(long_df, clipper=partial(clip_by_std, mul=2.0), scaler=standard_scale)
+    start_date = long_df.index[10]
+
+    for column in ["a", "b"]:
+        result = shared.get_data(column, collector, start_date=start_date)
+        expected = fresh.get_data(column, collector, start_date=start_date)
+        assert_frame_equal(result.feature_matrix, expected.feature_matrix)
+    assert not shared.clipper.fitted and not shared.scaler.fitted
+
+    many = shared.get_data_many(collector, start_date=start_date)
+    for column, data in many.items():
+        expected = fresh.get_data(column, collector, start_date=start_date)
+        assert_frame_equal(data.feature_matrix, expected.feature_matrix, check_names=False, rtol=1e-8)
+
+
 def test_get_data_rejects_unknown_column(df):
     engineer = FeatureEngineer(df, clipper=None, scaler=None)
 
@@ -128,3 +154,120 @@ def test_get_data_rejects_nan_feature_matrix(df):
 
     with pytest.raises(ValueError, match="Feature matrix contains NaNs."):
         engineer.get_data("a", NanCollector())
+
+
+@pytest.fixture
+def long_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    prices = 100.0 * np.exp(rng.normal(0.0, 0.01, (80, 3)).cumsum(axis=0))
+    return pd.DataFrame(prices, columns=["a", "b", "c"], index=pd.date_range("2024-01-01", periods=80, freq="D"))
+
+
+@pytest.mark.parametrize("collector", [
+    HalfLifeCollector({"halflives": [2, 8]}),
+    WindowedCollector({"windows": [4, 7]}),
+    DummyCollector(),
+])
+def test_get_data_many_matches_get_data(long_df, collector):
+    engineer = FeatureEngineer(long_df)
+    start_date = long_df.index[10]
+
+    result = engineer.get_data_many(collector, start_date=start_date)
+
+    assert list(result.keys()) == ["a", "b", "c"]
+    for column, data in result.items():
+        expected = engineer.get_data(column, collector, start_date=start_date)
+        assert_series_equal(data.series, expected.series)
+        assert_frame_equal(data.feature_matrix, expected.feature_matrix, check_names=False, rtol=1e-8)
+
+
+def test_get_data_many_stacked_returns_multiindex_columns(long_df):
+    engineer = FeatureEngineer(long_df, clipper=None, scaler=None)
+
+    result = engineer.get_data_many(HalfLifeCollector({"halflives": [3]}), columns=["b", "a"], stacked=True)
+
+    assert list(result.columns) == [(c, f) for c in ["b", "a"] for f in ["ret_3", "DD-log_3", "sortino_3"]]
+
+
+def test_get_data_many_joins_cross_sectional_features(long_df):
+    engineer = FeatureEngineer(long_df, clipper=None, scaler=None)
+    half_life = HalfLifeCollector({"halflives": [3]})
+
+    result = engineer.get_data_many([half_life, CrossSectionalCollector({"features": ["rank", "zscore"]})],
+                                    columns=["b", "a", "c"], stacked=True)
+
+    features = ["ret_3", "DD-log_3", "sortino_3", "rank", "zscore"]
+    assert list(result.columns) == [(c, f) for c in ["b", "a", "c"] for f in features]
+    returns = engineer.returns_df
+    assert_series_equal(result[("a", "rank")], returns.rank(axis=1, pct=True)["a"], check_names=False)
+    assert_frame_equal(result["c"][features[:3]], half_life.collect(returns["c"]), check_names=False)
+    with pytest.raises(TypeError, match="needs the full panel"):
+        engineer.get_data("a", CrossSectionalCollector({}))
+
+
+def test_get_data_many_rejects_unknown_columns(long_df):
+    engineer = FeatureEngineer(long_df)
+
+    with pytest.raises(ValueError, match="not found"):
+        engineer.get_data_many(DummyCollector(), columns=["a", "missing"])
+
+
+def test_get_data_parallel_matches_get_data_in_column_order(long_df):
+    engineer = FeatureEngineer(long_df)
+    collector = WindowedCollector({"windows": [4]})
+    start_date = long_df.index[10]
+
+    result = engineer.get_data_parallel(collector, columns=["c", "a"], n_jobs=2, start_date=start_date)
+
+    assert list(result.keys()) == ["c", "a"]
+    for column, data in result.items():
+        expected = engineer.get_data(column, collector, start_date=start_date)
+        assert_series_equal(data.series, expected.series)
+        assert_frame_equal(data.feature_matrix, expected.feature_matrix)
+
+
+def test_get_data_parallel_propagates_nan_error(long_df):
+    engineer = FeatureEngineer(long_df)
+
+    with pytest.raises(ValueError, match="Feature matrix contains NaNs."):
+        engineer.get_data_parallel(WindowedCollector({"windows": [4]}), n_jobs=2)
+
+
+def test_get_data_log_returns(df):
+    engineer = FeatureEngineer(df, clipper=None, scaler=None, log_returns=True)
+
+    result = engineer.get_data("a", DummyCollector())
+
+    expected_series = np.log(df["a"]).diff().iloc[1:]
+    assert_series_equal(result.series, expected_series)
+
+
+def test_columns_and_returns_are_computed_lazily_and_memoized(df):
+    engineer = FeatureEngineer(df, clipper=None, scaler=None)
+    assert engineer._returns == {} and engineer._originals == {}
+
+    first = engineer.get_data("a", DummyCollector()).series
+    df.loc[df.index[2], "a"] = 0.0
+    second = engineer.get_data("a", DummyCollector()).series
+
+    assert list(engineer._returns) == ["a"]
+    assert_series_equal(first, second)
+    assert list(engineer.returns_df.columns) == ["a", "b"]
+
+
+@pytest.mark.parametrize("collector", [
+    HalfLifeCollector({"halflives": [2, 8]}),
+    WindowedCollector({"windows": [4, 7]}),
+])
+def test_float32_policy_applies_end_to_end(long_df, collector):
+    start_date = long_df.index[10]
+    expected = FeatureEngineer(long_df).get_data("a", collector, start_date=start_date)
+    with float_dtype(np.float32):
+        engineer = FeatureEngineer(long_df)
+        data = engineer.get_data("a", collector, start_date=start_date)
+        many = engineer.get_data_many(collector, start_date=start_date)
+
+    assert data.series.dtype == np.float32
+    assert (data.feature_matrix.dtypes == np.float32).all()
+    assert (many["b"].feature_matrix.dtypes == np.float32).all()
+    assert_frame_equal(data.feature_matrix, expected.feature_matrix.astype(np.float32), rtol=1e-4, atol=1e-5)
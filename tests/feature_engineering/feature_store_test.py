@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from reidfo.feature_engineering.feature_store import FeatureStore
+from reidfo.feature_engineering.time_series_data import TimeSeriesData
+
+
+def _block(start: str, periods: int, tz=None) -> TimeSeriesData:
+    index = pd.date_range(start, periods=periods, freq="D", tz=tz)
+    rng = np.random.default_rng(periods)
+    series = pd.Series(rng.normal(size=periods), index=index, name="a")
+    features = pd.DataFrame({"f1": rng.normal(size=periods), "f2": rng.normal(size=periods)}, index=index)
+    return TimeSeriesData(series, features)
+
+
+def _assert_data_equal(left: TimeSeriesData, right: TimeSeriesData) -> None:
+    assert_series_equal(left.series, right.series, check_freq=False)
+    assert_frame_equal(left.feature_matrix, right.feature_matrix, check_freq=False)
+
+
+def test_write_and_read_round_trip(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    data = _block("2024-01-01", 10)
+
+    store.write("a", data)
+
+    assert store.keys() == ["a"]
+    _assert_data_equal(store.read("a"), data)
+
+
+def test_append_adds_blocks_without_rewriting(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    first, second = _block("2024-01-01", 10), _block("2024-01-11", 5)
+    store.write("a", first)
+    first_block = os.path.join(str(tmp_path), "a", "000000", "feature_0.npy")
+    mtime = os.stat(first_block).st_mtime_ns
+
+    store.append("a", second)
+
+    assert [block["rows"] for block in store.metadata("a")["blocks"]] == [10, 5]
+    assert os.stat(first_block).st_mtime_ns == mtime
+    _assert_data_equal(store.read("a"), first + second)
+
+
+def test_read_date_range_and_feature_subset_across_blocks(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    first, second = _block("2024-01-01", 10), _block("2024-01-11", 5)
+    store.write("a", first)
+    store.append("a", second)
+    start, end = pd.Timestamp("2024-01-08"), pd.Timestamp("2024-01-12")
+
+    result = store.read("a", start_date=start, end_date=end, features=["f2"])
+
+    expected = (first + second).trim(start, end)
+    assert_series_equal(result.series, expected.series, check_freq=False)
+    assert_frame_equal(result.feature_matrix, expected.feature_matrix[["f2"]], check_freq=False)
+
+
+def test_timezone_aware_index_round_trips(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    data = _block("2024-01-01", 4, tz="America/New_York")
+
+    store.write("a", data)
+
+    _assert_data_equal(store.read("a"), data)
+
+
+def test_append_rejects_overlapping_or_mismatched_blocks(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    store.write("a", _block("2024-01-01", 10))
+
+    with pytest.raises(ValueError, match="start after"):
+        store.append("a", _block("2024-01-10", 3))
+    renamed = _block("2024-02-01", 3)
+    renamed.feature_matrix.columns = ["g1", "g2"]
+    with pytest.raises(ValueError, match="identical columns"):
+        store.append("a", renamed)
+    with pytest.raises(KeyError):
+        store.read("missing")
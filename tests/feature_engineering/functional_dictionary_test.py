@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from reidfo.feature_engineering.cache import FeatureCache
+from reidfo.feature_engineering.collector.custom_collector import CustomCollector
+from reidfo.feature_engineering.functional_dictionary import (
+    functional_dictionary, hls_keys, is_builtin, register_feature, unregister_feature, vectorized_keys, windows_keys
+)
+from reidfo.feature_engineering.streaming import StreamingFeatureEngine
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(14)
+    values = rng.normal(0.0, 0.01, 80)
+    values[40] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=80, freq="D"), name="x")
+
+
+@pytest.fixture
+def registered():
+    keys = []
+    yield keys
+    for key in keys:
+        unregister_feature(key)
+
+
+def test_builtin_keys_declare_their_parameter():
+    assert hls_keys == {"exp_do", "ewm_me", "log_exp_do", "ewm_sor"}
+    assert {"cen_me", "slope", "mean_difference"} <= windows_keys
+    assert not ({"obs", "ab_ch", "ab_pr_ch"} & (hls_keys | windows_keys))
+
+
+def test_vectorized_window_function_matches_rolling_apply(series, registered):
+    @CustomCollector.register("range", parameter="window", vectorized=True)
+    def window_range(view: np.ndarray) -> np.ndarray:
+        return view.max(axis=1) - view.min(axis=1)
+    registered.append("range")
+
+    result = CustomCollector({"feat_params": {"function_list": ["range"], "windows": [5, 9]}}).collect(series)
+
+    assert "range" in windows_keys and "range" in vectorized_keys
+    for w in [5, 9]:
+        expected = series.rolling(w).apply(lambda x: x.max() - x.min(), raw=True)
+        assert_series_equal(result[f"x_range_{w}"], expected, check_names=False)
+
+
+def test_vectorized_halflife_function_receives_values(series, registered):
+    register_feature("scaled", lambda values, hl: values / hl, parameter="halflife", vectorized=True)
+    registered.append("scaled")
+
+    result = CustomCollector({"feat_params": {"function_list": ["scaled"], "halflives": [2, 4]}}).collect(series)
+
+    assert_series_equal(result["x_scaled_4"], series / 4, check_names=False)
+
+
+def test_registration_rejects_duplicates_and_bad_shapes(series, registered):
+    with pytest.raises(ValueError, match="already registered"):
+        register_feature("obs", lambda s: s)
+    with pytest.raises(ValueError, match="parameter must be one of"):
+        register_feature("bad", lambda s: s, parameter="lag")
+
+    register_feature("first", lambda view: view[0], parameter="window", vectorized=True)
+    registered.append("first")
+    with pytest.raises(ValueError, match="one value per window"):
+        CustomCollector({"feat_params": {"function_list": ["first"], "windows": [5]}}).collect(series)
+
+
+def test_overwrite_replaces_parameter_kind(registered):
+    register_feature("tmp", lambda s, hl: s, parameter="halflife")
+    registered.append("tmp")
+    register_feature("tmp", lambda s: s, overwrite=True)
+
+    assert "tmp" in functional_dictionary and "tmp" not in hls_keys
+
+
+def test_overwrite_changes_cache_fingerprint(series, registered):
+    register_feature("tmp", lambda s: s * 2.0)
+    registered.append("tmp")
+    collector = CustomCollector({"feat_params": {"function_list": ["tmp"]}})
+    before = FeatureCache.fingerprint(series, collector)
+
+    register_feature("tmp", lambda s: s * 3.0, overwrite=True)
+
+    assert FeatureCache.fingerprint(series, collector) != before
+
+
+def test_lookback_uses_declared_lookbacks(registered):
+    def lookback(function_list, windows=(5, 9)):
+        return CustomCollector({"feat_params": {"function_list": function_list, "windows": list(windows)}}).lookback()
+
+    register_feature("undeclared", lambda s: s.cumsum())
+    register_feature("lagged", lambda s: s.shift(3), lookback=3)
+    register_feature("lagged_mean", lambda s, w: s.shift(1).rolling(w).mean(), parameter="window", lookback=1)
+    register_feature("range", lambda view: view.max(axis=1) - view.min(axis=1), parameter="window", vectorized=True)
+    registered.extend(["undeclared", "lagged", "lagged_mean", "range"])
+
+    assert lookback(["obs"]) == 0
+    assert lookback(["obs", "ab_pr_ch"]) == 2
+    assert lookback(["obs", "cen_me"], windows=(6, 12)) == 11
+    assert lookback(["lagged"]) == 3
+    assert lookback(["lagged_mean", "obs"]) == 9
+    assert lookback(["range"]) == 8
+    assert lookback(["obs", "undeclared"]) is None
+    assert lookback(["obs", "ewm_me"]) is None
+    with pytest.raises(ValueError, match="lookback"):
+        register_feature("negative", lambda s: s, lookback=-1)
+
+
+@pytest.fixture
+def restore_builtins():
+    stock = {key: (functional_dictionary[key], key in windows_keys) for key in ["obs", "cen_me", "ewm_me"]}
+    yield
+    for key, (func, window) in stock.items():
+        parameter = "window" if window else ("halflife" if key == "ewm_me" else None)
+        register_feature(key, func, parameter=parameter, overwrite=True, lookback=None if key == "ewm_me" else 0)
+
+
+def test_overwritten_builtins_use_registered_function(series, restore_builtins):
+    params = {"feat_params": {"function_list": ["obs", "cen_me", "ewm_me"], "windows": [5], "halflives": [3]}}
+    stock = CustomCollector(params).collect(series)
+
+    register_feature("obs", lambda s: s * 2.0, overwrite=True, lookback=0)
+    register_feature("cen_me", lambda s, w: s.rolling(w).mean() + 42.0, parameter="window", overwrite=True, lookback=0)
+    register_feature("ewm_me", lambda s, hl: s * hl, parameter="halflife", overwrite=True)
+    result = CustomCollector(params).collect(series)
+
+    assert not is_builtin("cen_me")
+    assert_series_equal(result["x_obs"], stock["x_obs"] * 2.0)
+    assert_series_equal(result["x_cen_me_5"], stock["x_cen_me_5"] + 42.0)
+    assert_series_equal(result["x_ewm_me_3"], series * 3, check_names=False)
+    with pytest.raises(ValueError, match="Unsupported streaming"):
+        StreamingFeatureEngine(CustomCollector(params)).feature_names("x")
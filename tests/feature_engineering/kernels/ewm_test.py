@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.half_life_collector import HalfLifeCollector
+from reidfo.feature_engineering.kernels.ewm import EWMKernel
+from reidfo.feature_engineering.util import (
+    compute_downside_deviation, compute_ewm_mean, compute_ewm_sortino_ratio, compute_log_downside_deviation
+)
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(2)
+    values = rng.normal(0.001, 0.02, 400)
+    values[[0, 1, 90, 91, 250]] = np.nan
+    values[100:110] = np.abs(values[100:110])
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=400, freq="D"), name="a")
+
+
+def test_fit_matches_util_functions(series):
+    halflives = [1, 5, 20.5]
+    block = EWMKernel(series.to_numpy()).fit(halflives)
+    for i, hl in enumerate(halflives):
+        np.testing.assert_allclose(block["mean"][:, i], compute_ewm_mean(series, hl), rtol=1e-9)
+        np.testing.assert_allclose(block["downside_deviation"][:, i], compute_downside_deviation(series, hl),
+                                   rtol=1e-9)
+        np.testing.assert_allclose(block["log_downside_deviation"][:, i],
+                                   compute_log_downside_deviation(series, hl), rtol=1e-9)
+        np.testing.assert_allclose(block["sortino"][:, i], compute_ewm_sortino_ratio(series, hl), rtol=1e-9)
+
+
+def test_fit_handles_column_blocks(series):
+    block = np.column_stack([series.to_numpy(), series.to_numpy()[::-1]])
+    result = EWMKernel(block).fit([3, 7])
+    assert result["mean"].shape == (len(series), 2, 2)
+    single = EWMKernel(block[:, 1]).fit([3, 7])
+    np.testing.assert_allclose(result["sortino"][:, 1, :], single["sortino"])
+
+
+def test_half_life_collector_matches_per_halflife_reference(series):
+    halflives = [2, 10]
+    result = HalfLifeCollector({"halflives": halflives}).collect(series)
+    expected = {}
+    for hl in halflives:
+        expected.update({
+            f"ret_{hl}": compute_ewm_mean(series, hl),
+            f"DD-log_{hl}": compute_log_downside_deviation(series, hl),
+            f"sortino_{hl}": compute_ewm_sortino_ratio(series, hl),
+        })
+    assert_frame_equal(result, pd.DataFrame(expected), rtol=1e-9)
+
+
+def test_non_positive_halflife_raises(series):
+    with pytest.raises(ValueError, match="halflife"):
+        EWMKernel(series.to_numpy()).fit([0])
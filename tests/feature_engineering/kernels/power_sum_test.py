@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from reidfo.feature_engineering.kernels.power_sum import PowerSumKernel
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    rng = np.random.default_rng(16)
+    values = rng.standard_t(5, size=400) * 0.01
+    values[[100, 101, 250]] = np.nan
+    return values
+
+
+def _reference(values: np.ndarray, window: int, func) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    for end in range(window, len(values) + 1):
+        segment = values[end - window:end]
+        if not np.isnan(segment).any():
+            out[end - 1] = func(segment)
+    return out
+
+
+@pytest.mark.parametrize("window", [3, 4, 10, 60])
+def test_skew_matches_bias_corrected_sample_skewness(values, window):
+    expected = _reference(values, window, lambda x: stats.skew(x, bias=False))
+
+    np.testing.assert_allclose(PowerSumKernel(values).skew(window), expected, rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.parametrize("window", [4, 10, 60])
+def test_kurt_matches_bias_corrected_excess_kurtosis(values, window):
+    expected = _reference(values, window, lambda x: stats.kurtosis(x, bias=False))
+
+    np.testing.assert_allclose(PowerSumKernel(values).kurt(window), expected, rtol=1e-6, atol=1e-8)
+
+
+def test_moments_match_pandas_on_panel(values):
+    panel = np.column_stack([values, values[::-1]])
+    kernel = PowerSumKernel(panel)
+
+    for column in range(2):
+        series = pd.Series(panel[:, column])
+        np.testing.assert_allclose(kernel.skew(20)[:, column], series.rolling(20).skew(), rtol=1e-8)
+        np.testing.assert_allclose(kernel.kurt(20)[:, column], series.rolling(20).kurt(), rtol=1e-8)
+
+
+def test_short_and_constant_windows_are_nan():
+    kernel = PowerSumKernel(np.array([1.0, 1.0, 1.0, 1.0, 1.0, 2.0]))
+
+    assert np.isnan(kernel.skew(2)).all()
+    assert np.isnan(kernel.kurt(3)).all()
+    assert np.isnan(kernel.skew(4)[3:5]).all()
+    assert np.isnan(kernel.kurt(10)).all()
+
+
+def test_moments_stay_accurate_along_long_series():
+    # A drifting level far from the global mean is where global cumulative sums lose precision.
+    rng = np.random.default_rng(17)
+    values = 100.0 + np.cumsum(rng.normal(0.0, 0.5, size=200_000)) + rng.standard_t(5, size=200_000) * 0.01
+    window = 20
+    tail = np.lib.stride_tricks.sliding_window_view(values[-2_000:], window)
+
+    kernel = PowerSumKernel(values)
+
+    np.testing.assert_allclose(kernel.skew(window)[-len(tail):], stats.skew(tail, axis=1, bias=False),
+                               rtol=1e-7, atol=1e-9)
+    np.testing.assert_allclose(kernel.kurt(window)[-len(tail):], stats.kurtosis(tail, axis=1, bias=False),
+                               rtol=1e-7, atol=1e-9)
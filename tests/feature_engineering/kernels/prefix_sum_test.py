@@ -0,0 +1,129 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from reidfo.feature_engineering.kernels.prefix_sum import PrefixSumKernel
+from reidfo.feature_engineering.util import (
+    compute_left_mean, compute_left_std, compute_right_mean, compute_right_std
+)
+
+
+def _reference(series: pd.Series, window: int, side: str, stat: str) -> pd.Series:
+    half = window // 2
+    segment = slice(None, half) if side == "left" else slice(half, None)
+    if stat == "mean":
+        func = lambda values: np.mean(values[segment])
+    else:
+        func = lambda values: np.std(values[segment], ddof=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return series.rolling(window=window, min_periods=window).apply(func, raw=True)
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(0)
+    values = 100.0 + rng.normal(0.0, 1.0, 200).cumsum()
+    values[[40, 41, 120]] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=200, freq="D"), name="a")
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 6, 13, 250])
+@pytest.mark.parametrize("side,stat,func", [
+    ("left", "mean", compute_left_mean),
+    ("left", "std", compute_left_std),
+    ("right", "mean", compute_right_mean),
+    ("right", "std", compute_right_std),
+])
+def test_half_window_functions_match_rolling_apply(series, window, side, stat, func):
+    assert_series_equal(func(series, window), _reference(series, window, side, stat), rtol=1e-8, atol=1e-10)
+
+
+def test_kernel_handles_column_blocks(series):
+    block = np.column_stack([series.to_numpy(), series.to_numpy()[::-1]])
+    kernel = PrefixSumKernel(block)
+    for col in range(2):
+        single = PrefixSumKernel(block[:, col])
+        np.testing.assert_allclose(kernel.std(6, 3, 6)[:, col], single.std(6, 3, 6), rtol=1e-8, atol=1e-10)
+        np.testing.assert_allclose(kernel.mean(6)[:, col], single.mean(6), rtol=1e-8, atol=1e-10)
+
+
+def test_full_window_matches_rolling_statistics(series):
+    kernel = PrefixSumKernel(series.to_numpy())
+    np.testing.assert_allclose(kernel.mean(12), series.rolling(12).mean().to_numpy(), rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(kernel.std(12), series.rolling(12).std().to_numpy(), rtol=1e-8, atol=1e-10)
+
+
+def test_invalid_segment_raises(series):
+    kernel = PrefixSumKernel(series.to_numpy())
+    with pytest.raises(ValueError, match="positive"):
+        kernel.mean(0)
+    with pytest.raises(ValueError, match="Segment bounds"):
+        kernel.mean(4, 3, 6)
+
+
+@pytest.mark.parametrize("window,start,stop", [(1, 0, 1), (2, 0, 1), (7, 0, 7), (7, 3, 7), (250, 0, 250)])
+def test_moments_match_separate_statistics(series, window, start, stop):
+    kernel = PrefixSumKernel(series.to_numpy())
+
+    mean, std = kernel.moments(window, start, stop)
+
+    np.testing.assert_array_equal(mean, kernel.mean(window, start, stop))
+    np.testing.assert_array_equal(std, kernel.std(window, start, stop))
+
+
+def test_non_finite_values_only_void_their_windows(series):
+    values = series.to_numpy().copy()
+    values[[80, 160]] = [np.inf, -np.inf]
+    reference = pd.Series(values).rolling(12)
+    kernel = PrefixSumKernel(values)
+
+    np.testing.assert_allclose(kernel.mean(12), reference.mean().to_numpy(), rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(kernel.std(12), reference.std().to_numpy(), rtol=1e-8, atol=1e-10)
+    assert np.isnan(kernel.mean(12)).sum() == pd.Series(values).rolling(12).mean().isna().sum()
+
+
+def test_outlier_does_not_degrade_later_windows():
+    rng = np.random.default_rng(1)
+    values = rng.normal(0.0, 0.01, 5000)
+    values[1000] = 1e6
+    windows = np.lib.stride_tricks.sliding_window_view(values, 20)
+    half = windows[:, 10:]
+    kernel = PrefixSumKernel(values)
+
+    np.testing.assert_allclose(kernel.std(20)[1020:], windows.std(axis=1, ddof=1)[1001:], rtol=1e-9)
+    np.testing.assert_allclose(kernel.mean(20, 10, 20)[1020:], half.mean(axis=1)[1001:], rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(kernel.std(20, 10, 20)[1020:], half.std(axis=1, ddof=1)[1001:], rtol=1e-9)
+
+
+@pytest.mark.parametrize("spike", [1e4, 1e6, 1e12])
+@pytest.mark.parametrize("window", [7, 20])
+def test_spike_only_affects_segments_that_contain_it(spike, window):
+    rng = np.random.default_rng(2)
+    values = rng.normal(0.0, 0.01, 300)
+    values[20] = spike
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    kernel = PrefixSumKernel(values)
+
+    half = window // 2
+    for start, stop in [(0, window), (0, half), (half, window)]:
+        segments = windows[:, start:stop]
+        clean = ~(segments == spike).any(axis=1)
+        mean, std = kernel.moments(window, start, stop)
+        np.testing.assert_allclose(mean[window - 1:][clean], segments.mean(axis=1)[clean], rtol=1e-9, atol=1e-15)
+        np.testing.assert_allclose(std[window - 1:][clean], segments.std(axis=1, ddof=1)[clean], rtol=1e-9)
+
+
+def test_infinite_values_void_every_segment_of_their_windows():
+    values = np.arange(20, dtype=float)
+    values[10] = np.inf
+    kernel = PrefixSumKernel(values)
+
+    # Windows ending at rows 10..15 contain the inf, in their left or right half.
+    for start, stop in [(0, 3), (3, 6), (0, 6)]:
+        mean = kernel.mean(6, start, stop)
+        assert np.isnan(mean[10:16]).all()
+        assert np.isfinite(mean[5:10]).all() and np.isfinite(mean[16:]).all()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reidfo.feature_engineering.kernels.regression import RollingRegressionKernel
+from reidfo.feature_engineering.util import compute_slope
+
+
+def _polyfit_reference(values: np.ndarray, window: int):
+    n = len(values)
+    slope, intercept, r2 = (np.full(n, np.nan) for _ in range(3))
+    x = np.arange(window)
+    for end in range(window, n + 1):
+        y = values[end - window:end]
+        if np.isnan(y).any():
+            continue
+        if window < 2:
+            slope[end - 1] = 0.0
+            intercept[end - 1] = y[0]
+            continue
+        b, a = np.polyfit(x, y, 1)
+        slope[end - 1], intercept[end - 1] = b, a
+        ss_tot = ((y - y.mean()) ** 2).sum()
+        if ss_tot > 0:
+            r2[end - 1] = 1 - ((y - (a + b * x)) ** 2).sum() / ss_tot
+    return slope, intercept, r2
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    rng = np.random.default_rng(1)
+    values = rng.normal(0.0, 1.0, 300).cumsum() + 0.05 * np.arange(300)
+    values[[17, 150, 151]] = np.nan
+    return values
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 20, 400])
+def test_fit_matches_polyfit(values, window):
+    result = RollingRegressionKernel(values).fit(window)
+    slope, intercept, r2 = _polyfit_reference(values, window)
+    np.testing.assert_allclose(result["slope"], slope, rtol=1e-7, atol=1e-9)
+    np.testing.assert_allclose(result["intercept"], intercept, rtol=1e-7, atol=1e-9)
+    np.testing.assert_allclose(result["r2"], r2, rtol=1e-7, atol=1e-9)
+
+
+def test_fit_handles_column_blocks(values):
+    block = np.column_stack([values, 2.0 * values[::-1]])
+    result = RollingRegressionKernel(block).fit(7)
+    for col in range(2):
+        single = RollingRegressionKernel(block[:, col]).fit(7)
+        np.testing.assert_allclose(result["slope"][:, col], single["slope"], rtol=1e-8, atol=1e-10)
+
+
+def test_compute_slope_preserves_index_and_name(values):
+    series = pd.Series(values, index=pd.date_range("2024-01-01", periods=len(values), freq="D"), name="a")
+    result = compute_slope(series, 5)
+    assert result.index.equals(series.index)
+    assert result.name == "a"
+
+
+def test_fit_is_local_around_outliers_and_infs(values):
+    values = values.copy()
+    values[60], values[200] = 1e6, np.inf
+    result = RollingRegressionKernel(values).fit(20)
+    slope, intercept, _ = _polyfit_reference(np.where(np.isfinite(values), values, np.nan), 20)
+
+    np.testing.assert_allclose(result["slope"], slope, rtol=1e-7, atol=1e-9)
+    np.testing.assert_allclose(result["intercept"], intercept, rtol=1e-7, atol=1e-9)
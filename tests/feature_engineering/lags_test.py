@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from reidfo.core.dtypes import float_dtype
+from reidfo.feature_engineering.lags import LaggedFeatures
+from reidfo.feature_engineering.time_series_data import TimeSeriesData
+
+
+@pytest.fixture
+def data() -> TimeSeriesData:
+    rng = np.random.default_rng(19)
+    index = pd.date_range("2024-01-01", periods=30, freq="D")
+    features = pd.DataFrame(rng.normal(size=(30, 3)), index=index, columns=["a", "b", "c"])
+    return TimeSeriesData(pd.Series(rng.normal(size=30), index=index, name="r"), features)
+
+
+def _shift_concat(data: TimeSeriesData, lags) -> pd.DataFrame:
+    featm = data.feature_matrix
+    parts = [featm.shift(lag).add_suffix(f"_lag{lag}") if lag else featm for lag in lags]
+    return pd.concat(parts, axis=1).iloc[max(lags):]
+
+
+@pytest.mark.parametrize("lags", [3, [0, 2, 4], [1, 5, 2]])
+def test_design_matrix_matches_shift_and_concat(data, lags):
+    lagged = LaggedFeatures(data, lags)
+    expected = _shift_concat(data, lagged.lags)
+
+    frame = lagged.to_frame()
+
+    assert_frame_equal(frame, expected, check_freq=False)
+    assert frame.to_numpy().flags.c_contiguous
+
+
+def test_view_is_zero_copy_for_evenly_spaced_lags(data):
+    lagged = LaggedFeatures(data, [0, 2, 4])
+    values = data.feature_matrix.to_numpy()
+
+    view = lagged.view
+
+    assert view.shape == (26, 3, 3)
+    assert np.shares_memory(view, values)
+    assert not view.flags.writeable
+    np.testing.assert_array_equal(view[0, 2], values[0])
+    assert not np.shares_memory(LaggedFeatures(data, [1, 5, 2]).view, values)
+
+
+def test_time_series_data_and_dtype_policy(data):
+    with float_dtype(np.float32):
+        result = LaggedFeatures(data, 2).to_time_series_data()
+
+    assert_series_equal(result.series, data.series.iloc[2:].astype(np.float32), check_freq=False)
+    assert list(result.feature_matrix.columns[:4]) == ["a", "b", "c", "a_lag1"]
+    assert (result.feature_matrix.dtypes == np.float32).all()
+
+
+def test_invalid_lags_raise(data):
+    with pytest.raises(ValueError, match="non-negative"):
+        LaggedFeatures(data, [0, -1])
+    with pytest.raises(ValueError, match="unique"):
+        LaggedFeatures(data, [1, 1])
+    with pytest.raises(ValueError, match="longer than the largest lag"):
+        LaggedFeatures(data, 30)
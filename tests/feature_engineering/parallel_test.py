@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from reidfo.feature_engineering.parallel import read_shared, share_panel
+
+
+def test_read_shared_copies_values_and_releases_the_block():
+    panel = pd.DataFrame(np.arange(12.0).reshape(4, 3), columns=["a", "b", "c"])
+    shm, values = share_panel(panel)
+    try:
+        column = read_shared(shm.name, panel.shape, (slice(None), 1))
+        everything = read_shared(shm.name, panel.shape)
+
+        np.testing.assert_array_equal(column, panel["b"].to_numpy())
+        np.testing.assert_array_equal(everything, panel.to_numpy())
+        values[:] = 0.0
+        np.testing.assert_array_equal(column, panel["b"].to_numpy())
+    finally:
+        del values
+        shm.close()
+        shm.unlink()
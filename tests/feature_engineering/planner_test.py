@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.custom_collector import CustomCollector
+from reidfo.feature_engineering.functional_dictionary import functional_dictionary, hls_keys, windows_keys
+from reidfo.feature_engineering.planner import FeaturePlan
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(4)
+    values = rng.normal(0.0, 0.01, 120)
+    values[[30, 31]] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=120, freq="D"), name="x")
+
+
+def test_custom_collector_matches_functional_dictionary(series):
+    keys = list(functional_dictionary.keys())
+    params = {"function_list": keys, "halflives": [3, 12], "windows": [5, 8]}
+
+    result = CustomCollector({"feat_params": params}).collect(series)
+
+    expected = {}
+    for key in keys:
+        if key in hls_keys:
+            for hl in params["halflives"]:
+                expected[f"x_{key}_{hl}"] = functional_dictionary[key](series, hl)
+        elif key in windows_keys:
+            for w in params["windows"]:
+                expected[f"x_{key}_{w}"] = functional_dictionary[key](series, w)
+        else:
+            expected[f"x_{key}"] = functional_dictionary[key](series)
+    assert_frame_equal(result, pd.DataFrame(expected), check_names=False, rtol=1e-8, atol=1e-12)
+
+
+def test_plan_shares_intermediate_nodes():
+    plan = FeaturePlan(["le_me", "ri_me", "mean_difference", "ewm_me", "ewm_sor", "log_exp_do", "slope", "r2"],
+                       halflives=[5, 20], windows=[6])
+
+    assert list(plan.nodes).count(("rolling_sums",)) == 1
+    assert sum(1 for key in plan.nodes if key[0] == "mean") == 2
+    assert sum(1 for key in plan.nodes if key == ("ewm",)) == 1
+    assert sum(1 for key in plan.nodes if key == ("fit", 6)) == 1
+    assert len(plan.outputs) == 3 + 2 * 3 + 2
+
+
+def test_plan_evaluates_each_node_once(series):
+    calls = []
+    plan = FeaturePlan(["le_me", "mean_difference"], halflives=[], windows=[6])
+    original = plan.nodes[("rolling_sums",)]
+    plan.nodes[("rolling_sums",)] = original._replace(func=lambda x: calls.append(1) or original.func(x))
+
+    plan.evaluate(series)
+
+    assert calls == [1]
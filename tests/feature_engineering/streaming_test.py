@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from reidfo.feature_engineering.collector.custom_collector import CustomCollector
+from reidfo.feature_engineering.collector.half_life_collector import HalfLifeCollector
+from reidfo.feature_engineering.collector.windowed_collector import WindowedCollector
+from reidfo.feature_engineering.feature_engineer import FeatureEngineer
+from reidfo.feature_engineering.streaming import StreamingFeatureEngine
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(3)
+    values = rng.normal(0.0005, 0.01, 160)
+    values[[5, 70, 71]] = np.nan
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=160, freq="D"), name="a")
+
+
+def _stream(engine: StreamingFeatureEngine, series: pd.Series, warm: int) -> pd.DataFrame:
+    engine.warm_up(series.iloc[:warm])
+    rows = [engine.update(series.name, ts, value) for ts, value in series.iloc[warm:].items()]
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("collector", [
+    HalfLifeCollector({"halflives": [2, 10.5]}),
+    WindowedCollector({"windows": [1, 4, 9]}),
+    CustomCollector({"feat_params": {
+        "function_list": ["obs", "ab_pr_ch", "ewm_sor", "log_exp_do", "slope", "intercept", "r2",
+                          "mean_difference", "le_std"],
+        "halflives": [3],
+        "windows": [3, 7],
+    }}),
+])
+@pytest.mark.parametrize("warm", [0, 3, 40])
+def test_streaming_matches_batch_collector(series, collector, warm):
+    result = _stream(StreamingFeatureEngine(collector), series, warm)
+    expected = collector.collect(series).iloc[warm:]
+    assert_frame_equal(result, expected, check_freq=False, check_names=False, rtol=1e-7, atol=1e-10)
+
+
+def test_streaming_matches_get_data_on_long_high_level_series():
+    rng = np.random.default_rng(7)
+    n = 20_000
+    prices = pd.Series(1e5 + np.cumsum(rng.normal(0.0, 1.0, n)), name="a",
+                       index=pd.date_range("2000-01-01", periods=n, freq="min"))
+    collector = CustomCollector({"feat_params": {"function_list": ["slope", "intercept", "r2", "cen_std"],
+                                                 "windows": [5, 60]}})
+    expected = FeatureEngineer(prices.to_frame(), clipper=None, scaler=None).get_data(
+        "a", collector, start_date=prices.index[100], original=True).feature_matrix
+
+    result = _stream(StreamingFeatureEngine(collector), prices, 100)
+
+    assert_frame_equal(result.iloc[-1000:], expected.iloc[-1000:], check_freq=False, check_names=False,
+                       check_dtype=False, rtol=1e-9, atol=1e-9)
+
+
+def test_streaming_from_prices_matches_returns(series):
+    prices = (1.0 + series.fillna(0.0)).cumprod() * 100.0
+    collector = HalfLifeCollector({"halflives": [4]})
+    engine = StreamingFeatureEngine(collector, from_prices=True)
+    engine.warm_up(prices.iloc[:30])
+
+    rows = engine.update_bar(prices.index[30], {"a": prices.iloc[30]})
+
+    expected = collector.collect(prices.pct_change(fill_method=None).iloc[1:31]).iloc[-1]
+    np.testing.assert_allclose(rows["a"].to_numpy(), expected.to_numpy(), rtol=1e-9)
+    assert engine.update("b", prices.index[0], 1.0) is None
+
+
+def test_streaming_rejects_unsupported_collectors():
+    engine = StreamingFeatureEngine(CustomCollector({"feat_params": {"function_list": ["unknown"]}}))
+    with pytest.raises(ValueError, match="Unsupported"):
+        engine.update("a", pd.Timestamp("2024-01-01"), 1.0)
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from reidfo.core.dtypes import float_dtype
 from reidfo.refo.xgboost import XGBoostModel
 
 
@@ -70,3 +71,15 @@ def test_non_datetime_index_raises():
     bad_labels = pd.Series(labels.values, index=range(len(labels)))
     with pytest.raises(ValueError):
         XGBoostModel(bad_feat, bad_labels)
+
+
+def test_float32_policy_and_int8_labels():
+    feat, labels = _make_data()
+    with float_dtype(np.float32):
+        model = XGBoostModel(feat, labels, seed=0)
+        model.fit()
+        preds = model.predict(feat.iloc[-10:].set_axis(feat.index[-10:] + pd.Timedelta(days=10)))
+
+    assert (model.feature_matrix.dtypes == np.float32).all()
+    assert model.labels.dtype == np.int8
+    assert preds.dtype == np.int8
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reidfo.reid.batch import fit_regimes_batch
+from reidfo.reid.jump_model import StatisticalJumpModel
+
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(24)
+    idx = pd.date_range("2024-01-01", periods=200, freq="D")
+    returns = pd.DataFrame({
+        asset: np.repeat(rng.choice([-0.03, 0.03], 4), 50) + rng.normal(0.0, 0.01, 200)
+        for asset in ["A", "B", "C"]
+    }, index=idx)
+    returns.iloc[:20, 2] = np.nan
+    features = pd.concat({
+        asset: pd.DataFrame({"ret": returns[asset], "absret": returns[asset].abs()})
+        for asset in returns.columns
+    }, axis=1)
+    return returns, features
+
+
+def test_labels_match_per_asset_models(panel):
+    returns, features = panel
+
+    labels, centers = fit_regimes_batch(returns, features, jump_penalty=0.01)
+
+    assert labels.dtypes.eq(np.int8).all() and labels.shape == returns.shape
+    assert centers.shape == (3, 2, 2)
+    assert (labels["C"].iloc[:20] == -1).all()
+    for i, asset in enumerate(returns.columns):
+        rows = returns[asset].notna()
+        model = StatisticalJumpModel(returns.loc[rows, asset], features.loc[rows, asset], jump_penalty=0.01)
+        model.fit()
+        np.testing.assert_array_equal(labels.loc[rows, asset], model.get_training_labels())
+        np.testing.assert_allclose(centers[i], model.jm.centers_)
+
+
+def test_parallel_native_backend_matches_serial(panel):
+    returns, features = panel
+
+    serial = fit_regimes_batch(returns, features, jump_penalty=0.01, backend="native")
+    parallel = fit_regimes_batch(returns, features[["C", "A", "B"]], jump_penalty=0.01, backend="native", n_jobs=2)
+
+    pd.testing.assert_frame_equal(serial[0], fit_regimes_batch(returns, features, jump_penalty=0.01)[0])
+    pd.testing.assert_frame_equal(parallel[0], serial[0])
+    np.testing.assert_allclose(parallel[1], serial[1])
+
+
+def test_validation(panel):
+    returns, features = panel
+    with pytest.raises(ValueError, match="same features"):
+        fit_regimes_batch(returns, features.drop(columns=[("B", "absret")]))
+    with pytest.raises(ValueError, match="same assets"):
+        fit_regimes_batch(returns[["A", "B"]], features)
+    with pytest.raises(ValueError, match="MultiIndex"):
+        fit_regimes_batch(returns, features["A"])
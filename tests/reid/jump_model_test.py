@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from reidfo.core.dtypes import float_dtype
 from reidfo.reid.jump_model import StatisticalJumpModel
 
 
@@ -63,3 +64,31 @@ def test_index_mismatch_raises():
     misaligned = series.iloc[1:]
     with pytest.raises(ValueError, match="Index mismatch"):
         StatisticalJumpModel(misaligned, feat, n_regimes=2, seed=42)
+
+
+def test_float32_policy_and_int8_labels():
+    series, feat = _make_two_regime_data()
+    with float_dtype(np.float32):
+        model = StatisticalJumpModel(series, feat, n_regimes=2, jump_penalty=0.0, seed=42)
+        model.fit()
+
+    assert (model.feature_matrix.dtypes == np.float32).all()
+    assert model.time_series.dtype == np.float32
+    assert model.get_training_labels().dtype == np.int8
+    assert model.get_training_labels().nunique() == 2
+
+
+@pytest.mark.parametrize("backend", ["jumpmodels", "native"])
+def test_warm_fit_starts_from_init_centers_alone(backend):
+    series, feat = _make_two_regime_data()
+    cold = StatisticalJumpModel(series, feat, n_regimes=2, jump_penalty=0.01, seed=42, backend=backend)
+    cold.fit()
+
+    warm = StatisticalJumpModel(series, feat, n_regimes=2, jump_penalty=0.01, seed=42, backend=backend)
+    warm.fit(init_centers=cold.centers_)
+
+    assert warm.jm.n_init == 0
+    assert warm.jm.val_ == pytest.approx(cold.jm.val_)
+    pd.testing.assert_series_equal(warm.get_training_labels(), cold.get_training_labels())
+    with pytest.raises(ValueError, match="init_centers must have shape"):
+        warm.fit(init_centers=cold.centers_[:1])
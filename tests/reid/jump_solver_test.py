@@ -0,0 +1,108 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from jumpmodels.jump import JumpModel, dp
+
+from reidfo.reid.jump_model import StatisticalJumpModel
+from reidfo.reid.jump_solver import JumpSolver, loss_matrix, penalty_matrix, viterbi
+
+
+def _make_regime_data(n: int = 400, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=n, freq="D")
+    returns = np.repeat(rng.choice([-0.02, 0.02], 8), n // 8) + rng.normal(0.0, 0.02, n)
+    smooth = pd.Series(returns).rolling(10, min_periods=1).mean().to_numpy()
+    feat = pd.DataFrame({"ret": returns, "smooth": smooth, "absret": np.abs(returns)}, index=idx)
+    return pd.Series(returns, index=idx), feat
+
+
+def test_viterbi_matches_brute_force_for_every_batch_member():
+    rng = np.random.default_rng(3)
+    loss = rng.random((4, 6, 3))
+    penalty = penalty_matrix(0.4, 3)
+
+    labels, objective = viterbi(loss, penalty)
+
+    for b in range(4):
+        costs = {
+            path: loss[b, np.arange(6), path].sum() + penalty[path[:-1], path[1:]].sum()
+            for path in itertools.product(range(3), repeat=6)
+        }
+        best = min(costs, key=costs.get)
+        assert objective[b] == pytest.approx(costs[best])
+        assert tuple(labels[b]) == best
+
+
+def test_loss_and_dp_match_jumpmodels():
+    rng = np.random.default_rng(4)
+    X, centers = rng.normal(size=(50, 3)), rng.normal(size=(2, 3))
+    penalty = penalty_matrix(0.7, 2)
+
+    labels, objective = viterbi(loss_matrix(X, centers[None]), penalty)
+
+    expected_labels, expected_objective = dp(0.5 * ((X[:, None] - centers) ** 2).sum(axis=-1), penalty)
+    np.testing.assert_array_equal(labels[0], expected_labels)
+    assert objective[0] == pytest.approx(expected_objective)
+
+
+@pytest.mark.parametrize("jump_penalty", [0.0, 0.01, 0.1])
+def test_fit_reaches_jumpmodels_solution(jump_penalty):
+    series, feat = _make_regime_data()
+
+    solver = JumpSolver(2, jump_penalty=jump_penalty, random_state=1).fit(feat, series)
+    reference = JumpModel(2, jump_penalty=jump_penalty, random_state=1).fit(feat, series)
+
+    assert solver.val_ == pytest.approx(reference.val_)
+    pd.testing.assert_series_equal(solver.labels_, reference.labels_, check_dtype=False, check_names=False)
+    np.testing.assert_allclose(solver.centers_, reference.centers_)
+    pd.testing.assert_series_equal(solver.predict_online(feat), reference.predict_online(feat),
+                                   check_dtype=False, check_names=False)
+
+
+@pytest.mark.parametrize("n_regimes", [3, 4])
+@pytest.mark.parametrize("jump_penalty", [0.0, 5.0, 50.0])
+def test_objective_is_not_worse_than_jumpmodels_with_several_regimes(n_regimes, jump_penalty):
+    rng = np.random.default_rng(n_regimes)
+    means = rng.normal(0.0, 3.0, (n_regimes, 2))
+    X = means[np.repeat(rng.integers(0, n_regimes, 30), 20)] + rng.normal(0.0, 1.5, (600, 2))
+    returns = rng.normal(0.0, 1.0, 600)
+
+    solver = JumpSolver(n_regimes, jump_penalty=jump_penalty, random_state=7).fit(X, returns)
+    reference = JumpModel(n_regimes, jump_penalty=jump_penalty, random_state=7).fit(X, returns)
+
+    assert solver.val_ <= reference.val_ * (1 + 1e-12)
+    np.testing.assert_array_equal(solver.labels_, reference.labels_)
+
+
+def test_fit_sorts_regimes_and_uses_previous_centers():
+    series, feat = _make_regime_data()
+    solver = JumpSolver(2, jump_penalty=0.01, random_state=1).fit(feat, series, sort_by="ret")
+    means = series.groupby(solver.labels_).mean()
+    assert means.is_monotonic_decreasing
+
+    # The previous centers are already a fixed point, so one iteration recovers the solution.
+    warm = JumpSolver(2, jump_penalty=0.01, random_state=2, n_init=1, max_iter=1)
+    warm.centers_ = solver.centers_
+    warm.fit(feat, series, sort_by="ret")
+    assert warm.val_ == pytest.approx(solver.val_)
+
+
+def test_statistical_jump_model_native_backend():
+    series, feat = _make_regime_data()
+    train, test = slice(0, 300), slice(300, None)
+    native = StatisticalJumpModel(series.iloc[train], feat.iloc[train], jump_penalty=0.01, backend="native")
+    reference = StatisticalJumpModel(series.iloc[train], feat.iloc[train], jump_penalty=0.01)
+    native.fit()
+    reference.fit()
+
+    assert isinstance(native.jm, JumpSolver)
+    assert native.get_training_labels().dtype == np.int8
+    pd.testing.assert_series_equal(native.get_training_labels(), reference.get_training_labels())
+    pd.testing.assert_series_equal(native.predict(feat.iloc[test]), reference.predict(feat.iloc[test]))
+
+    with pytest.raises(ValueError, match="only supports discrete"):
+        StatisticalJumpModel(series, feat, cont=True, backend="native")
+    with pytest.raises(ValueError, match="backend must be one of"):
+        StatisticalJumpModel(series, feat, backend="numba")
@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reidfo.reid.jump_model import StatisticalJumpModel
+from reidfo.reid.online import OnlineRegimeFilter
+
+
+def _make_regime_data(n: int = 300, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=n, freq="D")
+    returns = np.repeat(rng.choice([-0.02, 0.02], 6), n // 6) + rng.normal(0.0, 0.02, n)
+    feat = pd.DataFrame({"ret": returns, "absret": np.abs(returns)}, index=idx)
+    return pd.Series(returns, index=idx), feat
+
+
+@pytest.fixture(params=["jumpmodels", "native"])
+def fitted(request):
+    series, feat = _make_regime_data()
+    model = StatisticalJumpModel(series.iloc[:200], feat.iloc[:200], jump_penalty=0.02, backend=request.param)
+    model.fit()
+    return model, feat.iloc[200:]
+
+
+def test_streaming_matches_predict(fitted):
+    model, new = fitted
+    online = OnlineRegimeFilter.from_model(model)
+
+    labels = [online.update(row) for _, row in new.iterrows()]
+
+    np.testing.assert_array_equal(labels, model.predict(new).to_numpy())
+    assert online.n_seen == len(new) and online.label == labels[-1]
+
+
+def test_snapshot_restore_resumes_stream(fitted):
+    model, new = fitted
+    online = OnlineRegimeFilter.from_model(model)
+    online.update_many(new.iloc[:40])
+
+    restored = OnlineRegimeFilter.restore(json.loads(json.dumps(online.snapshot())))
+
+    pd.testing.assert_series_equal(restored.update_many(new.iloc[40:]), online.update_many(new.iloc[40:]))
+    assert restored.n_seen == online.n_seen == len(new)
+
+
+def test_rows_are_ordered_by_feature_name(fitted):
+    model, new = fitted
+    online = OnlineRegimeFilter.from_model(model)
+    reordered = OnlineRegimeFilter.from_model(model)
+
+    expected = online.update_many(new)
+    result = reordered.update_many(new[["absret", "ret"]])
+
+    pd.testing.assert_series_equal(result, expected)
+    assert expected.dtype == np.int8
+    with pytest.raises(ValueError, match="NaNs"):
+        online.update({"ret": np.nan, "absret": 0.0})
+    with pytest.raises(ValueError, match="2 values"):
+        online.update(np.zeros(3))
+
+
+def test_unfitted_model_raises():
+    series, feat = _make_regime_data()
+    with pytest.raises(ValueError, match="must be fitted"):
+        OnlineRegimeFilter.from_model(StatisticalJumpModel(series, feat))
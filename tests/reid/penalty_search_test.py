@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reidfo.reid.jump_model import StatisticalJumpModel
+from reidfo.reid.penalty_search import search_jump_penalty
+
+
+def _make_regime_data(n: int = 300, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=n, freq="D")
+    means = np.repeat([-0.02, 0.02, -0.02, 0.02], n // 4)
+    returns = means + rng.normal(0.0, 0.02, n)
+    feat = pd.DataFrame({"ret": returns, "smooth": pd.Series(returns).rolling(5, min_periods=1).mean().to_numpy()},
+                        index=idx)
+    return pd.Series(returns, index=idx), feat
+
+
+def test_table_covers_grid_and_switches_decrease_with_penalty():
+    series, feat = _make_regime_data()
+    penalties = [50.0, 0.0, 1e-4, 1e-3, 1e-2]
+
+    table, model = search_jump_penalty(series, feat, penalties, n_regimes=[2, 3], n_jobs=2, chain_length=3)
+
+    assert list(table.columns) == ["n_regimes", "jump_penalty", "objective", "loss", "n_switches", "criterion"]
+    assert table["n_regimes"].tolist() == [2] * 5 + [3] * 5
+    assert table["jump_penalty"].tolist() == sorted(penalties) * 2
+    for _, group in table.groupby("n_regimes"):
+        assert group["n_switches"].is_monotonic_decreasing
+        assert group["n_switches"].iloc[-1] == 0
+
+    best = table.loc[table["criterion"].idxmin()]
+    assert isinstance(model, StatisticalJumpModel)
+    assert (model.n_regimes, model.jump_penalty) == (best["n_regimes"], best["jump_penalty"])
+    assert model.jm.val_ == pytest.approx(best["objective"])
+
+
+def test_objective_matches_serial_fit():
+    series, feat = _make_regime_data()
+    table, _ = search_jump_penalty(series, feat, [0.0, 1e-3], n_jobs=1, chain_length=1)
+
+    for _, row in table.iterrows():
+        model = StatisticalJumpModel(series, feat, n_regimes=2, jump_penalty=row["jump_penalty"], seed=42)
+        model.fit()
+        assert row["objective"] <= model.jm.val_ + 1e-9
+
+
+def test_results_do_not_depend_on_worker_count():
+    series, feat = _make_regime_data()
+    penalties = [0.0, 1e-4, 1e-3, 1e-2, 1e-1]
+
+    serial, serial_model = search_jump_penalty(series, feat, penalties, n_regimes=[2, 3], n_jobs=1, chain_length=2)
+    parallel, parallel_model = search_jump_penalty(series, feat, penalties, n_regimes=[2, 3], n_jobs=2,
+                                                   chain_length=2)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    pd.testing.assert_series_equal(parallel_model.get_training_labels(), serial_model.get_training_labels())
+
+
+def test_custom_selection_and_validation():
+    series, feat = _make_regime_data()
+    table, model = search_jump_penalty(series, feat, [0.0, 1e-3], n_jobs=1,
+                                       select=lambda t: t["n_switches"].idxmax())
+    assert model.jump_penalty == 0.0
+
+    with pytest.raises(ValueError, match="non-negative"):
+        search_jump_penalty(series, feat, [-1.0])
+    with pytest.raises(ValueError, match="Index mismatch"):
+        search_jump_penalty(series.iloc[1:], feat, [0.0])
+    with pytest.raises(ValueError, match="chain_length"):
+        search_jump_penalty(series, feat, [0.0], chain_length=0)
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reidfo.reid.jump_model import StatisticalJumpModel
+from reidfo.reid.walk_forward import WalkForwardEngine
+
+
+def _make_regime_data(n: int = 240, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=n, freq="D")
+    returns = np.repeat([-0.05, 0.05, -0.05, 0.05], n // 4) + rng.normal(0.0, 0.005, n)
+    feat = pd.DataFrame({"ret": returns, "absret": np.abs(returns)}, index=idx)
+    return pd.Series(returns, index=idx), feat
+
+
+@pytest.fixture
+def engine() -> WalkForwardEngine:
+    series, feat = _make_regime_data()
+    return WalkForwardEngine(series, feat, model_params={"n_regimes": 2, "seed": 42}, freq="ME", min_train=60)
+
+
+def test_schedule_covers_out_of_sample_rows(engine):
+    schedule = engine.schedule
+
+    assert (schedule["train_end"] < schedule["test_start"]).all()
+    assert (schedule["train_start"] == engine.feature_matrix.index[0]).all()
+    assert (schedule["test_start"].dt.day == 1).all()
+
+
+def test_labels_match_independent_refits(engine):
+    labels = engine.run()
+
+    assert labels.dtype == np.int8
+    assert labels.index.equals(engine.feature_matrix.index[engine.folds[0][1].start:])
+    assert len(engine.centers) == len(engine.folds)
+    for train, test in engine.folds:
+        model = StatisticalJumpModel(engine.time_series.iloc[train], engine.feature_matrix.iloc[train],
+                                     n_regimes=2, seed=42)
+        model.fit()
+        expected = model.predict(engine.feature_matrix.iloc[test])
+        np.testing.assert_array_equal(labels.loc[expected.index], expected.to_numpy())
+
+
+def test_parallel_chains_match_serial_run():
+    series, feat = _make_regime_data()
+    engine = WalkForwardEngine(series, feat, model_params={"n_regimes": 2, "seed": 42}, freq="ME",
+                               min_train=60, chain_length=2)
+    serial = engine.run()
+    serial_centers = engine.centers
+
+    parallel = engine.run(n_jobs=2)
+
+    pd.testing.assert_series_equal(parallel, serial)
+    for expected, result in zip(serial_centers, engine.centers):
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_index_mismatch_raises():
+    series, feat = _make_regime_data()
+    with pytest.raises(ValueError, match="Index mismatch"):
+        WalkForwardEngine(series.iloc[1:], feat)
+    with pytest.raises(ValueError, match="lower min_train"):
+        WalkForwardEngine(series, feat, min_train=1000)
+    with pytest.raises(ValueError, match="chain_length"):
+        WalkForwardEngine(series, feat, min_train=60, chain_length=0)